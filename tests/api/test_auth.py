@@ -21,16 +21,16 @@ class TestAuthentication:
         description="""
         Проверка, что новый, только что зарегистрированный пользователь, может успешно войти в систему.
         Шаги:
-        1. Создание нового пользователя через фикстуру.
+        1. Регистрация нового пользователя через /register (фикстура).
         2. Попытка входа в систему с учетными данными этого пользователя.
         3. Проверка, что API возвращает токен доступа и корректные данные пользователя.
         """,
         severity=allure.severity_level.CRITICAL,
     )
-    def test_registered_user_can_login(self, new_registered_user):
+    def test_registered_user_can_login(self, self_registered_user):
         LOGGER.info("Запуск теста: test_registered_user_can_login")
         with allure.step("Получение данных нового зарегистрированного пользователя (через фикстуру)"):
-            api_manager, user_payload = new_registered_user
+            api_manager, user_payload = self_registered_user
             LOGGER.info(f"Тестовые данные для пользователя '{user_payload.email}' подготовлены фикстурой.")
 
         with allure.step("Попытка входа в систему с учетными данными нового пользователя"):
@@ -69,24 +69,19 @@ class TestRegistration:
         description="Проверка, что API регистрирует нового пользователя и возвращает его данные.",
         severity=allure.severity_level.CRITICAL,
     )
-    def test_register_user_success(self, api_manager, admin_api_manager, faker_instance):
+    def test_register_user_success(self, api_manager, cleanup_registry, faker_instance):
         LOGGER.info("Запуск теста: test_register_user_success")
         user_payload, password_repeat = UserDataGenerator.generate_user_payload(faker_instance)
         payload = user_payload.model_dump(by_alias=True)
         payload["passwordRepeat"] = password_repeat
-        user_id = None
-        try:
-            with allure.step("Отправка запроса на регистрацию нового пользователя"):
-                response = api_manager.auth_api.register(user_data=payload, expected_status=201)
-            is_user = isinstance(response, User)
-            check.is_true(is_user, f"Ожидался объект User, но получен {type(response)}")
-            if is_user:
-                user_id = response.id
-                check.equal(response.email, user_payload.email)
-                check.equal(response.full_name, user_payload.full_name)
-        finally:
-            if user_id:
-                admin_api_manager.users_api.delete_user(user_id, expected_status=200)
+        with allure.step("Отправка запроса на регистрацию нового пользователя"):
+            response = api_manager.auth_api.register(user_data=payload, expected_status=201)
+        is_user = isinstance(response, User)
+        check.is_true(is_user, f"Ожидался объект User, но получен {type(response)}")
+        if is_user:
+            cleanup_registry.register_user(response.id)
+            check.equal(response.email, user_payload.email)
+            check.equal(response.full_name, user_payload.full_name)
 
 
 @allure.epic("Аутентификация")
@@ -98,10 +93,10 @@ class TestSession:
         description="Проверка, что refresh-токен обновляется для авторизованного пользователя.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_refresh_tokens(self, admin_api_manager):
+    def test_refresh_tokens(self, fresh_admin_api_manager):
         LOGGER.info("Запуск теста: test_refresh_tokens")
         with allure.step("Запрос обновления токенов"):
-            response = admin_api_manager.auth_api.refresh_token(expected_status=200)
+            response = fresh_admin_api_manager.auth_api.refresh_token(expected_status=200)
         check.is_true(isinstance(response, dict), "Ожидался ответ в виде словаря")
 
     @allure_test_details(
@@ -110,10 +105,10 @@ def test_refresh_tokens(self, admin_api_manager):
         description="Проверка, что logout возвращает успешный ответ.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_logout(self, admin_api_manager):
+    def test_logout(self, fresh_admin_api_manager):
         LOGGER.info("Запуск теста: test_logout")
         with allure.step("Запрос logout"):
-            response = admin_api_manager.auth_api.logout(expected_status=200)
+            response = fresh_admin_api_manager.auth_api.logout(expected_status=200)
         check.is_true(isinstance(response, dict), "Ожидался ответ в виде словаря")
 
     @allure_test_details(
@@ -25,39 +25,31 @@ class TestCreateMovie:
         1. Отправка POST-запроса на создание фильма с корректными данными.
         2. Проверка, что API возвращает статус 201 и данные созданного фильма.
         3. Сравнение данных в ответе с отправленными данными.
-        4. Очистка: удаление созданного фильма после теста.
+        4. Регистрация созданного фильма для удаления в конце сессии.
         """,
         severity=allure.severity_level.CRITICAL,
     )
-    def test_create_movie_success(self, admin_api_manager, movie_payload):
+    def test_create_movie_success(self, admin_api_manager, cleanup_registry, movie_payload):
         LOGGER.info("Запуск теста: test_create_movie_success")
-        movie_id = None
-        try:
-            with allure.step("Отправка запроса на создание нового фильма"):
-                LOGGER.info(LogMessages.Movies.ATTEMPT_CREATE.format(movie_payload.name))
-                response = admin_api_manager.movies_api.create_movie(movie_data=movie_payload, expected_status=201)
-                is_movie = isinstance(response, Movie)
-                check.is_true(is_movie, f"Ожидался объект фильма, но получен {type(response)}")
-                if is_movie:
-                    created_movie = response
-                    movie_id = created_movie.id
-                    LOGGER.info(LogMessages.Movies.CREATE_SUCCESS.format(created_movie.name, movie_id))
+        with allure.step("Отправка запроса на создание нового фильма"):
+            LOGGER.info(LogMessages.Movies.ATTEMPT_CREATE.format(movie_payload.name))
+            response = admin_api_manager.movies_api.create_movie(movie_data=movie_payload, expected_status=201)
+            is_movie = isinstance(response, Movie)
+            check.is_true(is_movie, f"Ожидался объект фильма, но получен {type(response)}")
+            if is_movie:
+                created_movie = response
+                movie_id = created_movie.id
+                cleanup_registry.register_movie(movie_id)
+                LOGGER.info(LogMessages.Movies.CREATE_SUCCESS.format(created_movie.name, movie_id))
 
-                    with allure.step("Проверка данных созданного фильма в ответе"):
-                        check.is_not_none(movie_id, "ID созданного фильма не должен быть пустым")
-                        check.equal(created_movie.name, movie_payload.name)
-                        check.equal(created_movie.description, movie_payload.description)
-                        check.equal(created_movie.price, movie_payload.price)
-                        check.equal(created_movie.location.value, movie_payload.location.value)
-                        check.equal(created_movie.genre_id, movie_payload.genre_id)
-                        check.equal(created_movie.published, movie_payload.published)
-
-        finally:
-            if movie_id:
-                with allure.step("Очистка: удаление созданного фильма"):
-                    LOGGER.info(f"Очистка: попытка удалить фильм с ID {movie_id}")
-                    admin_api_manager.movies_api.delete_movie(movie_id, expected_status=200)
-                    LOGGER.info(f"Очистка: фильм с ID {movie_id} успешно удален")
+                with allure.step("Проверка данных созданного фильма в ответе"):
+                    check.is_not_none(movie_id, "ID созданного фильма не должен быть пустым")
+                    check.equal(created_movie.name, movie_payload.name)
+                    check.equal(created_movie.description, movie_payload.description)
+                    check.equal(created_movie.price, movie_payload.price)
+                    check.equal(created_movie.location.value, movie_payload.location.value)
+                    check.equal(created_movie.genre_id, movie_payload.genre_id)
+                    check.equal(created_movie.published, movie_payload.published)
 
     @allure_test_details(
         story="Попытка создания фильма неавторизованным пользователем",
@@ -87,10 +79,10 @@ def test_create_movie_unauthorized(self, api_manager, movie_payload):
         description="Этот тест проверяет, что система возвращает ошибку 409 Conflict при попытке создать фильм с уже существующим названием.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_create_movie_conflict_duplicate_name(self, admin_api_manager, created_movie, movie_payload):
+    def test_create_movie_conflict_duplicate_name(self, admin_api_manager, shared_movie, movie_payload):
         LOGGER.info("Запуск теста: test_create_movie_conflict_duplicate_name")
         with allure.step("Подготовка данных: использование названия уже существующего фильма"):
-            movie_payload.name = created_movie.name
+            movie_payload.name = shared_movie.name
         with allure.step("Попытка создания фильма с дублирующимся названием"):
             LOGGER.info(f"Попытка создания фильма с дублирующимся названием: '{movie_payload.name}'")
             response = admin_api_manager.movies_api.create_movie(movie_data=movie_payload, expected_status=409)
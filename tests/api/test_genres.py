@@ -21,7 +21,7 @@ class TestGenres:
     def test_get_genres_list(self, api_manager):
         LOGGER.info("Запуск теста: test_get_genres_list")
         with allure.step("Запрос списка жанров"):
-            response = api_manager.movies_api.get_genres(expected_status=200)
+            response = api_manager.movies_api.get_genres(expected_status=200, use_cache=False)
         check.is_true(isinstance(response, list), f"Ожидался список жанров, но получен {type(response)}")
         if isinstance(response, list) and response:
             check.is_true(isinstance(response[0], GenreResponse))
@@ -39,7 +39,7 @@ def test_get_genre_by_id(self, api_manager):
         genre_id = genres[0].id
 
         with allure.step("Запрос жанра по ID"):
-            response = api_manager.movies_api.get_genre_by_id(genre_id, expected_status=200)
+            response = api_manager.movies_api.get_genre_by_id(genre_id, expected_status=200, use_cache=False)
         check.is_true(
             isinstance(response, GenreResponse), f"Ожидался объект GenreResponse, но получен {type(response)}"
         )
@@ -52,16 +52,15 @@ def test_get_genre_by_id(self, api_manager):
         description="Проверка, что администратор может создать и удалить жанр.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_create_and_delete_genre(self, admin_api_manager, faker_instance):
+    def test_create_and_delete_genre(self, admin_api_manager, cleanup_registry, faker_instance):
         LOGGER.info("Запуск теста: test_create_and_delete_genre")
-        genre_id = None
         payload = {"name": f"Genre {faker_instance.unique.word()}"}
-        try:
-            with allure.step("Создание жанра"):
-                created_genre = admin_api_manager.movies_api.create_genre(payload, expected_status=201)
-            check.is_true(isinstance(created_genre, GenreResponse))
-            if isinstance(created_genre, GenreResponse):
-                genre_id = created_genre.id
-        finally:
-            if genre_id:
-                admin_api_manager.movies_api.delete_genre(genre_id, expected_status=200)
+        with allure.step("Создание жанра"):
+            created_genre = admin_api_manager.movies_api.create_genre(payload, expected_status=201)
+        assert isinstance(created_genre, GenreResponse), (
+            f"Ожидался объект GenreResponse, но получен {type(created_genre)}"
+        )
+        cleanup_registry.register_genre(created_genre.id)
+
+        with allure.step("Удаление жанра"):
+            admin_api_manager.movies_api.delete_genre(created_genre.id, expected_status=200)
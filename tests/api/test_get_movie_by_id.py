@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import allure
@@ -8,6 +9,7 @@
 from tests.constants.log_messages import LogMessages
 from tests.models.movie_models import MovieWithReviews
 from tests.models.response_models import ErrorResponse
+from tests.request.async_requester import gather_limited
 from tests.utils.decorators import allure_test_details
 
 LOGGER = logging.getLogger(__name__)
@@ -22,15 +24,15 @@ class TestGetMovieById:
         description="""
         Проверка, что можно успешно получить данные существующего фильма по его ID.
         Шаги:
-        1. Создание фильма через фикстуру.
+        1. Получение общего фильма из пула через фикстуру.
         2. Отправка GET-запроса с ID созданного фильма.
         3. Проверка, что API возвращает статус 200 и корректные данные фильма.
         4. Сравнение всех полей полученного фильма с данными изначального.
         """,
         severity=allure.severity_level.CRITICAL,
     )
-    def test_get_existing_movie_by_id(self, admin_api_manager, created_movie):
-        movie_id = created_movie.id
+    def test_get_existing_movie_by_id(self, admin_api_manager, shared_movie):
+        movie_id = shared_movie.id
         LOGGER.info(f"Запуск теста: test_get_existing_movie_by_id для ID {movie_id}")
         with allure.step(f"Отправка запроса на получение фильма с ID: {movie_id}"):
             LOGGER.info(LogMessages.Movies.ATTEMPT_GET_BY_ID.format(movie_id))
@@ -41,16 +43,46 @@ def test_get_existing_movie_by_id(self, admin_api_manager, created_movie):
             check.is_true(is_movie, f"Ожидался объект MovieWithReviews, но получен {type(fetched_movie_response)}")
             if is_movie:
                 LOGGER.info(LogMessages.Movies.GET_BY_ID_SUCCESS.format(fetched_movie_response.name, movie_id))
-                check.equal(fetched_movie_response.id, created_movie.id)
-                check.equal(fetched_movie_response.name, created_movie.name)
-                check.equal(fetched_movie_response.description, created_movie.description)
-                check.equal(fetched_movie_response.price, created_movie.price)
-                check.equal(fetched_movie_response.location, created_movie.location)
-                check.equal(fetched_movie_response.genre_id, created_movie.genre_id)
-                check.is_true(fetched_movie_response.published == created_movie.published)
+                check.equal(fetched_movie_response.id, shared_movie.id)
+                check.equal(fetched_movie_response.name, shared_movie.name)
+                check.equal(fetched_movie_response.description, shared_movie.description)
+                check.equal(fetched_movie_response.price, shared_movie.price)
+                check.equal(fetched_movie_response.location, shared_movie.location)
+                check.equal(fetched_movie_response.genre_id, shared_movie.genre_id)
+                check.is_true(fetched_movie_response.published == shared_movie.published)
                 check.equal(fetched_movie_response.reviews, [], "У нового фильма не должно быть отзывов")
                 LOGGER.info(f"Все поля для фильма ID {movie_id} успешно проверены.")
 
+    @allure_test_details(
+        story="Успешное получение фильма по ID",
+        title="Тест параллельного получения одного фильма асинхронным клиентом",
+        description="""
+        Проверка, что параллельные запросы одного фильма через асинхронный клиент возвращают одинаковые данные.
+        Шаги:
+        1. Получение общего фильма из пула через фикстуру.
+        2. Параллельная отправка нескольких GET-запросов с ID фильма без кэша клиента.
+        3. Проверка, что все ответы содержат данные изначального фильма.
+        """,
+        severity=allure.severity_level.NORMAL,
+    )
+    def test_get_movie_by_id_concurrently(self, async_admin_api_manager, shared_movie):
+        movie_id = shared_movie.id
+        LOGGER.info(f"Запуск теста: test_get_movie_by_id_concurrently для ID {movie_id}")
+        with allure.step(f"Параллельное получение фильма с ID: {movie_id}"):
+            responses = asyncio.run(
+                gather_limited(
+                    async_admin_api_manager.movies_api.get_movie_by_id(movie_id, expected_status=200, use_cache=False)
+                    for _ in range(4)
+                )
+            )
+
+        with allure.step("Проверка, что все ответы содержат данные фильма"):
+            for response in responses:
+                is_movie = isinstance(response, MovieWithReviews)
+                check.is_true(is_movie, f"Ожидался объект MovieWithReviews, но получен {type(response)}")
+                if is_movie:
+                    check.equal(response.model_dump(exclude={"reviews"}), shared_movie.model_dump())
+
     @allure_test_details(
         story="Попытка получения несуществующего фильма",
         title="Тест ошибки получения фильма с несуществующим ID",
@@ -89,34 +89,28 @@ def test_get_movies_price_filter(self, api_manager):
         description="Этот тест проверяет, что фильтр по `locations` работает корректно.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_get_movies_location_filter(self, admin_api_manager, movie_payload):
+    def test_get_movies_location_filter(self, admin_api_manager, cleanup_registry, movie_payload):
         LOGGER.info("Запуск теста: test_get_movies_location_filter")
-        movie_id = None
-        try:
-            with allure.step("Подготовка: создание фильма с локацией 'MSK'"):
-                movie_payload.location = Location.MSK
-                created_movie_response = admin_api_manager.movies_api.create_movie(movie_payload)
-                is_movie = isinstance(created_movie_response, Movie)
-                check.is_true(is_movie, f"Ожидался объект Movie, но получен {type(created_movie_response)}")
-                if not is_movie:
-                    pytest.fail("Не удалось создать фильм для теста.")
-                movie_id = created_movie_response.id
+        with allure.step("Подготовка: создание фильма с локацией 'MSK'"):
+            movie_payload.location = Location.MSK
+            created_movie_response = admin_api_manager.movies_api.create_movie(movie_payload)
+            is_movie = isinstance(created_movie_response, Movie)
+            check.is_true(is_movie, f"Ожидался объект Movie, но получен {type(created_movie_response)}")
+            if not is_movie:
+                pytest.fail("Не удалось создать фильм для теста.")
+            cleanup_registry.register_movie(created_movie_response.id)
 
-            params = {"locations": ["MSK"]}
-            with allure.step(f"Отправка GET-запроса с фильтром по локации: {params}"):
-                LOGGER.info(LogMessages.Movies.ATTEMPT_GET_LIST.format(params))
-                response = admin_api_manager.movies_api.get_movies(params=params)
-            is_list = isinstance(response, MoviesList)
-            check.is_true(is_list, f"Ожидался объект MoviesList, но получен {type(response)}")
-            if is_list:
-                with allure.step("Проверка, что все полученные фильмы имеют локацию 'MSK'"):
-                    check.is_true(len(response.movies) > 0, "Должен найтись хотя бы один фильм с локацией MSK")
-                    for movie in response.movies:
-                        check.equal(movie.location.value, "MSK")
-        finally:
-            if movie_id:
-                with allure.step(f"Очистка: удаление тестового фильма с ID {movie_id}"):
-                    admin_api_manager.movies_api.delete_movie(movie_id)
+        params = {"locations": ["MSK"]}
+        with allure.step(f"Отправка GET-запроса с фильтром по локации: {params}"):
+            LOGGER.info(LogMessages.Movies.ATTEMPT_GET_LIST.format(params))
+            response = admin_api_manager.movies_api.get_movies(params=params)
+        is_list = isinstance(response, MoviesList)
+        check.is_true(is_list, f"Ожидался объект MoviesList, но получен {type(response)}")
+        if is_list:
+            with allure.step("Проверка, что все полученные фильмы имеют локацию 'MSK'"):
+                check.is_true(len(response.movies) > 0, "Должен найтись хотя бы один фильм с локацией MSK")
+                for movie in response.movies:
+                    check.equal(movie.location.value, "MSK")
 
     @allure_test_details(
         story="Фильтрация",
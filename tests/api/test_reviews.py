@@ -31,7 +31,7 @@ def test_get_reviews(self, api_manager, created_movie: Movie):
         description="Проверка, что пользователь может создать отзыв к фильму.",
         severity=allure.severity_level.CRITICAL,
     )
-    def test_create_review_success(self, new_registered_user, created_movie: Movie):
+    def test_create_review_success(self, new_registered_user, cleanup_registry, created_movie: Movie):
         LOGGER.info("Запуск теста: test_create_review_success")
         api_manager, user_payload = new_registered_user
         api_manager.auth_api.login(email=user_payload.email, password=user_payload.password, expected_status=200)
@@ -39,6 +39,7 @@ def test_create_review_success(self, new_registered_user, created_movie: Movie):
 
         with allure.step("Создание отзыва"):
             response = api_manager.movies_api.create_review(created_movie.id, payload, expected_status=201)
+        cleanup_registry.register_review(created_movie.id, api_manager)
 
         reviews = response if isinstance(response, list) else [response]
         matches = [review for review in reviews if isinstance(review, Review) and review.text == payload["text"]]
@@ -50,12 +51,13 @@ def test_create_review_success(self, new_registered_user, created_movie: Movie):
         description="Проверка, что повторное создание отзыва возвращает ошибку 409.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_create_review_conflict(self, new_registered_user, created_movie: Movie):
+    def test_create_review_conflict(self, new_registered_user, cleanup_registry, created_movie: Movie):
         LOGGER.info("Запуск теста: test_create_review_conflict")
         api_manager, user_payload = new_registered_user
         api_manager.auth_api.login(email=user_payload.email, password=user_payload.password, expected_status=200)
         payload = {"rating": 4, "text": "Хороший фильм"}
         api_manager.movies_api.create_review(created_movie.id, payload, expected_status=201)
+        cleanup_registry.register_review(created_movie.id, api_manager)
 
         with allure.step("Попытка создать повторный отзыв"):
             response = api_manager.movies_api.create_review(created_movie.id, payload, expected_status=409)
@@ -69,11 +71,12 @@ def test_create_review_conflict(self, new_registered_user, created_movie: Movie)
         description="Проверка, что пользователь может отредактировать свой отзыв.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_edit_review_success(self, new_registered_user, created_movie: Movie):
+    def test_edit_review_success(self, new_registered_user, cleanup_registry, created_movie: Movie):
         LOGGER.info("Запуск теста: test_edit_review_success")
         api_manager, user_payload = new_registered_user
         api_manager.auth_api.login(email=user_payload.email, password=user_payload.password, expected_status=200)
         api_manager.movies_api.create_review(created_movie.id, {"rating": 5, "text": "Исходный текст"})
+        cleanup_registry.register_review(created_movie.id, api_manager)
         payload = {"rating": 3, "text": "Обновленный текст"}
 
         with allure.step("Редактирование отзыва"):
@@ -88,11 +91,12 @@ def test_edit_review_success(self, new_registered_user, created_movie: Movie):
         description="Проверка, что пользователь может удалить свой отзыв.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_delete_review_success(self, new_registered_user, created_movie: Movie):
+    def test_delete_review_success(self, new_registered_user, cleanup_registry, created_movie: Movie):
         LOGGER.info("Запуск теста: test_delete_review_success")
         api_manager, user_payload = new_registered_user
         api_manager.auth_api.login(email=user_payload.email, password=user_payload.password, expected_status=200)
         api_manager.movies_api.create_review(created_movie.id, {"rating": 4, "text": "Будет удален"})
+        cleanup_registry.register_review(created_movie.id, api_manager)
 
         with allure.step("Удаление отзыва"):
             response = api_manager.movies_api.delete_review(created_movie.id, expected_status=200)
@@ -105,7 +109,7 @@ def test_delete_review_success(self, new_registered_user, created_movie: Movie):
         description="Проверка, что администратор может скрыть и показать отзыв пользователя.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_hide_show_review(self, new_registered_user, admin_api_manager, created_movie: Movie):
+    def test_hide_show_review(self, new_registered_user, cleanup_registry, admin_api_manager, created_movie: Movie):
         LOGGER.info("Запуск теста: test_hide_show_review")
         api_manager, user_payload = new_registered_user
         login_response = api_manager.auth_api.login(
@@ -114,6 +118,7 @@ def test_hide_show_review(self, new_registered_user, admin_api_manager, created_
         assert isinstance(login_response, LoginResponse)
         user_id = login_response.user.id
         api_manager.movies_api.create_review(created_movie.id, {"rating": 5, "text": "Для модерации"})
+        cleanup_registry.register_review(created_movie.id, api_manager)
 
         with allure.step("Скрытие отзыва"):
             hidden_review = admin_api_manager.movies_api.hide_review(
@@ -20,26 +20,18 @@ class TestUsers:
         description="Проверка, что администратор может создать пользователя через API.",
         severity=allure.severity_level.CRITICAL,
     )
-    def test_admin_create_user(self, admin_api_manager, faker_instance):
+    def test_admin_create_user(self, admin_api_manager, cleanup_registry, faker_instance):
         LOGGER.info("Запуск теста: test_admin_create_user")
         user_payload, password = UserDataGenerator.generate_user_payload(faker_instance)
         payload = user_payload.model_dump(by_alias=True)
         payload.update({"password": password, "verified": True, "banned": False})
-        user_id = None
-        try:
-            with allure.step("Отправка запроса на создание пользователя"):
-                response = admin_api_manager.users_api.create_user(user_data=payload, expected_status=201)
-            is_user = isinstance(response, User)
-            check.is_true(is_user, f"Ожидался объект User, но получен {type(response)}")
-            if is_user:
-                user_id = response.id
-                check.equal(response.email, user_payload.email)
-        finally:
-            if user_id:
-                try:
-                    admin_api_manager.users_api.delete_user(user_id, expected_status=200)
-                except AssertionError:
-                    LOGGER.warning(f"Пользователь {user_id} уже удален, пропускаем cleanup")
+        with allure.step("Отправка запроса на создание пользователя"):
+            response = admin_api_manager.users_api.create_user(user_data=payload, expected_status=201)
+        is_user = isinstance(response, User)
+        check.is_true(is_user, f"Ожидался объект User, но получен {type(response)}")
+        if is_user:
+            cleanup_registry.register_user(response.id)
+            check.equal(response.email, user_payload.email)
 
     @allure_test_details(
         story="Получение пользователя",
@@ -47,27 +39,23 @@ def test_admin_create_user(self, admin_api_manager, faker_instance):
         description="Проверка, что администратор может получить пользователя по email.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_get_user_by_email(self, admin_api_manager, faker_instance):
+    def test_get_user_by_email(self, admin_api_manager, cleanup_registry, faker_instance):
         LOGGER.info("Запуск теста: test_get_user_by_email")
         user_payload, password = UserDataGenerator.generate_user_payload(faker_instance)
         payload = user_payload.model_dump(by_alias=True)
         payload.update({"password": password, "verified": True, "banned": False})
-        user_id = None
-        try:
-            with allure.step("Создание пользователя"):
-                created_user = admin_api_manager.users_api.create_user(user_data=payload, expected_status=201)
-            assert isinstance(created_user, User)
-            user_id = created_user.id
+        with allure.step("Создание пользователя"):
+            created_user = admin_api_manager.users_api.create_user(user_data=payload, expected_status=201)
+        assert isinstance(created_user, User)
+        user_id = created_user.id
+        cleanup_registry.register_user(user_id)
 
-            with allure.step("Запрос пользователя по email"):
-                fetched_user = admin_api_manager.users_api.get_user(user_payload.email, expected_status=200)
-            check.is_true(isinstance(fetched_user, User), f"Ожидался объект User, но получен {type(fetched_user)}")
-            if isinstance(fetched_user, User):
-                check.equal(fetched_user.id, user_id)
-                check.equal(fetched_user.email, user_payload.email)
-        finally:
-            if user_id:
-                admin_api_manager.users_api.delete_user(user_id, expected_status=200)
+        with allure.step("Запрос пользователя по email"):
+            fetched_user = admin_api_manager.users_api.get_user(user_payload.email, expected_status=200)
+        check.is_true(isinstance(fetched_user, User), f"Ожидался объект User, но получен {type(fetched_user)}")
+        if isinstance(fetched_user, User):
+            check.equal(fetched_user.id, user_id)
+            check.equal(fetched_user.email, user_payload.email)
 
     @allure_test_details(
         story="Список пользователей",
@@ -91,33 +79,24 @@ def test_get_users_list(self, admin_api_manager):
         description="Проверка, что пользователь может удалить свою учетную запись.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_user_can_delete_self(self, api_manager, admin_api_manager, faker_instance):
+    def test_user_can_delete_self(self, api_manager, cleanup_registry, faker_instance):
         LOGGER.info("Запуск теста: test_user_can_delete_self")
         user_payload, password_repeat = UserDataGenerator.generate_user_payload(faker_instance)
         payload = user_payload.model_dump(by_alias=True)
         payload["passwordRepeat"] = password_repeat
-        user_id = None
-        try:
-            with allure.step("Регистрация нового пользователя"):
-                registered_user = api_manager.auth_api.register(user_data=payload, expected_status=201)
-            assert isinstance(registered_user, User)
-            user_id = registered_user.id
+        with allure.step("Регистрация нового пользователя"):
+            registered_user = api_manager.auth_api.register(user_data=payload, expected_status=201)
+        assert isinstance(registered_user, User)
+        user_id = registered_user.id
+        cleanup_registry.register_user(user_id)
 
-            with allure.step("Логин пользователя"):
-                api_manager.auth_api.login(
-                    email=user_payload.email, password=user_payload.password, expected_status=200
-                )
+        with allure.step("Логин пользователя"):
+            api_manager.auth_api.login(email=user_payload.email, password=user_payload.password, expected_status=200)
 
-            with allure.step("Удаление пользователя своим токеном"):
-                deleted_user = api_manager.users_api.delete_user(user_id, expected_status=200)
-            if deleted_user:
-                check.is_true(isinstance(deleted_user, User), f"Ожидался объект User, но получен {type(deleted_user)}")
-        finally:
-            if user_id:
-                try:
-                    admin_api_manager.users_api.delete_user(user_id, expected_status=200)
-                except AssertionError:
-                    LOGGER.warning(f"Пользователь {user_id} уже удален, пропускаем cleanup")
+        with allure.step("Удаление пользователя своим токеном"):
+            deleted_user = api_manager.users_api.delete_user(user_id, expected_status=200)
+        if deleted_user:
+            check.is_true(isinstance(deleted_user, User), f"Ожидался объект User, но получен {type(deleted_user)}")
 
     @allure_test_details(
         story="Редактирование пользователя",
@@ -125,26 +104,22 @@ def test_user_can_delete_self(self, api_manager, admin_api_manager, faker_instan
         description="Проверка, что администратор может изменить данные пользователя.",
         severity=allure.severity_level.NORMAL,
     )
-    def test_admin_edit_user(self, admin_api_manager, faker_instance):
+    def test_admin_edit_user(self, admin_api_manager, cleanup_registry, faker_instance):
         LOGGER.info("Запуск теста: test_admin_edit_user")
         user_payload, password = UserDataGenerator.generate_user_payload(faker_instance)
         payload = user_payload.model_dump(by_alias=True)
         payload.update({"password": password, "verified": True, "banned": False})
-        user_id = None
-        try:
-            with allure.step("Создание пользователя"):
-                created_user = admin_api_manager.users_api.create_user(user_data=payload, expected_status=201)
-            assert isinstance(created_user, User)
-            user_id = created_user.id
+        with allure.step("Создание пользователя"):
+            created_user = admin_api_manager.users_api.create_user(user_data=payload, expected_status=201)
+        assert isinstance(created_user, User)
+        user_id = created_user.id
+        cleanup_registry.register_user(user_id)
 
-            edit_payload = {"roles": ["USER"], "verified": True, "banned": True}
-            with allure.step("Редактирование пользователя"):
-                edited_user = admin_api_manager.users_api.edit_user(
-                    user_id=user_id, user_data=edit_payload, expected_status=200
-                )
-            check.is_true(isinstance(edited_user, User), f"Ожидался объект User, но получен {type(edited_user)}")
-            if isinstance(edited_user, User):
-                check.is_true(edited_user.banned)
-        finally:
-            if user_id:
-                admin_api_manager.users_api.delete_user(user_id, expected_status=200)
+        edit_payload = {"roles": ["USER"], "verified": True, "banned": True}
+        with allure.step("Редактирование пользователя"):
+            edited_user = admin_api_manager.users_api.edit_user(
+                user_id=user_id, user_data=edit_payload, expected_status=200
+            )
+        check.is_true(isinstance(edited_user, User), f"Ожидался объект User, но получен {type(edited_user)}")
+        if isinstance(edited_user, User):
+            check.is_true(edited_user.banned)
@@ -1,8 +1,12 @@
+import requests
+
 from tests.clients.auth_api import AuthAPI
 from tests.clients.movies_api import MoviesAPI
 from tests.clients.payment_api import PaymentAPI
 from tests.clients.users_api import UsersAPI
 from tests.constants.endpoints import BASE_AUTH_URL, BASE_PAYMENT_URL, BASE_URL
+from tests.request.connection_pool import ConnectionPoolRegistry, connection_pools
+from tests.request.transport import Transport
 
 
 class ApiManager:
@@ -12,9 +16,39 @@ def __init__(
         base_url: str = BASE_URL,
         base_auth_url: str = BASE_AUTH_URL,
         base_payment_url: str = BASE_PAYMENT_URL,
+        transport: Transport | None = None,
     ):
         self.session = session
-        self.auth_api = AuthAPI(session, base_url=base_auth_url)
-        self.users_api = UsersAPI(session, base_url=base_auth_url)
-        self.movies_api = MoviesAPI(session, base_url=base_url)
-        self.payment_api = PaymentAPI(session, base_url=base_payment_url)
+        self.transport = transport
+        self.auth_api = AuthAPI(session, base_url=base_auth_url, transport=transport)
+        self.users_api = UsersAPI(session, base_url=base_auth_url, transport=transport)
+        self.movies_api = MoviesAPI(session, base_url=base_url, transport=transport)
+        self.payment_api = PaymentAPI(session, base_url=base_payment_url, transport=transport)
+
+
+class ApiManagerFactory:
+    def __init__(
+        self,
+        pools: ConnectionPoolRegistry = connection_pools,
+        base_url: str = BASE_URL,
+        base_auth_url: str = BASE_AUTH_URL,
+        base_payment_url: str = BASE_PAYMENT_URL,
+        transport: Transport | None = None,
+    ):
+        self.pools = pools
+        self.base_url = base_url
+        self.base_auth_url = base_auth_url
+        self.base_payment_url = base_payment_url
+        self.transport = transport
+
+    def create_session(self) -> requests.Session:
+        return self.pools.create_session(self.base_url, self.base_auth_url, self.base_payment_url)
+
+    def create(self, session: requests.Session | None = None) -> ApiManager:
+        return ApiManager(
+            session if session is not None else self.create_session(),
+            base_url=self.base_url,
+            base_auth_url=self.base_auth_url,
+            base_payment_url=self.base_payment_url,
+            transport=self.transport,
+        )
@@ -0,0 +1,81 @@
+import logging
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.request.session_headers import session_headers
+
+type ApiManagerBuilder = Callable[[requests.Session], ApiManager]
+
+
+class ApiManagerPool:
+    def __init__(
+        self,
+        builder: ApiManagerBuilder,
+        authenticate: Callable[[ApiManager], None],
+        size: int = 2,
+        session_factory: Callable[[], requests.Session] = requests.Session,
+    ):
+        self._builder = builder
+        self._session_factory = session_factory
+        self._authenticate = authenticate
+        self._size = size
+        self._idle: list[ApiManager] = []
+        self._baselines: dict[int, tuple[dict[str, str | bytes], requests.cookies.RequestsCookieJar]] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _new_manager(self) -> ApiManager:
+        manager = self._builder(self._session_factory())
+        self._baselines[id(manager)] = (dict(manager.session.headers), manager.session.cookies.copy())
+        return manager
+
+    def warm_up(self) -> None:
+        with self._lock:
+            while len(self._idle) < self._size:
+                manager = self._new_manager()
+                self._authenticate(manager)
+                self._idle.append(manager)
+        self.logger.info(f"Пул админских сессий прогрет: {self._size} шт.")
+
+    def acquire(self) -> ApiManager:
+        with self._lock:
+            manager = self._idle.pop() if self._idle else self._new_manager()
+        self._authenticate(manager)
+        return manager
+
+    def release(self, manager: ApiManager) -> None:
+        self._reset(manager)
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append(manager)
+                return
+        self._baselines.pop(id(manager), None)
+        manager.session.close()
+
+    @contextmanager
+    def lease(self) -> Generator[ApiManager]:
+        manager = self.acquire()
+        try:
+            yield manager
+        finally:
+            self.release(manager)
+
+    def _reset(self, manager: ApiManager) -> None:
+        baseline = self._baselines.get(id(manager))
+        if baseline is None:
+            return
+        headers, cookies = baseline
+        session_headers.update(manager.session, headers, replace=True)
+        manager.session.cookies.clear()
+        manager.session.cookies.update(cookies)
+
+    def close(self) -> None:
+        with self._lock:
+            managers, self._idle = self._idle, []
+            self._baselines.clear()
+        for manager in managers:
+            manager.session.close()
@@ -0,0 +1,33 @@
+from concurrent.futures import Executor
+from types import TracebackType
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.async_auth_api import AsyncAuthAPI
+from tests.clients.async_movies_api import AsyncMoviesAPI
+from tests.clients.async_payment_api import AsyncPaymentAPI
+from tests.clients.async_users_api import AsyncUsersAPI
+from tests.request.async_requester import create_http_executor
+
+
+class AsyncApiManager:
+    def __init__(self, manager: ApiManager, executor: Executor | None = None):
+        self.sync = manager
+        self.session = manager.session
+        self._owns_executor = executor is None
+        self.executor = executor or create_http_executor()
+        self.auth_api = AsyncAuthAPI(manager.auth_api, self.executor)
+        self.users_api = AsyncUsersAPI(manager.users_api, self.executor)
+        self.movies_api = AsyncMoviesAPI(manager.movies_api, self.executor)
+        self.payment_api = AsyncPaymentAPI(manager.payment_api, self.executor)
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncApiManager":
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
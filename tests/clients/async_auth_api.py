@@ -0,0 +1,35 @@
+from tests.clients.auth_api import (
+    AuthAPI,
+    ConfirmEmailApiResponse,
+    LoginApiResponse,
+    LogoutApiResponse,
+    RefreshTokenApiResponse,
+)
+from tests.models.response_models import ErrorResponse, LoginResponse
+from tests.models.user_models import User
+from tests.request.async_requester import AsyncCustomRequester
+
+
+class AsyncAuthAPI(AsyncCustomRequester[AuthAPI]):
+    async def login(
+        self,
+        email: str | None = None,
+        password: str | None = None,
+        expected_status: int = 200,
+    ) -> LoginApiResponse:
+        return await self._call(self.sync.login, email, password, expected_status)
+
+    async def authenticate(self, email: str | None = None, password: str | None = None) -> LoginResponse:
+        return await self._call(self.sync.authenticate, email, password)
+
+    async def register(self, user_data: dict, expected_status: int = 201) -> User | ErrorResponse:
+        return await self._call(self.sync.register, user_data, expected_status)
+
+    async def logout(self, expected_status: int = 200) -> LogoutApiResponse:
+        return await self._call(self.sync.logout, expected_status)
+
+    async def refresh_token(self, expected_status: int = 200) -> RefreshTokenApiResponse:
+        return await self._call(self.sync.refresh_token, expected_status)
+
+    async def confirm_email(self, token: str, expected_status: int = 200) -> ConfirmEmailApiResponse:
+        return await self._call(self.sync.confirm_email, token, expected_status)
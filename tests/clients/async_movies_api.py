@@ -0,0 +1,67 @@
+from tests.clients.movies_api import (
+    GenreResponseModel,
+    GenresResponse,
+    MovieResponse,
+    MoviesAPI,
+    ReviewsResponse,
+)
+from tests.models.movie_models import Movie, MovieWithReviews
+from tests.models.request_models import MovieCreate
+from tests.models.response_models import DeletedObject, ErrorResponse, MoviesList
+from tests.request.async_requester import AsyncCustomRequester
+
+
+class AsyncMoviesAPI(AsyncCustomRequester[MoviesAPI]):
+    async def create_movie(self, movie_data: MovieCreate | dict, *, expected_status: int = 201) -> MovieResponse:
+        return await self._call(self.sync.create_movie, movie_data, expected_status=expected_status)
+
+    async def get_movie_by_id(
+        self, movie_id: int | str, expected_status: int = 200, *, use_cache: bool = True
+    ) -> MovieWithReviews | ErrorResponse:
+        return await self._call(self.sync.get_movie_by_id, movie_id, expected_status, use_cache=use_cache)
+
+    async def delete_movie(
+        self, movie_id: int | str, expected_status: int | None = 200
+    ) -> DeletedObject | ErrorResponse:
+        return await self._call(self.sync.delete_movie, movie_id, expected_status)
+
+    async def get_movies(self, params: dict | None = None, *, expected_status: int = 200) -> MoviesList | ErrorResponse:
+        return await self._call(self.sync.get_movies, params, expected_status=expected_status)
+
+    async def get_movies_with_invalid_params(self, params: dict, expected_status: int = 400) -> ErrorResponse:
+        return await self._call(self.sync.get_movies_with_invalid_params, params, expected_status)
+
+    async def edit_movie(self, movie_id: int | str, payload: dict, expected_status: int = 200) -> Movie | ErrorResponse:
+        return await self._call(self.sync.edit_movie, movie_id, payload, expected_status)
+
+    async def get_reviews(self, movie_id: int | str, expected_status: int = 200) -> ReviewsResponse:
+        return await self._call(self.sync.get_reviews, movie_id, expected_status)
+
+    async def create_review(self, movie_id: int | str, payload: dict, expected_status: int = 201) -> ReviewsResponse:
+        return await self._call(self.sync.create_review, movie_id, payload, expected_status)
+
+    async def edit_review(self, movie_id: int | str, payload: dict, expected_status: int = 200) -> ReviewsResponse:
+        return await self._call(self.sync.edit_review, movie_id, payload, expected_status)
+
+    async def delete_review(self, movie_id: int | str, expected_status: int | None = 200) -> ReviewsResponse:
+        return await self._call(self.sync.delete_review, movie_id, expected_status)
+
+    async def hide_review(self, movie_id: int | str, user_id: str, expected_status: int = 200) -> ReviewsResponse:
+        return await self._call(self.sync.hide_review, movie_id, user_id, expected_status)
+
+    async def show_review(self, movie_id: int | str, user_id: str, expected_status: int = 200) -> ReviewsResponse:
+        return await self._call(self.sync.show_review, movie_id, user_id, expected_status)
+
+    async def get_genres(self, expected_status: int = 200, *, use_cache: bool = True) -> GenresResponse:
+        return await self._call(self.sync.get_genres, expected_status, use_cache=use_cache)
+
+    async def get_genre_by_id(
+        self, genre_id: int | str, expected_status: int = 200, *, use_cache: bool = True
+    ) -> GenreResponseModel:
+        return await self._call(self.sync.get_genre_by_id, genre_id, expected_status, use_cache=use_cache)
+
+    async def create_genre(self, payload: dict, expected_status: int = 201) -> GenreResponseModel:
+        return await self._call(self.sync.create_genre, payload, expected_status)
+
+    async def delete_genre(self, genre_id: int | str, expected_status: int | None = 200) -> GenreResponseModel:
+        return await self._call(self.sync.delete_genre, genre_id, expected_status)
@@ -0,0 +1,16 @@
+from tests.clients.payment_api import PaymentAPI, PaymentCreateResponse, PaymentsListApiResponse, PaymentsResponse
+from tests.request.async_requester import AsyncCustomRequester
+
+
+class AsyncPaymentAPI(AsyncCustomRequester[PaymentAPI]):
+    async def create_payment(self, payload: dict, expected_status: int | None = 201) -> PaymentCreateResponse:
+        return await self._call(self.sync.create_payment, payload, expected_status)
+
+    async def get_current_user_payments(self, expected_status: int = 200) -> PaymentsResponse:
+        return await self._call(self.sync.get_current_user_payments, expected_status)
+
+    async def get_user_payments(self, user_id: str, expected_status: int = 200) -> PaymentsResponse:
+        return await self._call(self.sync.get_user_payments, user_id, expected_status)
+
+    async def get_all_payments(self, params: dict | None = None, expected_status: int = 200) -> PaymentsListApiResponse:
+        return await self._call(self.sync.get_all_payments, params, expected_status)
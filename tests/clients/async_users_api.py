@@ -0,0 +1,19 @@
+from tests.clients.users_api import UserApiResponse, UsersAPI, UsersListApiResponse
+from tests.request.async_requester import AsyncCustomRequester
+
+
+class AsyncUsersAPI(AsyncCustomRequester[UsersAPI]):
+    async def create_user(self, user_data: dict, expected_status: int = 201) -> UserApiResponse:
+        return await self._call(self.sync.create_user, user_data, expected_status)
+
+    async def get_user(self, id_or_email: str, expected_status: int = 200) -> UserApiResponse:
+        return await self._call(self.sync.get_user, id_or_email, expected_status)
+
+    async def get_users(self, params: dict | None = None, expected_status: int = 200) -> UsersListApiResponse:
+        return await self._call(self.sync.get_users, params, expected_status)
+
+    async def edit_user(self, user_id: str, user_data: dict, expected_status: int = 200) -> UserApiResponse:
+        return await self._call(self.sync.edit_user, user_id, user_data, expected_status)
+
+    async def delete_user(self, user_id: str, expected_status: int | None = 200) -> UserApiResponse:
+        return await self._call(self.sync.delete_user, user_id, expected_status)
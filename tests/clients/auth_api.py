@@ -1,21 +1,26 @@
 import logging
+import weakref
 from typing import Any
 
 import requests
 
+from tests.clients.token_manager import AuthToken, TokenKey, export_cookies, import_cookies, token_manager
+from tests.config import settings
 from tests.constants.endpoints import (
-    ADMIN_EMAIL,
-    ADMIN_PASSWORD,
     CONFIRM_ENDPOINT,
     LOGIN_ENDPOINT,
     LOGOUT_ENDPOINT,
     REFRESH_ENDPOINT,
     REGISTER_ENDPOINT,
+    Service,
 )
 from tests.constants.log_messages import LogMessages
 from tests.models.response_models import ErrorResponse, LoginResponse
 from tests.models.user_models import User
 from tests.request.custom_requester import CustomRequester
+from tests.request.reauthentication import session_reauthenticators
+from tests.request.session_headers import session_headers
+from tests.request.transport import Transport
 
 type LoginApiResponse = LoginResponse | ErrorResponse
 type RegisterApiResponse = User | ErrorResponse
@@ -25,16 +30,20 @@
 
 
 class AuthAPI(CustomRequester):
-    def __init__(self, session: requests.Session, base_url: str) -> None:
-        super().__init__(session, base_url=base_url)
+    service = Service.AUTH
+
+    def __init__(self, session: requests.Session, base_url: str, transport: Transport | None = None) -> None:
+        super().__init__(session, base_url=base_url, transport=transport)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def login(
         self,
-        email: str | None = ADMIN_EMAIL,
-        password: str | None = ADMIN_PASSWORD,
+        email: str | None = None,
+        password: str | None = None,
         expected_status: int = 200,
     ) -> LoginApiResponse:
+        email = email or settings.admin_email
+        password = password or settings.admin_password
         if not email or not password:
             raise ValueError("ADMIN_EMAIL и ADMIN_PASSWORD должны быть указаны в .env file")
 
@@ -42,25 +51,81 @@ def login(
         payload = {"email": email, "password": password}
         response = self.post(LOGIN_ENDPOINT, json=payload, expected_status=expected_status)
         if response.ok:
-            login_response = LoginResponse.model_validate(response.json())
-            self.session.headers["Authorization"] = f"Bearer {login_response.access_token}"
+            login_response = response.parse(LoginResponse)
+            session_headers.update(self.session, {"Authorization": f"Bearer {login_response.access_token}"})
             self.logger.info(LogMessages.Auth.LOGIN_SUCCESS.format(email))
             return login_response
 
-        error_response = ErrorResponse.model_validate(response.json())
+        error_response = response.parse(ErrorResponse)
         self.logger.error(f"Ошибка логина для {email}: {error_response.message} (status: {error_response.statusCode})")
         return error_response
 
+    def authenticate(self, email: str | None = None, password: str | None = None) -> LoginResponse:
+        email = email or settings.admin_email
+        password = password or settings.admin_password
+        if not email or not password:
+            raise ValueError("ADMIN_EMAIL и ADMIN_PASSWORD должны быть указаны в .env file")
+
+        key = token_manager.make_key(self.base_url, email, password)
+        with token_manager.locked(key):
+            token = token_manager.get(key)
+            if token is not None and token_manager.needs_refresh(token):
+                token = self._refresh_cached_token(key, token)
+            if token is None:
+                login_response = self.login(email=email, password=password, expected_status=200)
+                if not isinstance(login_response, LoginResponse):
+                    raise RuntimeError(f"Не удалось авторизоваться под {email}: {login_response.message}")
+                token = AuthToken.from_login(login_response, export_cookies(self.session.cookies))
+                token_manager.store(key, token)
+            else:
+                self.logger.info(LogMessages.Auth.TOKEN_REUSED.format(email))
+
+        session_headers.update(self.session, {"Authorization": f"Bearer {token.access_token}"})
+        import_cookies(self.session.cookies, token.cookies)
+        auth_api = weakref.ref(self)
+
+        def reauthenticate(rejected_authorization: str) -> None:
+            api = auth_api()
+            if api is not None:
+                api._reauthenticate(key, email, password, rejected_authorization)
+
+        session_reauthenticators.bind(self.session, reauthenticate)
+        return token.login_response
+
+    def _reauthenticate(self, key: TokenKey, email: str, password: str, rejected_authorization: str) -> LoginResponse:
+        self.logger.warning(f"Токен {email} отклонен сервером (401), выполняем повторный логин")
+        token_manager.invalidate(key, access_token=rejected_authorization.removeprefix("Bearer "))
+        return self.authenticate(email, password)
+
+    def _refresh_cached_token(self, key: TokenKey, token: AuthToken) -> AuthToken | None:
+        import_cookies(self.session.cookies, token.cookies)
+        try:
+            result = self.refresh_token(expected_status=200)
+        except AssertionError:
+            result = None
+        access_token = result.get("accessToken") if isinstance(result, dict) else None
+        if not isinstance(access_token, str):
+            self.logger.warning("Не удалось обновить токен через refresh, выполняем повторный логин")
+            token_manager.invalidate(key)
+            return None
+
+        refreshed = AuthToken.from_login(
+            token.login_response.model_copy(update={"access_token": access_token}),
+            export_cookies(self.session.cookies),
+        )
+        token_manager.store(key, refreshed)
+        return refreshed
+
     def register(self, user_data: dict, expected_status: int = 201) -> User | ErrorResponse:
         email = user_data.get("email", "N/A")
         self.logger.info(f"Попытка регистрации пользователя {email}")
         response = self.post(REGISTER_ENDPOINT, json=user_data, expected_status=expected_status)
         if response.ok:
-            user = User.model_validate(response.json())
+            user = response.parse(User)
             self.logger.info(f"Пользователь {user.email} успешно зарегистрирован.")
             return user
 
-        error_response = ErrorResponse.model_validate(response.json())
+        error_response = response.parse(ErrorResponse)
         self.logger.error(
             f"Ошибка регистрации для {email}: {error_response.message} (status: {error_response.statusCode})"
         )
@@ -77,7 +142,7 @@ def logout(self, expected_status: int = 200) -> LogoutApiResponse:
                 result = {"message": response.text}
             return result
         self.logger.error(f"Ошибка выхода из системы: status {response.status_code}")
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
 
     def refresh_token(self, expected_status: int = 200) -> RefreshTokenApiResponse:
         self.logger.info("Попытка обновления токенов")
@@ -87,7 +152,7 @@ def refresh_token(self, expected_status: int = 200) -> RefreshTokenApiResponse:
             result: dict[str, Any] = response.json()
             return result
         self.logger.error(f"Ошибка обновления токенов: status {response.status_code}")
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
 
     def confirm_email(self, token: str, expected_status: int = 200) -> ConfirmEmailApiResponse:
         self.logger.info("Попытка подтверждения email")
@@ -95,4 +160,4 @@ def confirm_email(self, token: str, expected_status: int = 200) -> ConfirmEmailA
         if response.ok:
             result: dict[str, Any] = response.json()
             return result
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
@@ -0,0 +1,153 @@
+import logging
+import threading
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.models.response_models import ErrorResponse
+from tests.utils.concurrency import run_batch
+
+
+class ResourceKind(StrEnum):
+    REVIEW = "review"
+    MOVIE = "movie"
+    GENRE = "genre"
+    USER = "user"
+
+
+class CleanupOutcome(StrEnum):
+    DELETED = "deleted"
+    ALREADY_GONE = "already_gone"
+    FAILED = "failed"
+
+
+CLEANUP_STAGES: tuple[tuple[ResourceKind, ...], ...] = (
+    (ResourceKind.REVIEW,),
+    (ResourceKind.MOVIE,),
+    (ResourceKind.GENRE, ResourceKind.USER),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class CleanupTask:
+    kind: ResourceKind
+    resource_id: str
+    delete: Callable[[ApiManager], object]
+    owner: ApiManager | None = None
+
+
+@dataclass(slots=True)
+class CleanupReport:
+    outcomes: dict[ResourceKind, Counter[CleanupOutcome]] = field(default_factory=dict)
+    failures: list[str] = field(default_factory=list)
+
+    def record(self, task: CleanupTask, outcome: CleanupOutcome, reason: str | None = None) -> None:
+        self.outcomes.setdefault(task.kind, Counter())[outcome] += 1
+        if outcome is CleanupOutcome.FAILED:
+            self.failures.append(f"{task.kind} {task.resource_id}: {reason}")
+
+    def merge(self, other: "CleanupReport") -> None:
+        for kind, counter in other.outcomes.items():
+            self.outcomes.setdefault(kind, Counter()).update(counter)
+        self.failures.extend(other.failures)
+
+    def count(self, outcome: CleanupOutcome) -> int:
+        return sum(counter[outcome] for counter in self.outcomes.values())
+
+    def log_summary(self, logger: logging.Logger) -> None:
+        for kind, counter in self.outcomes.items():
+            logger.info(
+                f"Очистка {kind}: удалено {counter[CleanupOutcome.DELETED]}, "
+                f"уже отсутствовали {counter[CleanupOutcome.ALREADY_GONE]}, "
+                f"ошибок {counter[CleanupOutcome.FAILED]}"
+            )
+        for failure in self.failures:
+            logger.warning(f"Не удалось удалить {failure}")
+
+
+class CleanupRegistry:
+    def __init__(self, admin_pool: ApiManagerPool, concurrency: int = 4):
+        self._admin_pool = admin_pool
+        self._concurrency = concurrency
+        self._pending: dict[tuple[ResourceKind, str], CleanupTask] = {}
+        self._lock = threading.Lock()
+        self.report = CleanupReport()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def register(self, task: CleanupTask) -> None:
+        with self._lock:
+            self._pending.setdefault((task.kind, task.resource_id), task)
+
+    def register_movie(self, movie_id: int | str) -> None:
+        self.register(
+            CleanupTask(ResourceKind.MOVIE, str(movie_id), lambda admin: admin.movies_api.delete_movie(movie_id, None))
+        )
+
+    def register_user(self, user_id: str) -> None:
+        self.register(CleanupTask(ResourceKind.USER, user_id, lambda admin: admin.users_api.delete_user(user_id, None)))
+
+    def register_genre(self, genre_id: int | str) -> None:
+        self.register(
+            CleanupTask(ResourceKind.GENRE, str(genre_id), lambda admin: admin.movies_api.delete_genre(genre_id, None))
+        )
+
+    def register_review(self, movie_id: int | str, author: ApiManager) -> None:
+        self.register(
+            CleanupTask(
+                ResourceKind.REVIEW,
+                f"{movie_id}:{id(author)}",
+                lambda manager: manager.movies_api.delete_review(movie_id, None),
+                owner=author,
+            )
+        )
+
+    def _delete(self, task: CleanupTask) -> CleanupOutcome:
+        if task.owner is not None:
+            result = task.delete(task.owner)
+        else:
+            with self._admin_pool.lease() as admin:
+                result = task.delete(admin)
+        if not isinstance(result, ErrorResponse):
+            return CleanupOutcome.DELETED
+        if result.statusCode == 404:
+            return CleanupOutcome.ALREADY_GONE
+        raise AssertionError(f"статус {result.statusCode}: {result.message}")
+
+    def flush(self) -> CleanupReport:
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        return self._delete_all(pending)
+
+    def flush_reviews(self, *, movie_id: int | str | None = None, author: ApiManager | None = None) -> CleanupReport:
+        with self._lock:
+            pending = [
+                task
+                for task in self._pending.values()
+                if task.kind is ResourceKind.REVIEW
+                and (movie_id is None or task.resource_id.partition(":")[0] == str(movie_id))
+                and (author is None or task.owner is author)
+            ]
+            for task in pending:
+                del self._pending[(task.kind, task.resource_id)]
+        return self._delete_all(pending)
+
+    def _delete_all(self, pending: list[CleanupTask]) -> CleanupReport:
+        report = CleanupReport()
+        for stage in CLEANUP_STAGES:
+            tasks = [task for task in pending if task.kind in stage]
+            for result in run_batch(self._delete, tasks, self._concurrency):
+                if result.result is None:
+                    report.record(result.item, CleanupOutcome.FAILED, str(result.error))
+                else:
+                    report.record(result.item, result.result)
+        self.report.merge(report)
+        if pending:
+            report.log_summary(self.logger)
+        return report
@@ -0,0 +1,61 @@
+from collections.abc import Callable, Generator
+
+import pytest
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.fake_backend.app import FakeCinescopeBackend, service_base_urls
+from tests.request.transport import WSGITransport
+
+FAKE_BASE_URLS = service_base_urls("http://cinescope.test")
+
+
+@pytest.fixture
+def fake_backend_app(request: pytest.FixtureRequest) -> FakeCinescopeBackend:
+    return FakeCinescopeBackend(seed_movies=getattr(request, "param", 0))
+
+
+@pytest.fixture
+def fake_transport(fake_backend_app: FakeCinescopeBackend) -> WSGITransport:
+    return WSGITransport(fake_backend_app)
+
+
+@pytest.fixture
+def fake_manager_factory(fake_transport: WSGITransport) -> Generator[Callable[[], ApiManager]]:
+    sessions: list[requests.Session] = []
+
+    def create() -> ApiManager:
+        session = requests.Session()
+        sessions.append(session)
+        return ApiManager(session, **FAKE_BASE_URLS, transport=fake_transport)
+
+    yield create
+    for session in sessions:
+        session.close()
+
+
+@pytest.fixture
+def fake_api_manager(fake_manager_factory: Callable[[], ApiManager]) -> ApiManager:
+    return fake_manager_factory()
+
+
+@pytest.fixture
+def fake_admin_manager(
+    fake_manager_factory: Callable[[], ApiManager], fake_backend_app: FakeCinescopeBackend
+) -> ApiManager:
+    manager = fake_manager_factory()
+    manager.auth_api.login(fake_backend_app.admin_email, fake_backend_app.admin_password)
+    return manager
+
+
+@pytest.fixture
+def fake_admin_pool(fake_backend_app: FakeCinescopeBackend, fake_transport: WSGITransport) -> Generator[ApiManagerPool]:
+    def login_as_admin(manager: ApiManager) -> None:
+        manager.auth_api.login(fake_backend_app.admin_email, fake_backend_app.admin_password)
+
+    pool = ApiManagerPool(
+        lambda session: ApiManager(session, **FAKE_BASE_URLS, transport=fake_transport), login_as_admin
+    )
+    yield pool
+    pool.close()
@@ -0,0 +1,36 @@
+import threading
+
+from tests.models.response_models import GenreResponse
+
+
+class GenreCache:
+    def __init__(self) -> None:
+        self._genres: dict[str, list[GenreResponse]] = {}
+        self._index: dict[str, dict[int, GenreResponse]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str) -> list[GenreResponse] | None:
+        with self._lock:
+            genres = self._genres.get(base_url)
+            return list(genres) if genres is not None else None
+
+    def get_by_id(self, base_url: str, genre_id: int) -> GenreResponse | None:
+        with self._lock:
+            return self._index.get(base_url, {}).get(genre_id)
+
+    def store(self, base_url: str, genres: list[GenreResponse]) -> None:
+        with self._lock:
+            self._genres[base_url] = list(genres)
+            self._index[base_url] = {genre.id: genre for genre in genres}
+
+    def invalidate(self, base_url: str | None = None) -> None:
+        with self._lock:
+            if base_url is None:
+                self._genres.clear()
+                self._index.clear()
+                return
+            self._genres.pop(base_url, None)
+            self._index.pop(base_url, None)
+
+
+genre_cache = GenreCache()
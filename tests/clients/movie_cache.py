@@ -0,0 +1,90 @@
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+
+from tests.config import settings
+from tests.models.movie_models import MovieWithReviews
+
+
+class MovieCacheStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def log_summary(self) -> None:
+        if self.hits or self.misses:
+            self.logger.info(f"Кэш фильмов: попаданий {self.hits}, промахов {self.misses}")
+
+
+class MovieCache:
+    def __init__(self, maxsize: int, stats: MovieCacheStats | None = None):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._stats = stats
+        self._entries: OrderedDict[str, MovieWithReviews] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, movie_id: int | str) -> MovieWithReviews | None:
+        with self._lock:
+            movie = self._entries.get(str(movie_id))
+            if movie is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(str(movie_id))
+        if self._stats is not None:
+            self._stats.record(movie is not None)
+        return movie.model_copy(deep=True) if movie is not None else None
+
+    def put(self, movie_id: int | str, movie: MovieWithReviews) -> None:
+        with self._lock:
+            self._entries[str(movie_id)] = movie.model_copy(deep=True)
+            self._entries.move_to_end(str(movie_id))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, movie_id: int | str) -> None:
+        with self._lock:
+            self._entries.pop(str(movie_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+movie_cache_stats = MovieCacheStats()
+_caches: weakref.WeakKeyDictionary[object, MovieCache] = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def movie_cache_for(session: object) -> MovieCache | None:
+    if settings.movie_cache_size == 0:
+        return None
+    with _caches_lock:
+        cache = _caches.get(session)
+        if cache is None:
+            cache = MovieCache(settings.movie_cache_size, movie_cache_stats)
+            _caches[session] = cache
+        return cache
+
+
+def invalidate_movie(movie_id: int | str) -> None:
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.invalidate(movie_id)
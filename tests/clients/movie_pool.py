@@ -0,0 +1,181 @@
+import logging
+import queue
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from enum import StrEnum
+
+from faker import Faker
+
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.models.movie_models import Movie, MovieWithReviews
+from tests.request.background import background_traffic
+from tests.utils.concurrency import run_batch
+from tests.utils.data_generator import MovieDataGenerator
+
+
+class MovieKind(StrEnum):
+    PUBLISHED = "published"
+    UNPUBLISHED = "unpublished"
+
+
+class MoviePool:
+    CLOSE_TIMEOUT_SECONDS = 30.0
+
+    def __init__(
+        self, admin_pool: ApiManagerPool, faker: Faker, size: int = 4, unpublished_size: int = 1, concurrency: int = 4
+    ):
+        self._admin_pool = admin_pool
+        self._faker = faker
+        self._sizes = {MovieKind.PUBLISHED: size, MovieKind.UNPUBLISHED: unpublished_size}
+        self._concurrency = concurrency
+        self._idle: dict[MovieKind, list[Movie]] = {kind: [] for kind in MovieKind}
+        self._shared: dict[MovieKind, Movie] = {}
+        self._owned: dict[int, Movie] = {}
+        self._returned: queue.Queue[Movie | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._faker_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._worker: threading.Thread | None = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _create_movie(self, kind: MovieKind) -> Movie:
+        with self._faker_lock:
+            payload = MovieDataGenerator.generate_valid_movie_payload(self._faker)
+        payload.published = kind is MovieKind.PUBLISHED
+        with self._admin_pool.lease() as admin:
+            movie = admin.movies_api.create_movie(payload, expected_status=201)
+        assert isinstance(movie, Movie), f"Не удалось создать фильм пула ({kind})"
+        with self._lock:
+            self._owned[movie.id] = movie
+        return movie
+
+    def _top_up(self) -> None:
+        if self._stopped.is_set():
+            return
+        with self._lock:
+            missing = [kind for kind in MovieKind for _ in range(self._sizes[kind] - len(self._idle[kind]))]
+        if not missing:
+            return
+        results = run_batch(self._create_movie, missing, self._concurrency)
+        with self._lock:
+            for result in results:
+                if result.result is not None:
+                    self._idle[result.item].append(result.result)
+        failed = [result for result in results if not result.ok]
+        for result in failed:
+            self.logger.warning(f"Фильм пула ({result.item}) не создан: {result.error}")
+        self.logger.info(f"Пул фильмов пополнен: {len(missing) - len(failed)} из {len(missing)}")
+
+    def provision(self) -> None:
+        self._top_up()
+        self._worker = threading.Thread(target=self._run, name="movie-pool", daemon=True)
+        self._worker.start()
+
+    def acquire(self, kind: MovieKind = MovieKind.PUBLISHED) -> Movie:
+        with self._lock:
+            movie = self._idle[kind].pop() if self._idle[kind] else None
+        if movie is None:
+            movie = self._create_movie(kind)
+        self._returned.put(None)
+        return movie.model_copy(deep=True)
+
+    def release(self, movie: Movie) -> None:
+        self._returned.put(movie)
+
+    @contextmanager
+    def lease(self, kind: MovieKind = MovieKind.PUBLISHED) -> Generator[Movie]:
+        movie = self.acquire(kind)
+        try:
+            yield movie
+        finally:
+            self.release(movie)
+
+    def shared(self, kind: MovieKind = MovieKind.PUBLISHED) -> Movie:
+        with self._lock:
+            movie = self._shared.get(kind)
+        if movie is None:
+            created = self._create_movie(kind)
+            with self._lock:
+                movie = self._shared.setdefault(kind, created)
+            if movie is not created:
+                self._returned.put(created)
+        return movie.model_copy(deep=True)
+
+    def _run(self) -> None:
+        with background_traffic():
+            self._serve_returned()
+
+    def _serve_returned(self) -> None:
+        while True:
+            movie = self._returned.get()
+            try:
+                if self._stopped.is_set():
+                    return
+                if movie is not None:
+                    self._recycle(movie)
+                self._top_up()
+            except Exception:
+                self.logger.exception("Ошибка фонового пополнения пула фильмов")
+            finally:
+                self._returned.task_done()
+
+    def drain(self) -> None:
+        self._returned.join()
+
+    def _recycle(self, movie: Movie) -> None:
+        with self._lock:
+            original = self._owned.get(movie.id)
+        if original is None:
+            return
+        kind = MovieKind.PUBLISHED if original.published else MovieKind.UNPUBLISHED
+        try:
+            with self._admin_pool.lease() as admin:
+                current = admin.movies_api.get_movie_by_id(movie.id, expected_status=200, use_cache=False)
+        except AssertionError:
+            with self._lock:
+                self._owned.pop(movie.id, None)
+            self.logger.info(f"Фильм пула {movie.id} удален в тесте, будет создан новый")
+            return
+
+        if isinstance(current, MovieWithReviews) and self._is_pristine(original, current):
+            with self._lock:
+                self._idle[kind].append(original)
+            return
+        self.logger.info(f"Фильм пула {movie.id} изменен в тесте, будет заменен")
+        self._delete_movie(original)
+
+    @staticmethod
+    def _is_pristine(original: Movie, current: MovieWithReviews) -> bool:
+        return not current.reviews and current.model_dump(exclude={"reviews"}) == original.model_dump()
+
+    def _delete_movie(self, movie: Movie) -> None:
+        with self._lock:
+            self._owned.pop(movie.id, None)
+        with self._admin_pool.lease() as admin:
+            admin.movies_api.delete_movie(movie.id, expected_status=200)
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._returned.put(None)
+        if self._worker is not None:
+            self._worker.join(timeout=self.CLOSE_TIMEOUT_SECONDS)
+            if self._worker.is_alive():
+                self.logger.warning(
+                    "Фоновый поток пула фильмов еще работает, созданные им фильмы будут удалены после него"
+                )
+        self._delete_owned()
+        if self._worker is not None and self._worker.is_alive():
+            self._worker.join()
+            self._delete_owned()
+
+    def _delete_owned(self) -> None:
+        with self._lock:
+            owned = list(self._owned.values())
+            self._idle = {kind: [] for kind in MovieKind}
+            self._shared.clear()
+        results = run_batch(self._delete_movie, owned, self._concurrency)
+        failed = [result.item.id for result in results if not result.ok]
+        if failed:
+            self.logger.warning(f"Не удалось удалить фильмы пула: {failed}")
+        self.logger.info(f"Пул фильмов удален: {len(owned) - len(failed)} из {len(owned)}")
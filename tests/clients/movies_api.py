@@ -1,7 +1,11 @@
 import logging
+from collections.abc import Generator, Iterable
 
 import requests
 
+from tests.clients.genre_cache import GenreCache, genre_cache
+from tests.clients.movie_cache import invalidate_movie, movie_cache_for
+from tests.config import settings
 from tests.constants.endpoints import (
     GENRE_BY_ID_ENDPOINT,
     GENRES_ENDPOINT,
@@ -10,12 +14,16 @@
     REVIEW_HIDE_ENDPOINT,
     REVIEW_SHOW_ENDPOINT,
     REVIEWS_ENDPOINT,
+    Service,
 )
 from tests.constants.log_messages import LogMessages
 from tests.models.movie_models import Movie, MovieWithReviews, Review
 from tests.models.request_models import MovieCreate
 from tests.models.response_models import DeletedObject, ErrorResponse, GenreResponse, MoviesList
 from tests.request.custom_requester import CustomRequester
+from tests.request.transport import Transport
+from tests.utils.concurrency import BatchResult, RateLimiter, run_batch
+from tests.utils.pagination import iter_pages_prefetched
 
 type MovieResponse = Movie | ErrorResponse
 type DeletedMovieResponse = DeletedObject | ErrorResponse
@@ -27,8 +35,11 @@
 
 
 class MoviesAPI(CustomRequester):
-    def __init__(self, session: requests.Session, base_url: str):
-        super().__init__(session, base_url)
+    service = Service.API
+    genre_cache: GenreCache = genre_cache
+
+    def __init__(self, session: requests.Session, base_url: str, transport: Transport | None = None):
+        super().__init__(session, base_url, transport=transport)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def create_movie(self, movie_data: MovieCreate | dict, *, expected_status: int = 201) -> MovieResponse:
@@ -39,54 +50,114 @@ def create_movie(self, movie_data: MovieCreate | dict, *, expected_status: int =
 
         response = self.post(MOVIES_ENDPOINT, json=data, expected_status=expected_status)
         if response.ok:
-            movie = Movie.model_validate(response.json())
+            movie = response.parse(Movie)
             self.logger.info(LogMessages.Movies.CREATE_SUCCESS.format(movie.name, movie.id))
             return movie
 
-        error = ErrorResponse.model_validate(response.json())
+        error = response.parse(ErrorResponse)
         self.logger.error(f"Ошибка создания фильма '{log_name}': {error.message} (status: {error.statusCode})")
         return error
 
-    def get_movie_by_id(self, movie_id: int | str, expected_status: int = 200) -> MovieWithReviews | ErrorResponse:
+    def get_movie_by_id(
+        self, movie_id: int | str, expected_status: int = 200, *, use_cache: bool = True
+    ) -> MovieWithReviews | ErrorResponse:
+        cache = movie_cache_for(self.session) if use_cache and expected_status == 200 else None
+        if cache is not None:
+            cached = cache.get(movie_id)
+            if cached is not None:
+                self.logger.info(f"Фильм {movie_id} получен из кэша")
+                return cached
+
         self.logger.info(LogMessages.Movies.ATTEMPT_GET_BY_ID.format(movie_id))
         response = self.get(MOVIE_BY_ID_ENDPOINT.format(movie_id=movie_id), expected_status=expected_status)
         if response.ok:
-            movie = MovieWithReviews.model_validate(response.json())
+            movie = response.parse(MovieWithReviews)
+            if cache is not None:
+                cache.put(movie_id, movie)
             self.logger.info(LogMessages.Movies.GET_BY_ID_SUCCESS.format(movie.name, movie_id))
             return movie
 
-        error = ErrorResponse.model_validate(response.json())
+        error = response.parse(ErrorResponse)
         self.logger.error(f"Ошибка получения фильма по ID {movie_id}: {error.message} (status: {error.statusCode})")
         return error
 
-    def delete_movie(self, movie_id: int | str, expected_status: int = 200) -> DeletedObject | ErrorResponse:
+    def delete_movie(self, movie_id: int | str, expected_status: int | None = 200) -> DeletedObject | ErrorResponse:
         self.logger.info(LogMessages.Movies.ATTEMPT_DELETE.format(movie_id))
         response = self.delete(MOVIE_BY_ID_ENDPOINT.format(movie_id=movie_id), expected_status=expected_status)
+        invalidate_movie(movie_id)
         if response.ok:
-            deleted_object = DeletedObject.model_validate(response.json())
+            deleted_object = response.parse(DeletedObject)
             self.logger.info(LogMessages.Movies.DELETE_SUCCESS.format(movie_id, movie_id))
             return deleted_object
 
-        error = ErrorResponse.model_validate(response.json())
+        error = response.parse(ErrorResponse)
         self.logger.error(f"Ошибка удаления фильма {movie_id}: {error.message} (status: {error.statusCode})")
         return error
 
+    def create_movies(
+        self,
+        payloads: Iterable[MovieCreate | dict],
+        *,
+        concurrency: int | None = None,
+        rate_limit: float | None = None,
+    ) -> list[BatchResult[MovieCreate | dict, MovieResponse]]:
+        results = run_batch(
+            self.create_movie,
+            payloads,
+            concurrency or settings.bulk_concurrency,
+            RateLimiter(settings.bulk_rate_limit_per_second if rate_limit is None else rate_limit),
+        )
+        failed = sum(not result.ok for result in results)
+        self.logger.info(f"Создано фильмов: {len(results) - failed}, ошибок: {failed}")
+        return results
+
+    def delete_movies(
+        self,
+        movie_ids: Iterable[int | str],
+        *,
+        concurrency: int | None = None,
+        rate_limit: float | None = None,
+    ) -> list[BatchResult[int | str, DeletedMovieResponse]]:
+        results = run_batch(
+            self.delete_movie,
+            movie_ids,
+            concurrency or settings.bulk_concurrency,
+            RateLimiter(settings.bulk_rate_limit_per_second if rate_limit is None else rate_limit),
+        )
+        failed = sum(not result.ok for result in results)
+        self.logger.info(f"Удалено фильмов: {len(results) - failed}, ошибок: {failed}")
+        return results
+
     def get_movies(self, params: dict | None = None, *, expected_status: int = 200) -> MoviesList | ErrorResponse:
         self.logger.info(LogMessages.Movies.ATTEMPT_GET_LIST.format(params or "default"))
         response = self.get(MOVIES_ENDPOINT, params=params, expected_status=expected_status)
         if response.ok:
-            movies_list = MoviesList.model_validate(response.json())
+            movies_list = response.parse(MoviesList)
             self.logger.info(f"Успешно получено {len(movies_list.movies)} фильмов. Всего найдено: {movies_list.count}")
             return movies_list
 
-        error = ErrorResponse.model_validate(response.json())
+        error = response.parse(ErrorResponse)
         self.logger.error(f"Ошибка получения списка фильмов: {error.message} (status: {error.statusCode})")
         return error
 
+    def iter_movies(
+        self, params: dict | None = None, *, max_pages: int | None = None, prefetch: int = 1
+    ) -> Generator[Movie]:
+        query = dict(params or {})
+        start_page = int(query.pop("page", 1))
+
+        def fetch(page: int) -> MoviesList:
+            movies_list = self.get_movies({**query, "page": page})
+            assert isinstance(movies_list, MoviesList), f"Не удалось получить страницу {page} списка фильмов"
+            return movies_list
+
+        for movies_list in iter_pages_prefetched(fetch, start_page, max_pages, prefetch):
+            yield from movies_list.movies
+
     def get_movies_with_invalid_params(self, params: dict, expected_status: int = 400) -> ErrorResponse:
         self.logger.info(LogMessages.Movies.ATTEMPT_GET_LIST_INVALID.format(params))
         response = self.get(MOVIES_ENDPOINT, params=params, expected_status=expected_status)
-        error = ErrorResponse.model_validate(response.json())
+        error = response.parse(ErrorResponse)
         self.logger.warning(f"Ожидаемая ошибка при получении фильмов: {error.message} (status: {error.statusCode})")
         return error
 
@@ -95,12 +166,13 @@ def edit_movie(self, movie_id: int | str, payload: dict, expected_status: int =
         response = self.patch(
             MOVIE_BY_ID_ENDPOINT.format(movie_id=movie_id), json=payload, expected_status=expected_status
         )
+        invalidate_movie(movie_id)
         if response.ok:
-            movie = Movie.model_validate(response.json())
+            movie = response.parse(Movie)
             self.logger.info(LogMessages.Movies.EDIT_SUCCESS.format(movie.name, movie.id))
             return movie
 
-        error = ErrorResponse.model_validate(response.json())
+        error = response.parse(ErrorResponse)
         self.logger.error(f"Ошибка редактирования фильма {movie_id}: {error.message} (status: {error.statusCode})")
         return error
 
@@ -108,80 +180,107 @@ def get_reviews(self, movie_id: int | str, expected_status: int = 200) -> Review
         self.logger.info(f"Попытка получения отзывов для фильма {movie_id}")
         response = self.get(REVIEWS_ENDPOINT.format(movie_id=movie_id), expected_status=expected_status)
         if response.ok:
-            data = response.json()
-            return [Review.model_validate(item) for item in data]
-        return ErrorResponse.model_validate(response.json())
+            return response.parse_list(Review)
+        return response.parse(ErrorResponse)
 
     def create_review(self, movie_id: int | str, payload: dict, expected_status: int = 201) -> ReviewsResponse:
         self.logger.info(f"Попытка создания отзыва для фильма {movie_id}")
         response = self.post(REVIEWS_ENDPOINT.format(movie_id=movie_id), json=payload, expected_status=expected_status)
+        invalidate_movie(movie_id)
         if response.ok:
             data = response.json()
             if isinstance(data, list):
                 return [Review.model_validate(item) for item in data]
             return Review.model_validate(data)
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
 
     def edit_review(self, movie_id: int | str, payload: dict, expected_status: int = 200) -> ReviewsResponse:
         self.logger.info(f"Попытка редактирования отзыва для фильма {movie_id}")
         response = self.put(REVIEWS_ENDPOINT.format(movie_id=movie_id), json=payload, expected_status=expected_status)
+        invalidate_movie(movie_id)
         if response.ok:
-            return Review.model_validate(response.json())
-        return ErrorResponse.model_validate(response.json())
+            return response.parse(Review)
+        return response.parse(ErrorResponse)
 
-    def delete_review(self, movie_id: int | str, expected_status: int = 200) -> ReviewsResponse:
+    def delete_review(self, movie_id: int | str, expected_status: int | None = 200) -> ReviewsResponse:
         self.logger.info(f"Попытка удаления отзыва для фильма {movie_id}")
         response = self.delete(REVIEWS_ENDPOINT.format(movie_id=movie_id), expected_status=expected_status)
+        invalidate_movie(movie_id)
         if response.ok:
             if response.content:
-                return Review.model_validate(response.json())
+                return response.parse(Review)
             return []
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
 
     def hide_review(self, movie_id: int | str, user_id: str, expected_status: int = 200) -> ReviewsResponse:
         self.logger.info(f"Попытка скрыть отзыв для фильма {movie_id} от пользователя {user_id}")
         response = self.patch(
             REVIEW_HIDE_ENDPOINT.format(movie_id=movie_id, user_id=user_id), expected_status=expected_status
         )
+        invalidate_movie(movie_id)
         if response.ok:
-            return Review.model_validate(response.json())
-        return ErrorResponse.model_validate(response.json())
+            return response.parse(Review)
+        return response.parse(ErrorResponse)
 
     def show_review(self, movie_id: int | str, user_id: str, expected_status: int = 200) -> ReviewsResponse:
         self.logger.info(f"Попытка показать отзыв для фильма {movie_id} от пользователя {user_id}")
         response = self.patch(
             REVIEW_SHOW_ENDPOINT.format(movie_id=movie_id, user_id=user_id), expected_status=expected_status
         )
+        invalidate_movie(movie_id)
         if response.ok:
-            return Review.model_validate(response.json())
-        return ErrorResponse.model_validate(response.json())
+            return response.parse(Review)
+        return response.parse(ErrorResponse)
+
+    def _use_genre_cache(self, use_cache: bool, expected_status: int) -> bool:
+        return use_cache and expected_status == 200 and settings.genre_cache_enabled
+
+    def get_genres(self, expected_status: int = 200, *, use_cache: bool = True) -> GenresResponse:
+        if self._use_genre_cache(use_cache, expected_status):
+            cached = self.genre_cache.get(self.base_url)
+            if cached is not None:
+                self.logger.info("Список жанров получен из кэша")
+                return cached
 
-    def get_genres(self, expected_status: int = 200) -> GenresResponse:
         self.logger.info("Попытка получения списка жанров")
         response = self.get(GENRES_ENDPOINT, expected_status=expected_status)
         if response.ok:
-            return [GenreResponse.model_validate(item) for item in response.json()]
-        return ErrorResponse.model_validate(response.json())
+            genres = response.parse_list(GenreResponse)
+            self.genre_cache.store(self.base_url, genres)
+            return genres
+        return response.parse(ErrorResponse)
+
+    def get_genre_by_id(
+        self, genre_id: int | str, expected_status: int = 200, *, use_cache: bool = True
+    ) -> GenreResponseModel:
+        if self._use_genre_cache(use_cache, expected_status) and str(genre_id).isdigit():
+            if self.genre_cache.get(self.base_url) is None:
+                self.get_genres()
+            cached = self.genre_cache.get_by_id(self.base_url, int(genre_id))
+            if cached is not None:
+                self.logger.info(f"Жанр {genre_id} получен из кэша")
+                return cached
 
-    def get_genre_by_id(self, genre_id: int | str, expected_status: int = 200) -> GenreResponseModel:
         self.logger.info(f"Попытка получения жанра {genre_id}")
         response = self.get(GENRE_BY_ID_ENDPOINT.format(genre_id=genre_id), expected_status=expected_status)
         if response.ok:
-            return GenreResponse.model_validate(response.json())
-        return ErrorResponse.model_validate(response.json())
+            return response.parse(GenreResponse)
+        return response.parse(ErrorResponse)
 
     def create_genre(self, payload: dict, expected_status: int = 201) -> GenreResponseModel:
         self.logger.info(f"Попытка создания жанра {payload.get('name')}")
         response = self.post(GENRES_ENDPOINT, json=payload, expected_status=expected_status)
         if response.ok:
-            return GenreResponse.model_validate(response.json())
-        return ErrorResponse.model_validate(response.json())
+            self.genre_cache.invalidate(self.base_url)
+            return response.parse(GenreResponse)
+        return response.parse(ErrorResponse)
 
-    def delete_genre(self, genre_id: int | str, expected_status: int = 200) -> GenreResponseModel:
+    def delete_genre(self, genre_id: int | str, expected_status: int | None = 200) -> GenreResponseModel:
         self.logger.info(f"Попытка удаления жанра {genre_id}")
         response = self.delete(GENRE_BY_ID_ENDPOINT.format(genre_id=genre_id), expected_status=expected_status)
         if response.ok:
+            self.genre_cache.invalidate(self.base_url)
             if response.content:
-                return GenreResponse.model_validate(response.json())
+                return response.parse(GenreResponse)
             return GenreResponse(id=int(genre_id), name="")
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
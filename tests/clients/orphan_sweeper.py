@@ -0,0 +1,131 @@
+import argparse
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from tests.clients.api_manager import ApiManager, ApiManagerFactory
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.clients.cleanup_registry import CleanupRegistry, ResourceKind
+from tests.config import settings
+from tests.models.movie_models import Movie
+from tests.models.user_models import User
+from tests.utils.concurrency import run_batch
+from tests.utils.data_generator import AUTOTEST_EMAIL_DOMAIN, AUTOTEST_EMAIL_PREFIX, AUTOTEST_MOVIE_TAG
+
+PROTECTED_ROLES = frozenset({"ADMIN", "SUPER_ADMIN"})
+
+
+@dataclass(slots=True, frozen=True)
+class Orphan:
+    kind: ResourceKind
+    resource_id: str
+    label: str
+    created_at: datetime
+
+
+class OrphanSweeper:
+    def __init__(
+        self,
+        admin_pool: ApiManagerPool,
+        min_age: timedelta = timedelta(hours=24),
+        concurrency: int = 4,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ):
+        self._admin_pool = admin_pool
+        self._min_age = min_age
+        self._concurrency = concurrency
+        self._clock = clock
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _is_old(self, created_at: datetime, now: datetime) -> bool:
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=UTC)
+        return now - created_at >= self._min_age
+
+    def is_orphan_user(self, user: User, now: datetime) -> bool:
+        return (
+            user.email.startswith(AUTOTEST_EMAIL_PREFIX)
+            and user.email.endswith(AUTOTEST_EMAIL_DOMAIN)
+            and not PROTECTED_ROLES & set(user.roles)
+            and self._is_old(user.created_at, now)
+        )
+
+    def is_orphan_movie(self, movie: Movie, now: datetime) -> bool:
+        return movie.description.endswith(AUTOTEST_MOVIE_TAG) and self._is_old(movie.created_at, now)
+
+    def _scan_users(self, now: datetime) -> list[Orphan]:
+        with self._admin_pool.lease() as admin:
+            return [
+                Orphan(ResourceKind.USER, user.id, user.email, user.created_at)
+                for user in admin.users_api.iter_users()
+                if self.is_orphan_user(user, now)
+            ]
+
+    def _scan_movies(self, published: bool, now: datetime) -> list[Orphan]:
+        params = {"published": str(published).lower()}
+        with self._admin_pool.lease() as admin:
+            return [
+                Orphan(ResourceKind.MOVIE, str(movie.id), movie.name, movie.created_at)
+                for movie in admin.movies_api.iter_movies(params, prefetch=self._concurrency)
+                if self.is_orphan_movie(movie, now)
+            ]
+
+    def find(self) -> list[Orphan]:
+        now = self._clock()
+        scans: list[Callable[[], list[Orphan]]] = [
+            lambda: self._scan_users(now),
+            lambda: self._scan_movies(True, now),
+            lambda: self._scan_movies(False, now),
+        ]
+        orphans: list[Orphan] = []
+        for result in run_batch(lambda scan: scan(), scans, len(scans)):
+            if result.result is None:
+                raise RuntimeError(f"Не удалось получить список данных для очистки: {result.error}")
+            orphans.extend(result.result)
+        return orphans
+
+    def sweep(self, dry_run: bool = False) -> list[Orphan]:
+        orphans = self.find()
+        self.logger.info(f"Найдено брошенных автотестами данных: {len(orphans)} (старше {self._min_age})")
+        if dry_run:
+            for orphan in orphans:
+                self.logger.info(
+                    f"[dry-run] {orphan.kind} {orphan.resource_id} '{orphan.label}' от {orphan.created_at}"
+                )
+            return orphans
+
+        registry = CleanupRegistry(self._admin_pool, concurrency=self._concurrency)
+        for orphan in orphans:
+            if orphan.kind is ResourceKind.USER:
+                registry.register_user(orphan.resource_id)
+            else:
+                registry.register_movie(orphan.resource_id)
+        registry.flush()
+        return orphans
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Удаление пользователей и фильмов, брошенных упавшими прогонами")
+    parser.add_argument("--dry-run", action="store_true", help="Только показать найденные данные, ничего не удалять")
+    parser.add_argument("--min-age-hours", type=float, default=settings.orphan_sweep_min_age_hours)
+    parser.add_argument("--concurrency", type=int, default=settings.bulk_concurrency)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    factory = ApiManagerFactory()
+
+    def login_as_admin(manager: ApiManager) -> None:
+        manager.auth_api.authenticate()
+
+    admin_pool = ApiManagerPool(factory.create, login_as_admin, session_factory=factory.create_session)
+    try:
+        sweeper = OrphanSweeper(admin_pool, timedelta(hours=args.min_age_hours), concurrency=args.concurrency)
+        sweeper.sweep(dry_run=args.dry_run)
+    finally:
+        admin_pool.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,26 @@
+from tests.clients.api_manager import ApiManager
+from tests.clients.api_manager_pool import ApiManagerPool
+
+
+def test_pool_resets_leased_sessions_and_reauthenticates_them() -> None:
+    authenticated: list[ApiManager] = []
+
+    def authenticate(manager: ApiManager) -> None:
+        authenticated.append(manager)
+        manager.session.headers["Authorization"] = "Bearer admin-token"
+
+    pool = ApiManagerPool(lambda session: ApiManager(session, base_url="https://api.test"), authenticate, size=2)
+    pool.warm_up()
+
+    with pool.lease() as manager:
+        manager.session.headers["X-Test"] = "dirty"
+        del manager.session.headers["Authorization"]
+
+    with pool.lease() as first, pool.lease() as second:
+        assert first is not second
+        for leased in (first, second):
+            assert leased.session.headers["Authorization"] == "Bearer admin-token"
+            assert "X-Test" not in leased.session.headers
+
+    assert len({id(manager) for manager in authenticated}) == 2
+    pool.close()
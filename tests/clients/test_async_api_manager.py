@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.async_api_manager import AsyncApiManager
+from tests.clients.auth_api import AuthAPI
+from tests.clients.token_manager import token_manager
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.movie_models import GenreId, Location, Movie
+from tests.models.request_models import MovieCreate
+from tests.models.response_models import MoviesList, UsersListResponse
+from tests.request.async_requester import gather_limited
+from tests.request.transport import TransportRequest, WSGITransport
+
+
+class _InFlightTransport(WSGITransport):
+    def __init__(self, app: FakeCinescopeBackend):
+        super().__init__(app)
+        self.in_flight = self.peak = 0
+        self._lock = threading.Lock()
+
+    def send(self, session: requests.Session, request: TransportRequest) -> requests.Response:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(0.01)
+            return super().send(session, request)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def fake_transport(fake_backend_app: FakeCinescopeBackend) -> _InFlightTransport:
+    return _InFlightTransport(fake_backend_app)
+
+
+def test_gather_limited_keeps_order_and_bounds_concurrency() -> None:
+    running = peak = 0
+
+    async def job(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (10 - value))
+        running -= 1
+        return value
+
+    assert asyncio.run(gather_limited((job(value) for value in range(10)), limit=3)) == list(range(10))
+    assert peak == 3
+
+
+def test_async_manager_creates_movies_concurrently(
+    fake_backend_app: FakeCinescopeBackend, fake_api_manager: ApiManager, fake_transport: _InFlightTransport
+) -> None:
+    payloads = [
+        MovieCreate(
+            name=f"Фильм {index}", description="Описание", price=100, location=Location.MSK, genreId=GenreId.DRAMA
+        )
+        for index in range(12)
+    ]
+
+    async def scenario(sync_manager: ApiManager) -> tuple[list, MoviesList]:
+        async with AsyncApiManager(sync_manager) as manager:
+            await manager.auth_api.login(fake_backend_app.admin_email, fake_backend_app.admin_password)
+            created = await gather_limited((manager.movies_api.create_movie(payload) for payload in payloads), limit=4)
+            movies = await manager.movies_api.get_movies({"pageSize": 20})
+        assert isinstance(movies, MoviesList)
+        return created, movies
+
+    created, movies = asyncio.run(scenario(fake_api_manager))
+
+    assert all(isinstance(movie, Movie) for movie in created)
+    assert [movie.name for movie in created] == [f"Фильм {index}" for index in range(12)]
+    assert movies.count == 12
+    assert 1 < fake_transport.peak <= 4
+
+
+def test_async_requests_rejected_together_share_one_relogin(
+    monkeypatch: pytest.MonkeyPatch, fake_backend_app: FakeCinescopeBackend, fake_api_manager: ApiManager
+) -> None:
+    token_manager.clear()
+    logins: list[str | None] = []
+    original_login = AuthAPI.login
+
+    def counting_login(self, email=None, password=None, expected_status=200):
+        logins.append(email)
+        return original_login(self, email, password, expected_status)
+
+    monkeypatch.setattr(AuthAPI, "login", counting_login)
+    fake_api_manager.auth_api.authenticate(fake_backend_app.admin_email, fake_backend_app.admin_password)
+    fake_backend_app._access_tokens.clear()
+
+    async def scenario() -> list:
+        async with AsyncApiManager(fake_api_manager) as manager:
+            return await gather_limited((manager.users_api.get_users(expected_status=200) for _ in range(8)), limit=8)
+
+    users = asyncio.run(scenario())
+
+    assert all(isinstance(page, UsersListResponse) for page in users)
+    assert logins == [fake_backend_app.admin_email, fake_backend_app.admin_email]
+    token_manager.clear()
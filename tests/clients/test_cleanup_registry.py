@@ -0,0 +1,88 @@
+import pytest
+from faker import Faker
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.clients.cleanup_registry import CleanupOutcome, CleanupRegistry, ResourceKind
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.movie_models import Movie
+from tests.models.response_models import GenreResponse
+from tests.models.user_models import User
+from tests.utils.data_generator import MovieDataGenerator, UserDataGenerator
+
+
+@pytest.fixture
+def registry(fake_admin_pool: ApiManagerPool) -> CleanupRegistry:
+    return CleanupRegistry(fake_admin_pool, concurrency=4)
+
+
+@pytest.fixture
+def movie(fake_admin_manager: ApiManager) -> Movie:
+    created = fake_admin_manager.movies_api.create_movie(
+        MovieDataGenerator.generate_valid_movie_payload(Faker("ru_RU"))
+    )
+    assert isinstance(created, Movie)
+    return created
+
+
+def test_cleanup_registry_flushes_in_dependency_order(
+    fake_backend_app: FakeCinescopeBackend,
+    fake_admin_manager: ApiManager,
+    fake_api_manager: ApiManager,
+    registry: CleanupRegistry,
+    movie: Movie,
+) -> None:
+    credentials, _ = UserDataGenerator.generate_user_payload(Faker("ru_RU"))
+    user = fake_admin_manager.users_api.create_user({**credentials.model_dump(by_alias=True), "verified": True})
+    genre = fake_admin_manager.movies_api.create_genre({"name": "Жанр для очистки"}, expected_status=201)
+    assert isinstance(user, User) and isinstance(genre, GenreResponse)
+    fake_api_manager.auth_api.login(credentials.email, credentials.password)
+    fake_api_manager.movies_api.create_review(movie.id, {"rating": 5, "text": "Отзыв"})
+
+    registry.register_user(user.id)
+    registry.register_genre(genre.id)
+    registry.register_movie(movie.id)
+    registry.register_review(movie.id, fake_api_manager)
+    report = registry.flush()
+
+    assert report.outcomes[ResourceKind.REVIEW][CleanupOutcome.DELETED] == 1
+    assert report.count(CleanupOutcome.DELETED) == 4 and report.count(CleanupOutcome.FAILED) == 0
+    assert movie.id not in fake_backend_app.movies and user.id not in fake_backend_app.users
+
+
+def test_cleanup_registry_deduplicates_and_treats_404_as_already_gone(registry: CleanupRegistry, movie: Movie) -> None:
+    registry.register_movie(movie.id)
+    registry.register_movie(movie.id)
+    registry.register_movie(999_999)
+    assert len(registry) == 2
+
+    report = registry.flush()
+
+    assert len(registry) == 0
+    assert report.outcomes[ResourceKind.MOVIE] == {CleanupOutcome.DELETED: 1, CleanupOutcome.ALREADY_GONE: 1}
+
+
+def test_empty_flush_reports_nothing(registry: CleanupRegistry) -> None:
+    assert registry.flush().outcomes == {}
+
+
+def test_flush_reviews_deletes_only_matching_reviews_while_author_is_alive(
+    fake_backend_app: FakeCinescopeBackend,
+    fake_admin_manager: ApiManager,
+    fake_api_manager: ApiManager,
+    registry: CleanupRegistry,
+    movie: Movie,
+) -> None:
+    credentials, _ = UserDataGenerator.generate_user_payload(Faker("ru_RU"))
+    fake_admin_manager.users_api.create_user({**credentials.model_dump(by_alias=True), "verified": True})
+    fake_api_manager.auth_api.login(credentials.email, credentials.password)
+    fake_api_manager.movies_api.create_review(movie.id, {"rating": 5, "text": "Отзыв"})
+    registry.register_review(movie.id, fake_api_manager)
+    registry.register_movie(movie.id)
+
+    assert registry.flush_reviews(movie_id=999_999).outcomes == {}
+    report = registry.flush_reviews(author=fake_api_manager)
+
+    assert report.outcomes == {ResourceKind.REVIEW: {CleanupOutcome.DELETED: 1}}
+    assert fake_backend_app.reviews[movie.id] == {}
+    assert len(registry) == 1
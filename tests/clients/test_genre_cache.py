@@ -0,0 +1,62 @@
+import pytest
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.genre_cache import GenreCache
+from tests.clients.movies_api import MoviesAPI
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.response_models import GenreResponse
+from tests.request.transport import TransportRequest, WSGITransport
+
+
+class _CountingTransport(WSGITransport):
+    def __init__(self, app: FakeCinescopeBackend):
+        super().__init__(app)
+        self.sent: list[str] = []
+
+    def send(self, session: requests.Session, request: TransportRequest) -> requests.Response:
+        self.sent.append(f"{request.method} {request.endpoint_template}")
+        return super().send(session, request)
+
+
+@pytest.fixture
+def fake_transport(fake_backend_app: FakeCinescopeBackend) -> _CountingTransport:
+    return _CountingTransport(fake_backend_app)
+
+
+@pytest.fixture(autouse=True)
+def genre_cache(monkeypatch: pytest.MonkeyPatch) -> GenreCache:
+    cache = GenreCache()
+    monkeypatch.setattr(MoviesAPI, "genre_cache", cache)
+    return cache
+
+
+def test_genres_are_served_from_cache(fake_api_manager: ApiManager, fake_transport: _CountingTransport) -> None:
+    genres = fake_api_manager.movies_api.get_genres()
+
+    assert isinstance(genres, list)
+    assert fake_api_manager.movies_api.get_genres() == genres
+    assert fake_api_manager.movies_api.get_genre_by_id(genres[0].id) == genres[0]
+    assert fake_transport.sent == ["GET /genres"]
+
+
+def test_genre_lookup_bypasses_cache_when_disabled_or_missing(
+    fake_api_manager: ApiManager, fake_transport: _CountingTransport
+) -> None:
+    genres = fake_api_manager.movies_api.get_genres()
+    assert isinstance(genres, list)
+
+    fake_api_manager.movies_api.get_genre_by_id(genres[0].id, use_cache=False)
+    fake_api_manager.movies_api.get_genre_by_id(999, expected_status=404)
+
+    assert fake_transport.sent == ["GET /genres", "GET /genres/{genre_id}", "GET /genres/{genre_id}"]
+
+
+def test_created_genre_invalidates_cache(fake_admin_manager: ApiManager, fake_transport: _CountingTransport) -> None:
+    fake_admin_manager.movies_api.get_genres()
+
+    created = fake_admin_manager.movies_api.create_genre({"name": "Документальный"})
+
+    assert isinstance(created, GenreResponse)
+    assert fake_admin_manager.movies_api.get_genre_by_id(created.id) == created
+    assert fake_transport.sent.count("GET /genres") == 2
@@ -0,0 +1,81 @@
+import pytest
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.movie_cache import MovieCache, movie_cache_for
+from tests.config import settings
+from tests.models.movie_models import MovieWithReviews
+
+
+@pytest.fixture
+def cached_reader(monkeypatch: pytest.MonkeyPatch, fake_api_manager: ApiManager) -> ApiManager:
+    monkeypatch.setattr(settings, "movie_cache_size", 8)
+    return fake_api_manager
+
+
+def _cache_stats(manager: ApiManager) -> tuple[int, int]:
+    cache = movie_cache_for(manager.session)
+    assert cache is not None, "Кэш фильмов не создан для сессии"
+    return cache.hits, cache.misses
+
+
+def test_lru_cache_evicts_least_recently_used_movie() -> None:
+    cache = MovieCache(maxsize=2)
+    movies = {
+        movie_id: MovieWithReviews.model_validate(
+            {
+                "id": movie_id,
+                "name": f"Фильм {movie_id}",
+                "price": 100,
+                "description": "Описание",
+                "imageUrl": None,
+                "location": "MSK",
+                "published": True,
+                "genreId": 1,
+                "genre": {"name": "Боевик"},
+                "createdAt": "2026-01-01T00:00:00.000Z",
+                "rating": 0,
+                "reviews": [],
+            }
+        )
+        for movie_id in (1, 2, 3)
+    }
+    cache.put(1, movies[1])
+    cache.put(2, movies[2])
+    assert cache.get("1") == movies[1]
+    cache.put(3, movies[3])
+
+    assert cache.get(2) is None
+    assert (cache.get(1), cache.get(3)) == (movies[1], movies[3])
+    assert (cache.hits, cache.misses, len(cache)) == (3, 1, 2)
+
+
+@pytest.mark.parametrize("fake_backend_app", [1], indirect=True)
+def test_movie_edit_invalidates_cached_entry(cached_reader: ApiManager, fake_admin_manager: ApiManager) -> None:
+    first = cached_reader.movies_api.get_movie_by_id(1)
+    assert cached_reader.movies_api.get_movie_by_id(1) == first
+
+    fake_admin_manager.movies_api.edit_movie(1, {"price": 999})
+    edited = cached_reader.movies_api.get_movie_by_id(1)
+
+    assert isinstance(edited, MovieWithReviews) and edited.price == 999
+    assert _cache_stats(cached_reader) == (1, 2)
+
+
+@pytest.mark.parametrize("fake_backend_app", [1], indirect=True)
+def test_new_review_invalidates_cached_entry(cached_reader: ApiManager, fake_admin_manager: ApiManager) -> None:
+    cached_reader.movies_api.get_movie_by_id(1)
+
+    fake_admin_manager.movies_api.create_review(1, {"rating": 5, "text": "Отлично"})
+    reviewed = cached_reader.movies_api.get_movie_by_id(1)
+
+    assert isinstance(reviewed, MovieWithReviews) and len(reviewed.reviews) == 1
+    assert _cache_stats(cached_reader) == (0, 2)
+
+
+@pytest.mark.parametrize("fake_backend_app", [1], indirect=True)
+def test_uncached_lookup_skips_cache(cached_reader: ApiManager) -> None:
+    cached_reader.movies_api.get_movie_by_id(1)
+
+    cached_reader.movies_api.get_movie_by_id(1, use_cache=False)
+
+    assert _cache_stats(cached_reader) == (0, 1)
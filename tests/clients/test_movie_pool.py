@@ -0,0 +1,115 @@
+import threading
+import time
+from collections.abc import Generator
+
+import pytest
+from faker import Faker
+
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.clients.movie_pool import MovieKind, MoviePool
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.movie_models import Movie
+from tests.request.attachments import http_exchange_buffer
+
+
+@pytest.fixture
+def movie_pool(fake_admin_pool: ApiManagerPool) -> Generator[MoviePool]:
+    pool = MoviePool(fake_admin_pool, Faker("ru_RU"), size=2, unpublished_size=1, concurrency=3)
+    pool.provision()
+    yield pool
+    pool.close()
+
+
+def test_movie_pool_provisions_published_and_unpublished_movies(
+    fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool
+) -> None:
+    assert sorted(movie["published"] for movie in fake_backend_app.movies.values()) == [False, True, True]
+
+
+def test_movie_pool_reuses_untouched_movie(fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool) -> None:
+    with movie_pool.lease() as untouched:
+        pass
+    movie_pool.drain()
+
+    with movie_pool.lease() as reused:
+        pass
+
+    assert reused.id == untouched.id
+    assert untouched.id in fake_backend_app.movies
+
+
+def test_movie_pool_replaces_mutated_movie(fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool) -> None:
+    with movie_pool.lease() as edited:
+        fake_backend_app.movies[edited.id]["price"] += 1
+    movie_pool.drain()
+
+    published = [movie["published"] for movie in fake_backend_app.movies.values()]
+    assert edited.id not in fake_backend_app.movies
+    assert published.count(True) == 2
+
+
+def test_movie_pool_replaces_movie_deleted_in_test(
+    fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool
+) -> None:
+    with movie_pool.lease(MovieKind.UNPUBLISHED) as deleted:
+        assert deleted.published is False
+        del fake_backend_app.movies[deleted.id]
+    movie_pool.drain()
+
+    published = [movie["published"] for movie in fake_backend_app.movies.values()]
+    assert published.count(False) == 1
+
+
+def test_movie_pool_shares_one_movie_as_independent_copies(
+    fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool
+) -> None:
+    first, second = movie_pool.shared(), movie_pool.shared()
+
+    assert first.id == second.id and first is not second
+    assert first.id in fake_backend_app.movies
+
+
+def test_movie_pool_close_deletes_every_owned_movie(
+    fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool
+) -> None:
+    with movie_pool.lease():
+        pass
+    movie_pool.shared()
+
+    movie_pool.close()
+
+    assert fake_backend_app.movies == {}
+
+
+def test_movie_pool_close_deletes_movies_created_by_slow_top_up(
+    monkeypatch: pytest.MonkeyPatch, fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool
+) -> None:
+    create_movie = movie_pool._create_movie
+    top_up_started = threading.Event()
+
+    def slow_create_movie(kind: MovieKind) -> Movie:
+        top_up_started.set()
+        time.sleep(0.3)
+        return create_movie(kind)
+
+    monkeypatch.setattr(movie_pool, "_create_movie", slow_create_movie)
+    monkeypatch.setattr(MoviePool, "CLOSE_TIMEOUT_SECONDS", 0.05)
+    with movie_pool.lease():
+        pass
+    assert top_up_started.wait(timeout=5)
+
+    movie_pool.close()
+
+    assert fake_backend_app.movies == {}
+
+
+def test_movie_pool_background_traffic_stays_out_of_test_exchange_buffer(
+    fake_backend_app: FakeCinescopeBackend, movie_pool: MoviePool
+) -> None:
+    http_exchange_buffer.clear()
+    with movie_pool.lease():
+        pass
+    movie_pool.drain()
+
+    assert len(fake_backend_app.movies) == 4
+    assert http_exchange_buffer.drain() == []
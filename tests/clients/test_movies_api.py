@@ -0,0 +1,50 @@
+import pytest
+
+from tests.clients.api_manager import ApiManager
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.movie_models import GenreId, Location, Movie
+from tests.models.request_models import MovieCreate
+
+seeded_backend = pytest.mark.parametrize("fake_backend_app", [23], indirect=True)
+
+
+def _movie_payload(name: str) -> MovieCreate:
+    return MovieCreate(name=name, description="Описание", price=100, location=Location.SPB, genreId=GenreId.ACTION)
+
+
+@seeded_backend
+def test_iter_movies_walks_all_pages(fake_backend_app: FakeCinescopeBackend, fake_api_manager: ApiManager) -> None:
+    movies = list(fake_api_manager.movies_api.iter_movies({"pageSize": 5, "createdAt": "asc"}))
+
+    assert [movie.id for movie in movies] == sorted(fake_backend_app.movies)
+
+
+@seeded_backend
+def test_iter_movies_starts_from_page_and_respects_max_pages(fake_api_manager: ApiManager) -> None:
+    everything = [movie.id for movie in fake_api_manager.movies_api.iter_movies({"pageSize": 5})]
+
+    capped = list(fake_api_manager.movies_api.iter_movies({"pageSize": 5, "page": 2}, max_pages=2))
+
+    assert [movie.id for movie in capped] == everything[5:15]
+
+
+def test_create_movies_reports_failed_items_in_order(fake_admin_manager: ApiManager) -> None:
+    payloads = [_movie_payload(f"Фильм {index % 9}") for index in range(10)]
+
+    created = fake_admin_manager.movies_api.create_movies(payloads, concurrency=4)
+
+    assert [result.item for result in created] == payloads
+    assert [isinstance(result.result, Movie) for result in created].count(True) == 9
+    assert [isinstance(result.error, AssertionError) for result in created].count(True) == 1
+
+
+def test_delete_movies_reports_missing_movie_as_error(
+    fake_backend_app: FakeCinescopeBackend, fake_admin_manager: ApiManager
+) -> None:
+    created = fake_admin_manager.movies_api.create_movies([_movie_payload(f"Фильм {index}") for index in range(3)])
+    movie_ids = [result.result.id for result in created if isinstance(result.result, Movie)]
+
+    deleted = fake_admin_manager.movies_api.delete_movies([*movie_ids, 999_999], concurrency=4)
+
+    assert [result.ok for result in deleted] == [True, True, True, False]
+    assert fake_backend_app.movies == {}
@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+import pytest
+from faker import Faker
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.clients.cleanup_registry import ResourceKind
+from tests.clients.orphan_sweeper import OrphanSweeper
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.movie_models import Movie
+from tests.models.user_models import User
+from tests.utils.data_generator import MovieDataGenerator, UserDataGenerator
+
+LONG_AGO = "2020-01-01T00:00:00.000Z"
+
+
+class _Seeder:
+    def __init__(self, backend: FakeCinescopeBackend, admin: ApiManager):
+        self._backend = backend
+        self._admin = admin
+        self._faker = Faker("ru_RU")
+
+    def user(self, email: str | None = None, old: bool = False) -> str:
+        credentials, _ = UserDataGenerator.generate_user_payload(self._faker)
+        if email is not None:
+            credentials.email = email
+        user = self._admin.users_api.create_user({**credentials.model_dump(by_alias=True), "verified": True})
+        assert isinstance(user, User)
+        if old:
+            self._backend.users[user.id]["createdAt"] = LONG_AGO
+        return user.id
+
+    def movie(self, published: bool = True, description: str | None = None, old: bool = False) -> int:
+        payload = MovieDataGenerator.generate_valid_movie_payload(self._faker)
+        payload.published = published
+        payload.description = description or payload.description
+        movie = self._admin.movies_api.create_movie(payload)
+        assert isinstance(movie, Movie)
+        if old:
+            self._backend.movies[movie.id]["createdAt"] = LONG_AGO
+        return movie.id
+
+
+@pytest.fixture
+def seeder(fake_backend_app: FakeCinescopeBackend, fake_admin_manager: ApiManager) -> _Seeder:
+    return _Seeder(fake_backend_app, fake_admin_manager)
+
+
+@pytest.fixture
+def sweeper(fake_admin_pool: ApiManagerPool) -> OrphanSweeper:
+    return OrphanSweeper(fake_admin_pool, timedelta(hours=1), concurrency=2)
+
+
+def test_dry_run_finds_old_autotest_data_without_deleting(
+    fake_backend_app: FakeCinescopeBackend, seeder: _Seeder, sweeper: OrphanSweeper
+) -> None:
+    old_user = seeder.user(old=True)
+    old_movies = [seeder.movie(True, old=True), seeder.movie(False, old=True)]
+
+    found = sweeper.sweep(dry_run=True)
+
+    assert {(orphan.kind, orphan.resource_id) for orphan in found} == {
+        (ResourceKind.USER, old_user),
+        *((ResourceKind.MOVIE, str(movie_id)) for movie_id in old_movies),
+    }
+    assert old_user in fake_backend_app.users and all(movie_id in fake_backend_app.movies for movie_id in old_movies)
+
+
+def test_sweep_deletes_old_autotest_data(
+    fake_backend_app: FakeCinescopeBackend, seeder: _Seeder, sweeper: OrphanSweeper
+) -> None:
+    old_user = seeder.user(old=True)
+    old_movies = [seeder.movie(True, old=True), seeder.movie(False, old=True)]
+
+    sweeper.sweep()
+
+    assert old_user not in fake_backend_app.users
+    assert not any(movie_id in fake_backend_app.movies for movie_id in old_movies)
+    assert sweeper.find() == []
+
+
+def test_sweep_keeps_fresh_and_foreign_data(
+    fake_backend_app: FakeCinescopeBackend, seeder: _Seeder, sweeper: OrphanSweeper
+) -> None:
+    fresh_user, foreign_user = seeder.user(), seeder.user("real.person@gmail.com", old=True)
+    fresh_movie, foreign_movie = seeder.movie(), seeder.movie(description="Обычный фильм", old=True)
+
+    sweeper.sweep()
+
+    assert {fresh_user, foreign_user} <= fake_backend_app.users.keys()
+    assert {fresh_movie, foreign_movie} <= fake_backend_app.movies.keys()
@@ -0,0 +1,29 @@
+import pytest
+
+from tests.clients.api_manager import ApiManager
+from tests.constants.payment_data import PAYMENT_CARD
+from tests.models.payment_models import PaymentsListResponse
+
+pytestmark = pytest.mark.parametrize("fake_backend_app", [1], indirect=True)
+
+
+@pytest.fixture
+def payments_admin(fake_admin_manager: ApiManager) -> ApiManager:
+    for amount in range(1, 24):
+        fake_admin_manager.payment_api.create_payment({"movieId": 1, "amount": amount, "card": PAYMENT_CARD})
+    return fake_admin_manager
+
+
+def test_iter_all_payments_streams_every_page_in_order(payments_admin: ApiManager) -> None:
+    streamed = list(payments_admin.payment_api.iter_all_payments({"pageSize": 5}, workers=3))
+
+    assert [payment.amount for payment in streamed] == list(range(23, 0, -1))
+
+
+def test_iter_all_payments_respects_start_page_and_max_pages(payments_admin: ApiManager) -> None:
+    first_page = payments_admin.payment_api.get_all_payments({"pageSize": 5})
+
+    capped = list(payments_admin.payment_api.iter_all_payments({"pageSize": 5, "page": 2}, max_pages=2))
+
+    assert isinstance(first_page, PaymentsListResponse) and first_page.page_count == 5
+    assert [payment.amount for payment in capped] == list(range(18, 8, -1))
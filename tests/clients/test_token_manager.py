@@ -0,0 +1,153 @@
+import base64
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.auth_api import AuthAPI
+from tests.clients.token_manager import (
+    AuthToken,
+    FileTokenCache,
+    TokenManager,
+    decode_jwt_expiry,
+    token_manager,
+)
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.response_models import LoginResponse, UsersListResponse
+from tests.request.reauthentication import session_reauthenticators
+
+
+def _make_jwt(expires_at: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": int(expires_at)}).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+def _login_response(access_token: str) -> LoginResponse:
+    return LoginResponse.model_validate(
+        {"accessToken": access_token, "user": {"id": "1", "email": "admin@test", "fullName": "Админ", "roles": []}}
+    )
+
+
+def test_decode_jwt_expiry_reads_exp_claim() -> None:
+    assert decode_jwt_expiry(_make_jwt(1_900_000_000)) == 1_900_000_000
+    assert decode_jwt_expiry("not-a-jwt") is None
+
+
+def test_authenticate_reuses_token_and_refreshes_it_before_expiry(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(token_manager, "cache", FileTokenCache(tmp_path))
+    token_manager.clear()
+    logins: list[str] = []
+    expiring_token = _make_jwt(time.time() + 10)
+    fresh_token = _make_jwt(time.time() + 3600)
+
+    def fake_login(self, email=None, password=None, expected_status=200):
+        logins.append(email)
+        return _login_response(expiring_token)
+
+    monkeypatch.setattr(AuthAPI, "login", fake_login)
+    monkeypatch.setattr(AuthAPI, "refresh_token", lambda self, expected_status=200: {"accessToken": fresh_token})
+
+    first = AuthAPI(requests.Session(), base_url="https://auth.test")
+    first.authenticate("admin@test", "secret")
+    second = AuthAPI(requests.Session(), base_url="https://auth.test")
+    second.authenticate("admin@test", "secret")
+
+    assert logins == ["admin@test"]
+    assert first.session.headers["Authorization"] == f"Bearer {expiring_token}"
+    assert second.session.headers["Authorization"] == f"Bearer {fresh_token}"
+    token_manager.clear()
+
+
+def test_file_token_cache_shares_tokens_between_managers(tmp_path: Path) -> None:
+    key = TokenManager.make_key("https://auth.test", "admin@test", "secret")
+    token = AuthToken.from_login(_login_response(_make_jwt(time.time() + 3600)), [])
+
+    writer = TokenManager(refresh_margin_seconds=60, cache=FileTokenCache(tmp_path))
+    with writer.locked(key):
+        writer.store(key, token)
+
+    reader = TokenManager(refresh_margin_seconds=60, cache=FileTokenCache(tmp_path))
+    shared = reader.get(key)
+    assert shared is not None
+    assert shared.access_token == token.access_token
+
+    other_password = TokenManager.make_key("https://auth.test", "admin@test", "other")
+    assert reader.get(other_password) is None
+
+
+def test_rejected_cached_token_is_invalidated_and_login_repeated(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_backend_app: FakeCinescopeBackend,
+    fake_api_manager: ApiManager,
+) -> None:
+    monkeypatch.setattr(token_manager, "cache", FileTokenCache(tmp_path))
+    token_manager.clear()
+    logins: list[str | None] = []
+    original_login = AuthAPI.login
+
+    def counting_login(self, email=None, password=None, expected_status=200):
+        logins.append(email)
+        return original_login(self, email, password, expected_status)
+
+    monkeypatch.setattr(AuthAPI, "login", counting_login)
+
+    fake_api_manager.auth_api.authenticate(fake_backend_app.admin_email, fake_backend_app.admin_password)
+    fake_backend_app._access_tokens.clear()
+
+    users = fake_api_manager.users_api.get_users(expected_status=200)
+    fake_backend_app._access_tokens.clear()
+    fake_api_manager.users_api.get_users(expected_status=401)
+
+    assert isinstance(users, UsersListResponse)
+    assert logins == [fake_backend_app.admin_email, fake_backend_app.admin_email]
+    token_manager.clear()
+
+
+def test_locked_is_reentrant_per_key_and_does_not_block_other_keys(tmp_path: Path) -> None:
+    manager = TokenManager(refresh_margin_seconds=60, cache=FileTokenCache(tmp_path))
+    admin = TokenManager.make_key("https://auth.test", "admin@test", "secret")
+    user = TokenManager.make_key("https://auth.test", "user@test", "secret")
+    other_key_locked = threading.Event()
+
+    def lock_other_key() -> None:
+        with manager.locked(user):
+            other_key_locked.set()
+
+    with manager.locked(admin), manager.locked(admin):
+        other = threading.Thread(target=lock_other_key)
+        other.start()
+        assert other_key_locked.wait(timeout=5)
+        other.join(timeout=5)
+
+
+def test_reauthentication_during_refresh_reenters_token_lock(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(token_manager, "cache", FileTokenCache(tmp_path))
+    token_manager.clear()
+    logins: list[str] = []
+    fresh_token = _make_jwt(time.time() + 3600)
+
+    def fake_login(self, email=None, password=None, expected_status=200):
+        logins.append(email)
+        return _login_response(_make_jwt(time.time() + 10))
+
+    def refresh_rejected_then_reauthenticated(self, expected_status=200):
+        assert session_reauthenticators.reauthenticate(self.session, self.session.headers["Authorization"])
+        return {"accessToken": fresh_token}
+
+    monkeypatch.setattr(AuthAPI, "login", fake_login)
+    monkeypatch.setattr(AuthAPI, "refresh_token", refresh_rejected_then_reauthenticated)
+
+    auth_api = AuthAPI(requests.Session(), base_url="https://auth.test")
+    auth_api.authenticate("admin@test", "secret")
+    auth_api.authenticate("admin@test", "secret")
+
+    assert logins == ["admin@test", "admin@test"]
+    assert auth_api.session.headers["Authorization"] == f"Bearer {fresh_token}"
+    token_manager.clear()
@@ -0,0 +1,71 @@
+from collections.abc import Callable, Generator
+
+import pytest
+from faker import Faker
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.clients.user_pool import UserPool
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.response_models import LoginResponse
+
+
+@pytest.fixture
+def user_pool(fake_admin_pool: ApiManagerPool, fake_manager_factory: Callable[[], ApiManager]) -> Generator[UserPool]:
+    pool = UserPool(fake_admin_pool, fake_manager_factory, Faker("ru_RU"), size=3, concurrency=3)
+    pool.provision()
+    yield pool
+    pool.close()
+
+
+def test_user_pool_provisions_users_up_front(fake_backend_app: FakeCinescopeBackend, user_pool: UserPool) -> None:
+    assert len(fake_backend_app.users) == 4
+
+
+def test_user_pool_leases_distinct_users_that_can_log_in(user_pool: UserPool, fake_api_manager: ApiManager) -> None:
+    with user_pool.lease() as first, user_pool.lease() as second:
+        login = fake_api_manager.auth_api.login(second.credentials.email, second.credentials.password)
+
+    assert first.user_id != second.user_id
+    assert isinstance(login, LoginResponse) and login.user.roles == ["USER"]
+
+
+def test_user_pool_resets_user_state_on_release(fake_backend_app: FakeCinescopeBackend, user_pool: UserPool) -> None:
+    with user_pool.lease() as leased:
+        fake_backend_app.users[leased.user_id]["banned"] = True
+
+    assert fake_backend_app.users[leased.user_id]["banned"] is False
+
+
+@pytest.mark.parametrize("changed_field", ["password", "fullName"])
+def test_user_pool_drops_user_whose_credentials_changed(
+    fake_backend_app: FakeCinescopeBackend, user_pool: UserPool, changed_field: str
+) -> None:
+    with user_pool.lease() as changed:
+        if changed_field == "password":
+            fake_backend_app._passwords[changed.user_id] = "Changed-Passw0rd"
+        else:
+            fake_backend_app.users[changed.user_id][changed_field] = "Другое Имя"
+
+    with user_pool.lease() as first, user_pool.lease() as second, user_pool.lease() as third:
+        leased = {first.user_id, second.user_id, third.user_id}
+
+    assert changed.user_id not in fake_backend_app.users
+    assert changed.user_id not in leased
+
+
+def test_user_pool_replaces_user_deleted_in_test(fake_backend_app: FakeCinescopeBackend, user_pool: UserPool) -> None:
+    with user_pool.lease() as deleted:
+        del fake_backend_app.users[deleted.user_id]
+
+    with user_pool.lease(), user_pool.lease(), user_pool.lease():
+        assert len(fake_backend_app.users) == 4
+
+
+def test_user_pool_close_deletes_pooled_users(fake_backend_app: FakeCinescopeBackend, user_pool: UserPool) -> None:
+    with user_pool.lease():
+        pass
+
+    user_pool.close()
+
+    assert [user["email"] for user in fake_backend_app.users.values()] == [fake_backend_app.admin_email]
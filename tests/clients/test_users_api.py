@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+import pytest
+
+from tests.clients.api_manager import ApiManager
+from tests.fake_backend.app import FakeCinescopeBackend
+from tests.models.user_models import User
+
+
+@pytest.fixture
+def users_admin(fake_admin_manager: ApiManager) -> ApiManager:
+    for index in range(11):
+        fake_admin_manager.users_api.create_user(
+            {"email": f"user{index}@cinescope.test", "fullName": "Тестовый Пользователь", "password": "Passw0rd"}
+        )
+    return fake_admin_manager
+
+
+def test_iter_users_walks_all_pages(fake_backend_app: FakeCinescopeBackend, users_admin: ApiManager) -> None:
+    everyone = list(users_admin.users_api.iter_users({"pageSize": 5}))
+
+    assert sorted(user.email for user in everyone) == sorted(user["email"] for user in fake_backend_app.users.values())
+
+
+def test_iter_users_stops_on_predicate_and_validates_lazily(users_admin: ApiManager) -> None:
+    everyone = list(users_admin.users_api.iter_users({"pageSize": 5}))
+
+    with patch.object(User, "model_validate", wraps=User.model_validate) as validate:
+        users = users_admin.users_api.iter_users(
+            {"pageSize": 5}, stop_when=lambda user: user.email == everyone[6].email
+        )
+        found = [user.email for user in users]
+
+    assert found == [user.email for user in everyone[:7]]
+    assert validate.call_count == 7
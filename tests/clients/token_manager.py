@@ -0,0 +1,188 @@
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from requests.cookies import RequestsCookieJar
+
+from tests.config import settings
+from tests.models.response_models import LoginResponse
+from tests.utils.file_lock import FileLock
+
+type TokenKey = tuple[str, str, str]
+type StoredCookie = dict[str, str]
+
+
+def decode_jwt_expiry(access_token: str) -> float | None:
+    try:
+        payload_segment = access_token.split(".")[1]
+        payload = base64.urlsafe_b64decode(payload_segment + "=" * (-len(payload_segment) % 4))
+        expiry = json.loads(payload).get("exp")
+    except (IndexError, ValueError, binascii.Error, AttributeError):
+        return None
+    return float(expiry) if isinstance(expiry, int | float) else None
+
+
+def export_cookies(jar: RequestsCookieJar) -> list[StoredCookie]:
+    return [
+        {"name": cookie.name, "value": cookie.value or "", "domain": cookie.domain, "path": cookie.path}
+        for cookie in jar
+    ]
+
+
+def import_cookies(jar: RequestsCookieJar, cookies: list[StoredCookie]) -> None:
+    for cookie in cookies:
+        jar.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+
+
+@dataclass(slots=True)
+class AuthToken:
+    login_response: LoginResponse
+    expires_at: float | None
+    cookies: list[StoredCookie] = field(default_factory=list)
+
+    @classmethod
+    def from_login(cls, login_response: LoginResponse, cookies: list[StoredCookie]) -> "AuthToken":
+        return cls(login_response, decode_jwt_expiry(login_response.access_token), cookies)
+
+    @property
+    def access_token(self) -> str:
+        return self.login_response.access_token
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.expires_at is not None and self.expires_at - time.time() <= seconds
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_within(0)
+
+
+@dataclass(slots=True)
+class _KeyLock:
+    thread_lock: threading.RLock = field(default_factory=threading.RLock)
+    depth: int = 0
+    file_lock: FileLock | None = None
+
+
+class FileTokenCache:
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _path(self, key: TokenKey) -> Path:
+        base_url, email, _ = key
+        digest = hashlib.sha256(f"{base_url}|{email}".encode()).hexdigest()[:32]
+        return self.directory / f"{digest}.json"
+
+    def lock(self, key: TokenKey) -> FileLock:
+        return FileLock(self._path(key).with_suffix(".lock"))
+
+    def load(self, key: TokenKey) -> AuthToken | None:
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("password_hash") != key[2]:
+            return None
+        try:
+            login_response = LoginResponse.model_validate(entry["login_response"])
+        except (KeyError, ValueError):
+            return None
+        return AuthToken(login_response, entry.get("expires_at"), entry.get("cookies", []))
+
+    def save(self, key: TokenKey, token: AuthToken) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "password_hash": key[2],
+            "login_response": token.login_response.model_dump(mode="json", by_alias=True),
+            "expires_at": token.expires_at,
+            "cookies": token.cookies,
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: TokenKey) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class TokenManager:
+    def __init__(self, refresh_margin_seconds: float, cache: FileTokenCache | None = None):
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.cache = cache
+        self._tokens: dict[TokenKey, AuthToken] = {}
+        self._key_locks: dict[TokenKey, _KeyLock] = {}
+        self._lock = threading.RLock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def make_key(base_url: str, email: str, password: str) -> TokenKey:
+        return base_url, email.lower(), hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def locked(self, key: TokenKey) -> Generator[None]:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, _KeyLock())
+        with key_lock.thread_lock:
+            if key_lock.depth == 0 and self.cache is not None:
+                key_lock.file_lock = self.cache.lock(key)
+                key_lock.file_lock.acquire()
+            key_lock.depth += 1
+            try:
+                yield
+            finally:
+                key_lock.depth -= 1
+                if key_lock.depth == 0 and key_lock.file_lock is not None:
+                    file_lock, key_lock.file_lock = key_lock.file_lock, None
+                    file_lock.release()
+
+    def get(self, key: TokenKey) -> AuthToken | None:
+        with self._lock:
+            token = self._tokens.get(key)
+            if self.cache is not None and (token is None or self.needs_refresh(token)):
+                cached = self.cache.load(key)
+                if cached is not None and (token is None or (cached.expires_at or 0) > (token.expires_at or 0)):
+                    self._tokens[key] = token = cached
+        if token is not None and token.is_expired:
+            self.invalidate(key)
+            return None
+        return token
+
+    def needs_refresh(self, token: AuthToken) -> bool:
+        return token.expires_within(self.refresh_margin_seconds)
+
+    def store(self, key: TokenKey, token: AuthToken) -> None:
+        with self._lock:
+            self._tokens[key] = token
+            if self.cache is not None:
+                self.cache.save(key, token)
+
+    def invalidate(self, key: TokenKey, access_token: str | None = None) -> None:
+        with self._lock:
+            if access_token is not None:
+                current = self._tokens.get(key) or (self.cache.load(key) if self.cache is not None else None)
+                if current is not None and current.access_token != access_token:
+                    return
+            self._tokens.pop(key, None)
+            if self.cache is not None:
+                self.cache.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+
+token_manager = TokenManager(
+    refresh_margin_seconds=settings.token_refresh_margin_seconds,
+    cache=FileTokenCache(Path(settings.token_cache_dir)) if settings.token_cache_enabled else None,
+)
@@ -0,0 +1,143 @@
+import logging
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from faker import Faker
+
+from tests.clients.api_manager import ApiManager
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.models.request_models import UserCreate
+from tests.models.response_models import LoginResponse
+from tests.models.user_models import User
+from tests.utils.concurrency import run_batch
+from tests.utils.data_generator import UserDataGenerator
+
+USER_BASELINE_STATE = {"roles": ["USER"], "verified": True, "banned": False}
+
+
+@dataclass(slots=True, frozen=True)
+class PooledUser:
+    user_id: str
+    credentials: UserCreate
+
+
+class UserPool:
+    def __init__(
+        self,
+        admin_pool: ApiManagerPool,
+        manager_factory: Callable[[], ApiManager],
+        faker: Faker,
+        size: int = 4,
+        concurrency: int = 4,
+    ):
+        self._admin_pool = admin_pool
+        self._manager_factory = manager_factory
+        self._faker = faker
+        self._size = size
+        self._concurrency = concurrency
+        self._idle: list[PooledUser] = []
+        self._owned: dict[str, PooledUser] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _create_user(self, credentials: UserCreate) -> PooledUser:
+        payload = {**credentials.model_dump(by_alias=True), "verified": True, "banned": False}
+        with self._admin_pool.lease() as admin:
+            user = admin.users_api.create_user(payload, expected_status=201)
+        assert isinstance(user, User), f"Не удалось создать пользователя пула {credentials.email}"
+        pooled = PooledUser(user_id=user.id, credentials=credentials)
+        with self._lock:
+            self._owned[pooled.user_id] = pooled
+        return pooled
+
+    def provision(self) -> None:
+        with self._lock:
+            missing = self._size - len(self._idle)
+        if missing <= 0:
+            return
+        credentials = [UserDataGenerator.generate_user_payload(self._faker)[0] for _ in range(missing)]
+        results = run_batch(self._create_user, credentials, self._concurrency)
+        created = [result.result for result in results if result.result is not None]
+        with self._lock:
+            self._idle.extend(created)
+        for result in results:
+            if result.error is not None:
+                self.logger.warning(f"Пользователь пула {result.item.email} не создан: {result.error}")
+        self.logger.info(f"Пул пользователей подготовлен: {len(created)} из {missing}")
+
+    def acquire(self) -> PooledUser:
+        with self._lock:
+            pooled = self._idle.pop() if self._idle else None
+        if pooled is None:
+            pooled = self._create_user(UserDataGenerator.generate_user_payload(self._faker)[0])
+        return pooled
+
+    def release(self, pooled: PooledUser) -> None:
+        if not self._reset(pooled):
+            with self._lock:
+                self._owned.pop(pooled.user_id, None)
+            return
+        if not self._can_login(pooled):
+            self.logger.warning(
+                f"Пользователь пула {pooled.credentials.email} не входит с исходными данными, удаляется"
+            )
+            self._discard(pooled)
+            return
+        with self._lock:
+            self._idle.append(pooled)
+
+    @contextmanager
+    def lease(self) -> Generator[PooledUser]:
+        pooled = self.acquire()
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def _reset(self, pooled: PooledUser) -> bool:
+        try:
+            with self._admin_pool.lease() as admin:
+                admin.users_api.edit_user(pooled.user_id, dict(USER_BASELINE_STATE), expected_status=200)
+        except AssertionError:
+            self.logger.warning(f"Пользователь пула {pooled.credentials.email} не восстановлен и исключен из пула")
+            return False
+        return True
+
+    def _can_login(self, pooled: PooledUser) -> bool:
+        manager = self._manager_factory()
+        try:
+            response = manager.auth_api.login(
+                pooled.credentials.email, pooled.credentials.password, expected_status=200
+            )
+        except AssertionError:
+            return False
+        finally:
+            manager.session.close()
+        return (
+            isinstance(response, LoginResponse)
+            and response.user.id == pooled.user_id
+            and response.user.full_name == pooled.credentials.full_name
+        )
+
+    def _discard(self, pooled: PooledUser) -> None:
+        with self._lock:
+            self._owned.pop(pooled.user_id, None)
+        try:
+            self._delete_user(pooled)
+        except AssertionError:
+            self.logger.warning(f"Не удалось удалить пользователя пула {pooled.credentials.email}")
+
+    def _delete_user(self, pooled: PooledUser) -> None:
+        with self._admin_pool.lease() as admin:
+            admin.users_api.delete_user(pooled.user_id, expected_status=200)
+
+    def close(self) -> None:
+        with self._lock:
+            owned, self._owned, self._idle = list(self._owned.values()), {}, []
+        results = run_batch(self._delete_user, owned, self._concurrency)
+        failed = [result.item.user_id for result in results if not result.ok]
+        if failed:
+            self.logger.warning(f"Не удалось удалить пользователей пула: {failed}")
+        self.logger.info(f"Пул пользователей удален: {len(owned) - len(failed)} из {len(owned)}")
@@ -1,27 +1,38 @@
 import logging
+from collections.abc import Callable, Generator
+from typing import Any
 
 import requests
 
-from tests.constants.endpoints import USER_BY_ID_ENDPOINT, USER_BY_ID_OR_EMAIL_ENDPOINT, USERS_ENDPOINT
+from tests.constants.endpoints import USER_BY_ID_ENDPOINT, USER_BY_ID_OR_EMAIL_ENDPOINT, USERS_ENDPOINT, Service
 from tests.models.response_models import ErrorResponse, UsersListResponse
 from tests.models.user_models import User
 from tests.request.custom_requester import CustomRequester
+from tests.request.transport import Transport
 
 type UsersListApiResponse = UsersListResponse | ErrorResponse
 type UserApiResponse = User | ErrorResponse | None
 
 
+def _unwrap_users_payload(data: Any) -> Any:
+    if isinstance(data, list) and data and isinstance(data[0], dict) and "users" in data[0]:
+        return data[0]
+    return data
+
+
 class UsersAPI(CustomRequester):
-    def __init__(self, session: requests.Session, base_url: str) -> None:
-        super().__init__(session, base_url=base_url)
+    service = Service.AUTH
+
+    def __init__(self, session: requests.Session, base_url: str, transport: Transport | None = None) -> None:
+        super().__init__(session, base_url=base_url, transport=transport)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def create_user(self, user_data: dict, expected_status: int = 201) -> UserApiResponse:
         self.logger.info("Попытка создания пользователя")
         response = self.post(USERS_ENDPOINT, json=user_data, expected_status=expected_status)
         if response.ok:
-            return User.model_validate(response.json())
-        return ErrorResponse.model_validate(response.json())
+            return response.parse(User)
+        return response.parse(ErrorResponse)
 
     def get_user(self, id_or_email: str, expected_status: int = 200) -> UserApiResponse:
         self.logger.info(f"Попытка получения пользователя {id_or_email}")
@@ -29,24 +40,49 @@ def get_user(self, id_or_email: str, expected_status: int = 200) -> UserApiRespo
             USER_BY_ID_OR_EMAIL_ENDPOINT.format(id_or_email=id_or_email), expected_status=expected_status
         )
         if response.ok:
-            return User.model_validate(response.json())
-        return ErrorResponse.model_validate(response.json())
+            return response.parse(User)
+        return response.parse(ErrorResponse)
 
     def get_users(self, params: dict | None = None, expected_status: int = 200) -> UsersListApiResponse:
         self.logger.info("Попытка получения списка пользователей")
         response = self.get(USERS_ENDPOINT, params=params, expected_status=expected_status)
         if response.ok:
-            data = response.json()
+            data = _unwrap_users_payload(response.json())
             if isinstance(data, list):
-                if not data:
-                    return UsersListResponse(users=[], count=0, page=1, pageSize=0)
-                if isinstance(data[0], dict) and "users" in data[0]:
-                    data = data[0]
-                else:
-                    users = [User.model_validate(item) for item in data]
-                    return UsersListResponse(users=users, count=len(users), page=1, pageSize=len(users))
+                users = [User.model_validate(item) for item in data]
+                return UsersListResponse(users=users, count=len(users), page=1, pageSize=len(users))
             return UsersListResponse.model_validate(data)
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
+
+    def iter_users(
+        self,
+        params: dict | None = None,
+        *,
+        stop_when: Callable[[User], bool] | None = None,
+        max_pages: int | None = None,
+    ) -> Generator[User]:
+        query = dict(params or {})
+        page = int(query.pop("page", 1))
+        pages_read = 0
+        while max_pages is None or pages_read < max_pages:
+            self.logger.info(f"Получение страницы {page} списка пользователей")
+            response = self.get(USERS_ENDPOINT, params={**query, "page": page}, expected_status=200)
+            data = _unwrap_users_payload(response.json())
+            items = data if isinstance(data, list) else data.get("users", [])
+            pages_read += 1
+            for item in items:
+                user = User.model_validate(item)
+                yield user
+                if stop_when is not None and stop_when(user):
+                    return
+
+            if isinstance(data, list) or not items:
+                return
+            page_size = data.get("pageSize") or len(items)
+            count = data.get("count")
+            if len(items) < page_size or (count is not None and page * page_size >= count):
+                return
+            page += 1
 
     def edit_user(self, user_id: str, user_data: dict, expected_status: int = 200) -> UserApiResponse:
         self.logger.info(f"Попытка редактирования пользователя {user_id}")
@@ -57,13 +93,13 @@ def edit_user(self, user_id: str, user_data: dict, expected_status: int = 200) -
             data = response.json()
             data.setdefault("id", user_id)
             return User.model_validate(data)
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
 
-    def delete_user(self, user_id: str, expected_status: int = 200) -> UserApiResponse:
+    def delete_user(self, user_id: str, expected_status: int | None = 200) -> UserApiResponse:
         self.logger.info(f"Попытка удаления пользователя {user_id}")
         response = self.delete(USER_BY_ID_ENDPOINT.format(user_id=user_id), expected_status=expected_status)
         if response.ok:
             if response.content:
-                return User.model_validate(response.json())
+                return response.parse(User)
             return None
-        return ErrorResponse.model_validate(response.json())
+        return response.parse(ErrorResponse)
@@ -1,3 +1,7 @@
+import os
+import tempfile
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,6 +15,57 @@ class Settings(BaseSettings):
     admin_email: str | None = Field(default=None)
     admin_password: str | None = Field(default=None)
 
+    http_attachments_mode: Literal["always", "on_failure", "off"] = Field(default="on_failure")
+    http_attachments_buffer_size: int = Field(default=50, ge=1)
+
+    api_pool_maxsize: int = Field(default=10, ge=1)
+    auth_pool_maxsize: int = Field(default=4, ge=1)
+    payment_pool_maxsize: int = Field(default=4, ge=1)
+    http_pool_block: bool = Field(default=True)
+    async_http_max_workers: int = Field(default=16, ge=1)
+    async_http_concurrency: int = Field(default=8, ge=1)
+    bulk_concurrency: int = Field(default=8, ge=1)
+    bulk_rate_limit_per_second: float = Field(default=0.0, ge=0)
+    genre_cache_enabled: bool = Field(default=True)
+    movie_cache_size: int = Field(default=0, ge=0)
+
+    endpoint_timeouts: dict[str, tuple[float, float]] = Field(default_factory=dict)
+
+    retry_max_attempts: int = Field(default=3, ge=1)
+    retry_backoff_base_seconds: float = Field(default=0.5, ge=0)
+    retry_backoff_max_seconds: float = Field(default=8.0, ge=0)
+    retry_budget_ratio: float = Field(default=0.2, ge=0)
+    retry_budget_capacity: float = Field(default=10.0, ge=0)
+
+    circuit_breaker_enabled: bool = Field(default=True)
+    circuit_breaker_failure_threshold: int = Field(default=3, ge=1)
+    circuit_breaker_reset_timeout_seconds: float = Field(default=30.0, ge=0)
+    circuit_breaker_skip_tests: bool = Field(default=False)
+
+    admin_session_pool_size: int = Field(default=2, ge=1)
+    user_pool_size: int = Field(default=4, ge=0)
+    movie_pool_size: int = Field(default=4, ge=0)
+    movie_pool_unpublished_size: int = Field(default=1, ge=0)
+    orphan_sweep_min_age_hours: float = Field(default=24.0, ge=0)
+    orphan_sweep_on_start: bool = Field(default=False)
+    token_refresh_margin_seconds: float = Field(default=60.0, ge=0)
+    token_cache_enabled: bool = Field(default=False)
+    token_cache_dir: str = Field(default=os.path.join(tempfile.gettempdir(), "cinescope-autotests", "tokens"))
+
+    fake_backend: bool = Field(default=False)
+    fake_backend_scenario: str | None = Field(default=None)
+
+    http_cassette_mode: Literal["off", "record", "replay"] = Field(default="off")
+    http_cassette_dir: str = Field(default="cassettes")
+    http_cassette_ignore_fields: list[str] = Field(default=["password", "passwordRepeat"])
+    http_cassette_ignore_patterns: list[str] = Field(
+        default=[
+            r"autotest-[0-9a-f]+@[\w.-]+",
+            r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",
+            r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?",
+        ]
+    )
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
 
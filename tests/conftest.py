@@ -1,19 +1,36 @@
+import json
 import logging
 import os
 from collections.abc import Generator
+from datetime import timedelta
 from pathlib import Path
 
 import allure
 import pytest
-import requests
 from faker import Faker
 
-from tests.clients.api_manager import ApiManager
-from tests.constants.endpoints import BASE_URL
+from tests.clients.api_manager import ApiManager, ApiManagerFactory
+from tests.clients.api_manager_pool import ApiManagerPool
+from tests.clients.async_api_manager import AsyncApiManager
+from tests.clients.cleanup_registry import CleanupRegistry
+from tests.clients.movie_cache import movie_cache_stats
+from tests.clients.movie_pool import MovieKind, MoviePool
+from tests.clients.orphan_sweeper import OrphanSweeper
+from tests.clients.user_pool import UserPool
+from tests.config import settings
 from tests.constants.log_messages import LogMessages
+from tests.fake_backend.faults import FaultInjector, FaultScenario
+from tests.fake_backend.server import FakeBackendServer
 from tests.models.movie_models import Movie
 from tests.models.request_models import MovieCreate, UserCreate
+from tests.models.response_models import LoginResponse
 from tests.models.user_models import User
+from tests.request.attachments import http_exchange_buffer
+from tests.request.cassette import cassette_recorder
+from tests.request.circuit_breaker import CircuitOpenError
+from tests.request.connection_pool import connection_pools
+from tests.request.metrics import RequestMetrics, build_latency_report, request_metrics
+from tests.request.retry_policy import retry_stats
 from tests.utils.data_generator import MovieDataGenerator, UserDataGenerator
 
 LOGGER = logging.getLogger(__name__)
@@ -47,6 +64,58 @@ def allure_layer_labels(request):
     allure.dynamic.sub_suite(_infer_allure_sub_suite(path))
 
 
+HTTP_METRICS_DIR = Path("logs") / "http_metrics"
+HTTP_LATENCY_REPORT_PATH = Path("logs") / "http_latency_report.json"
+
+
+def _xdist_worker_id() -> str | None:
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def _new_faker(seed: str) -> Faker:
+    faker = Faker("ru_RU")
+    if cassette_recorder.enabled:
+        faker.seed_instance(f"{seed}:{_xdist_worker_id()}")
+    return faker
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fake-backend",
+        action="store_true",
+        default=settings.fake_backend,
+        help="Запускать API тесты против локального in-memory backend вместо dev стенда",
+    )
+    parser.addoption(
+        "--sweep-orphans",
+        action="store_true",
+        default=settings.orphan_sweep_on_start,
+        help="Перед тестами удалить пользователей и фильмы, оставшиеся от упавших прогонов",
+    )
+
+
+class SharedFixtureCassette:
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        if fixturedef.scope == "function":
+            return (yield)
+        fixturedef.addfinalizer(cassette_recorder.exit_shared)
+        cassette_recorder.enter_shared()
+        try:
+            return (yield)
+        finally:
+            cassette_recorder.exit_shared()
+            fixturedef.addfinalizer(cassette_recorder.enter_shared)
+
+
+def pytest_configure(config):
+    if cassette_recorder.enabled:
+        config.pluginmanager.register(SharedFixtureCassette(), "shared_fixture_cassette")
+    if _xdist_worker_id() is None and HTTP_METRICS_DIR.exists():
+        for stale_samples in HTTP_METRICS_DIR.glob("*.json"):
+            stale_samples.unlink()
+
+
 def pytest_sessionstart(session):
     logs_dir = "logs"
     if not os.path.exists(logs_dir):
@@ -59,19 +128,88 @@ def pytest_sessionstart(session):
     LOGGER.info(LogMessages.General.SESSION_START)
 
 
+def pytest_sessionfinish(session, exitstatus):
+    retry_stats.log_summary()
+    movie_cache_stats.log_summary()
+
+    worker_id = _xdist_worker_id()
+    cassette_recorder.finish_session(worker_id or "main")
+    if worker_id is not None:
+        request_metrics.dump(HTTP_METRICS_DIR / f"{worker_id}.json")
+        return
+
+    request_metrics.merge(RequestMetrics.load(sorted(HTTP_METRICS_DIR.glob("*.json"))))
+    endpoints = request_metrics.endpoints()
+    if endpoints:
+        HTTP_LATENCY_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        HTTP_LATENCY_REPORT_PATH.write_text(
+            json.dumps(build_latency_report(endpoints), indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+        LOGGER.info(f"Отчет по латентности HTTP запросов сохранен в {HTTP_LATENCY_REPORT_PATH}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_latency_report() -> Generator[None]:
+    yield
+    endpoints = request_metrics.endpoints()
+    if endpoints:
+        allure.attach(
+            body=json.dumps(build_latency_report(endpoints), indent=2, ensure_ascii=False),
+            name="HTTP latency report",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
 @pytest.fixture(scope="session")
 def faker_instance() -> Faker:
-    return Faker("ru_RU")
+    return _new_faker("faker_instance")
+
+
+@pytest.fixture(autouse=True)
+def seed_faker_for_cassettes(request: pytest.FixtureRequest) -> None:
+    if cassette_recorder.enabled:
+        faker: Faker = request.getfixturevalue("faker_instance")
+        faker.seed_instance(request.node.nodeid)
+        faker.unique.clear()
+
+
+@pytest.fixture(scope="session")
+def fake_backend() -> Generator[FakeBackendServer]:
+    faults = None
+    if settings.fake_backend_scenario:
+        faults = FaultInjector(FaultScenario.from_file(settings.fake_backend_scenario))
+    with FakeBackendServer(faults=faults) as server, pytest.MonkeyPatch.context() as monkeypatch:
+        for setting, url in server.base_urls.items():
+            monkeypatch.setattr(settings, setting, url)
+        monkeypatch.setattr(settings, "admin_email", server.app.admin_email)
+        monkeypatch.setattr(settings, "admin_password", server.app.admin_password)
+        yield server
+
+
+@pytest.fixture(scope="session")
+def api_manager_factory(request: pytest.FixtureRequest) -> Generator[ApiManagerFactory]:
+    if request.config.getoption("--fake-backend"):
+        request.getfixturevalue("fake_backend")
+    factory = ApiManagerFactory(
+        connection_pools,
+        base_url=settings.base_url,
+        base_auth_url=settings.base_auth_url,
+        base_payment_url=settings.base_payment_url,
+    )
+    try:
+        yield factory
+    finally:
+        connection_pools.log_stats()
+        connection_pools.close()
 
 
 @pytest.fixture(scope="function")
-def api_manager() -> Generator[ApiManager]:
-    session = requests.Session()
-    manager = ApiManager(session, base_url=BASE_URL)
+def api_manager(api_manager_factory: ApiManagerFactory) -> Generator[ApiManager]:
+    manager = api_manager_factory.create()
     try:
         yield manager
     finally:
-        session.close()
+        manager.session.close()
 
 
 @pytest.fixture()
@@ -89,66 +227,90 @@ def user_credentials_ui(faker_instance) -> tuple[UserCreate, str]:
     return UserDataGenerator.generate_user_payload(faker_instance)
 
 
+def _login_as_admin(manager: ApiManager) -> None:
+    manager.auth_api.authenticate()
+
+
+@pytest.fixture(scope="session")
+def admin_api_manager_pool(api_manager_factory: ApiManagerFactory) -> Generator[ApiManagerPool]:
+    pool = ApiManagerPool(
+        api_manager_factory.create,
+        _login_as_admin,
+        size=settings.admin_session_pool_size,
+        session_factory=api_manager_factory.create_session,
+    )
+    try:
+        pool.warm_up()
+        yield pool
+    finally:
+        pool.close()
+
+
+@pytest.fixture(scope="function")
+def admin_api_manager(admin_api_manager_pool: ApiManagerPool) -> Generator[ApiManager]:
+    with admin_api_manager_pool.lease() as manager:
+        yield manager
+
+
 @pytest.fixture(scope="function")
-def admin_api_manager() -> Generator[ApiManager]:
-    session = requests.Session()
-    manager = ApiManager(session, base_url=BASE_URL)
-    manager.auth_api.login()
+def async_admin_api_manager(admin_api_manager: ApiManager) -> Generator[AsyncApiManager]:
+    manager = AsyncApiManager(admin_api_manager)
     try:
         yield manager
     finally:
-        session.close()
+        manager.close()
 
 
-@pytest.fixture
-def created_movie(admin_api_manager, movie_payload: MovieCreate):
-    LOGGER.info("Фикстура 'created_movie': создаем фильм.")
-    movie_id = None
+@pytest.fixture(scope="function")
+def fresh_admin_api_manager(api_manager_factory: ApiManagerFactory) -> Generator[ApiManager]:
+    manager = api_manager_factory.create()
     try:
-        created_movie_model = admin_api_manager.movies_api.create_movie(movie_data=movie_payload, expected_status=201)
-        assert isinstance(created_movie_model, Movie), "Фикстура 'created_movie' ожидала успешного создания фильма"
-        movie_id = created_movie_model.id
-        LOGGER.info(f"Фильм с ID {movie_id} успешно создан фикстурой.")
+        login_response = manager.auth_api.login(expected_status=200)
+        assert isinstance(login_response, LoginResponse), "Не удалось выполнить отдельный логин администратора"
+        yield manager
+    finally:
+        manager.session.close()
 
-        yield created_movie_model
 
-    finally:
-        if movie_id:
-            LOGGER.info(f"Фикстура 'created_movie': удаляем фильм с ID {movie_id}.")
-            try:
-                admin_api_manager.movies_api.delete_movie(movie_id, expected_status=200)
-                LOGGER.info(f"Фильм с ID {movie_id} успешно удален фикстурой.")
-            except AssertionError:
-                LOGGER.warning(
-                    f"Не удалось удалить фильм с ID {movie_id} в teardown фикстуры. Возможно, он уже был удален в тесте."
-                )
+@pytest.fixture
+def created_movie(movie_pool: MoviePool, cleanup_registry: CleanupRegistry) -> Generator[Movie]:
+    with movie_pool.lease(MovieKind.PUBLISHED) as movie:
+        LOGGER.info(f"Фикстура 'created_movie': выдан фильм пула с ID {movie.id}.")
+        try:
+            yield movie
+        finally:
+            cleanup_registry.flush_reviews(movie_id=movie.id)
 
 
 @pytest.fixture
-def created_movie_unpublished(admin_api_manager, movie_payload: MovieCreate):
-    LOGGER.info("Фикстура 'created_movie_unpublished': создаем неопубликованный фильм.")
-    movie_id = None
-    payload = movie_payload.model_copy(update={"published": False})
+def created_movie_unpublished(movie_pool: MoviePool) -> Generator[Movie]:
+    with movie_pool.lease(MovieKind.UNPUBLISHED) as movie:
+        LOGGER.info(f"Фикстура 'created_movie_unpublished': выдан фильм пула с ID {movie.id}.")
+        yield movie
+
+
+@pytest.fixture
+def shared_movie(movie_pool: MoviePool) -> Movie:
+    return movie_pool.shared(MovieKind.PUBLISHED)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
     try:
-        created_movie_model = admin_api_manager.movies_api.create_movie(movie_data=payload, expected_status=201)
-        assert isinstance(created_movie_model, Movie), (
-            "Фикстура 'created_movie_unpublished' ожидала успешного создания фильма"
-        )
-        movie_id = created_movie_model.id
-        LOGGER.info(f"Неопубликованный фильм с ID {movie_id} успешно создан фикстурой.")
+        return (yield)
+    except CircuitOpenError as exc:
+        if settings.circuit_breaker_skip_tests:
+            pytest.skip(str(exc))
+        raise
 
-        yield created_movie_model
 
-    finally:
-        if movie_id:
-            LOGGER.info(f"Фикстура 'created_movie_unpublished': удаляем фильм с ID {movie_id}.")
-            try:
-                admin_api_manager.movies_api.delete_movie(movie_id, expected_status=200)
-                LOGGER.info(f"Фильм с ID {movie_id} успешно удален фикстурой.")
-            except AssertionError:
-                LOGGER.warning(
-                    f"Не удалось удалить фильм с ID {movie_id} в teardown фикстуры. Возможно, он уже был удален в тесте."
-                )
+def pytest_runtest_setup(item):
+    http_exchange_buffer.clear()
+    cassette_recorder.start_test(item.nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    cassette_recorder.finish_test()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -156,6 +318,9 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
 
+    if report.failed:
+        http_exchange_buffer.flush_to_allure()
+
     if report.when == "call" and report.failed and "page" in item.funcargs:
         page = item.funcargs["page"]
         screenshots_dir = os.path.join("logs", "screenshots")
@@ -168,58 +333,91 @@ def pytest_runtest_makereport(item, call):
         )
 
 
-@pytest.fixture
-def registered_user_by_api_ui(
-    api_manager: ApiManager, admin_api_manager: ApiManager, user_credentials_ui: tuple[UserCreate, str]
-) -> Generator[UserCreate]:
-    user_payload, password_repeat = user_credentials_ui
-    register_data = user_payload.model_dump(by_alias=True)
-    register_data["passwordRepeat"] = password_repeat
-    response = api_manager.auth_api.register(user_data=register_data, expected_status=201)
-    user_id = response.id if isinstance(response, User) else None
+@pytest.fixture(scope="session")
+def user_pool(admin_api_manager_pool: ApiManagerPool, api_manager_factory: ApiManagerFactory) -> Generator[UserPool]:
+    pool = UserPool(
+        admin_api_manager_pool,
+        api_manager_factory.create,
+        _new_faker("user_pool"),
+        size=settings.user_pool_size,
+        concurrency=settings.bulk_concurrency,
+    )
     try:
-        yield user_payload
+        pool.provision()
+        yield pool
     finally:
-        if user_id:
-            try:
-                admin_api_manager.users_api.delete_user(user_id, expected_status=200)
-            except AssertionError:
-                LOGGER.warning(
-                    f"Не удалось удалить пользователя {user_id} в teardown. Возможно, он уже удален в тесте."
-                )
+        pool.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def sweep_orphans(request: pytest.FixtureRequest) -> None:
+    if not request.config.getoption("--sweep-orphans") or _xdist_worker_id() not in {None, "gw0"}:
+        return
+    admin_pool: ApiManagerPool = request.getfixturevalue("admin_api_manager_pool")
+    min_age = timedelta(hours=settings.orphan_sweep_min_age_hours)
+    OrphanSweeper(admin_pool, min_age, concurrency=settings.bulk_concurrency).sweep()
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(admin_api_manager_pool: ApiManagerPool) -> Generator[CleanupRegistry]:
+    registry = CleanupRegistry(admin_api_manager_pool, concurrency=settings.bulk_concurrency)
+    try:
+        yield registry
+    finally:
+        registry.flush()
+
+
+@pytest.fixture(scope="session")
+def movie_pool(admin_api_manager_pool: ApiManagerPool) -> Generator[MoviePool]:
+    pool = MoviePool(
+        admin_api_manager_pool,
+        _new_faker("movie_pool"),
+        size=settings.movie_pool_size,
+        unpublished_size=settings.movie_pool_unpublished_size,
+        concurrency=settings.bulk_concurrency,
+    )
+    try:
+        pool.provision()
+        yield pool
+    finally:
+        pool.close()
 
 
 @pytest.fixture
-def new_registered_user(
+def registered_user_by_api_ui(user_pool: UserPool) -> Generator[UserCreate]:
+    with user_pool.lease() as pooled:
+        yield pooled.credentials
+
+
+@pytest.fixture
+def self_registered_user(
+    api_manager_factory: ApiManagerFactory,
+    cleanup_registry: CleanupRegistry,
     user_credentials: tuple[UserCreate, str],
 ) -> Generator[tuple[ApiManager, UserCreate]]:
-    LOGGER.info("Фикстура 'new_registered_user': регистрируем нового пользователя.")
     user_payload, password_repeat = user_credentials
-    session = requests.Session()
-    api_manager = ApiManager(session, base_url=BASE_URL)
-
-    user_id = None
+    api_manager = api_manager_factory.create()
     try:
         register_data = user_payload.model_dump(by_alias=True)
         register_data["passwordRepeat"] = password_repeat
-        registration_response = api_manager.auth_api.register(user_data=register_data, expected_status=201)
-        assert isinstance(registration_response, User), "Фикстура 'new_registered_user' ожидала успешной регистрации"
-        LOGGER.info(f"Пользователь с email {user_payload.email} успешно зарегистрирован фикстурой.")
-        user_id = registration_response.id
-
-    except ValueError as e:
-        LOGGER.error(f"Регистрация пользователя {user_payload.email} провалилась: {e}")
-        pytest.fail(f"Регистрация прервана с непредвиденной ошибкой: {e}")
+        response = api_manager.auth_api.register(user_data=register_data, expected_status=201)
+        assert isinstance(response, User), "Фикстура 'self_registered_user' ожидала успешной регистрации"
+        cleanup_registry.register_user(response.id)
+        LOGGER.info(f"Фикстура 'self_registered_user': пользователь {user_payload.email} зарегистрирован через API")
+        yield api_manager, user_payload
+    finally:
+        api_manager.session.close()
 
-    if "Authorization" in api_manager.session.headers:
-        del api_manager.session.headers["Authorization"]
 
-    yield api_manager, user_payload
-    if user_id:
+@pytest.fixture
+def new_registered_user(
+    api_manager_factory: ApiManagerFactory, user_pool: UserPool, cleanup_registry: CleanupRegistry
+) -> Generator[tuple[ApiManager, UserCreate]]:
+    with user_pool.lease() as pooled:
+        LOGGER.info(f"Фикстура 'new_registered_user': выдан пользователь пула {pooled.credentials.email}")
+        api_manager = api_manager_factory.create()
         try:
-            api_manager.auth_api.login(email=user_payload.email, password=user_payload.password, expected_status=200)
-            api_manager.users_api.delete_user(user_id, expected_status=200)
-        except AssertionError:
-            LOGGER.warning(f"Не удалось удалить пользователя {user_id} в teardown фикстуры.")
-    session.close()
-    LOGGER.info(f"Фикстура 'new_registered_user' для пользователя {user_payload.email} завершила свою работу.")
+            yield api_manager, pooled.credentials
+        finally:
+            cleanup_registry.flush_reviews(author=api_manager)
+            api_manager.session.close()
@@ -1,10 +1,20 @@
+from enum import StrEnum
+
 from tests.config import settings
+from tests.constants.timeouts import TimeoutProfile
 
 BASE_URL = settings.base_url
 BASE_UI_URL = settings.base_ui_url
 BASE_AUTH_URL = settings.base_auth_url
 BASE_PAYMENT_URL = settings.base_payment_url
 
+
+class Service(StrEnum):
+    API = "api"
+    AUTH = "auth"
+    PAYMENT = "payment"
+
+
 HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
 
 MOVIES_ENDPOINT = "/movies"
@@ -31,6 +41,37 @@
 GENRES_ENDPOINT = "/genres"
 GENRE_BY_ID_ENDPOINT = "/genres/{genre_id}"
 
+ENDPOINT_TIMEOUTS: dict[tuple[Service, str, str], TimeoutProfile] = {
+    (Service.API, "GET", MOVIES_ENDPOINT): TimeoutProfile.LIST_READ,
+    (Service.API, "GET", MOVIE_BY_ID_ENDPOINT): TimeoutProfile.FAST_READ,
+    (Service.API, "POST", MOVIES_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "PATCH", MOVIE_BY_ID_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "DELETE", MOVIE_BY_ID_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "GET", REVIEWS_ENDPOINT): TimeoutProfile.FAST_READ,
+    (Service.API, "POST", REVIEWS_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "PUT", REVIEWS_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "DELETE", REVIEWS_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "PATCH", REVIEW_HIDE_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "PATCH", REVIEW_SHOW_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.AUTH, "POST", LOGIN_ENDPOINT): TimeoutProfile.AUTH,
+    (Service.AUTH, "POST", REGISTER_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.AUTH, "GET", LOGOUT_ENDPOINT): TimeoutProfile.FAST_READ,
+    (Service.AUTH, "GET", REFRESH_ENDPOINT): TimeoutProfile.FAST_READ,
+    (Service.AUTH, "GET", USERS_ENDPOINT): TimeoutProfile.LIST_READ,
+    (Service.AUTH, "POST", USERS_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.AUTH, "GET", USER_BY_ID_OR_EMAIL_ENDPOINT): TimeoutProfile.FAST_READ,
+    (Service.AUTH, "PATCH", USER_BY_ID_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.AUTH, "DELETE", USER_BY_ID_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.PAYMENT, "POST", PAYMENT_CREATE_ENDPOINT): TimeoutProfile.SLOW_WRITE,
+    (Service.PAYMENT, "GET", PAYMENT_USER_ENDPOINT): TimeoutProfile.LIST_READ,
+    (Service.PAYMENT, "GET", PAYMENT_USER_BY_ID_ENDPOINT): TimeoutProfile.LIST_READ,
+    (Service.PAYMENT, "GET", PAYMENT_FIND_ALL_ENDPOINT): TimeoutProfile.LIST_READ,
+    (Service.API, "GET", GENRES_ENDPOINT): TimeoutProfile.FAST_READ,
+    (Service.API, "GET", GENRE_BY_ID_ENDPOINT): TimeoutProfile.FAST_READ,
+    (Service.API, "POST", GENRES_ENDPOINT): TimeoutProfile.WRITE,
+    (Service.API, "DELETE", GENRE_BY_ID_ENDPOINT): TimeoutProfile.WRITE,
+}
+
 ADMIN_EMAIL = settings.admin_email
 ADMIN_PASSWORD = settings.admin_password
 
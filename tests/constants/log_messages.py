@@ -5,6 +5,7 @@ class General:
     class Auth:
         ATTEMPT_LOGIN = "Попытка логина для пользователя {}"
         LOGIN_SUCCESS = "Пользователь {} успешно вошел в систему."
+        TOKEN_REUSED = "Используем сохраненный токен пользователя {}"
 
     class Movies:
         ATTEMPT_CREATE = "Попытка создания фильма с названием '{}'"
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import NamedTuple
 
 
 class Timeout(Enum):
@@ -6,3 +7,17 @@ class Timeout(Enum):
     FIVE_SECONDS = 5000
     TEN_SECONDS = 10000
     DEFAULT_TIMEOUT = 10000
+
+
+class RequestTimeout(NamedTuple):
+    connect: float
+    read: float
+
+
+class TimeoutProfile(Enum):
+    FAST_READ = RequestTimeout(connect=3.05, read=5)
+    LIST_READ = RequestTimeout(connect=3.05, read=15)
+    AUTH = RequestTimeout(connect=3.05, read=10)
+    WRITE = RequestTimeout(connect=3.05, read=20)
+    SLOW_WRITE = RequestTimeout(connect=5, read=60)
+    DEFAULT = RequestTimeout(connect=5, read=30)
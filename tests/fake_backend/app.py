@@ -0,0 +1,711 @@
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import math
+import secrets
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from http import HTTPStatus
+from typing import Any, TypedDict
+
+from tests.constants.endpoints import (
+    CONFIRM_ENDPOINT,
+    GENRE_BY_ID_ENDPOINT,
+    GENRES_ENDPOINT,
+    LOGIN_ENDPOINT,
+    LOGOUT_ENDPOINT,
+    MOVIE_BY_ID_ENDPOINT,
+    MOVIES_ENDPOINT,
+    PAYMENT_CREATE_ENDPOINT,
+    PAYMENT_FIND_ALL_ENDPOINT,
+    PAYMENT_USER_BY_ID_ENDPOINT,
+    PAYMENT_USER_ENDPOINT,
+    REFRESH_ENDPOINT,
+    REGISTER_ENDPOINT,
+    REVIEW_HIDE_ENDPOINT,
+    REVIEW_SHOW_ENDPOINT,
+    REVIEWS_ENDPOINT,
+    USER_BY_ID_ENDPOINT,
+    USER_BY_ID_OR_EMAIL_ENDPOINT,
+    USERS_ENDPOINT,
+)
+from tests.constants.payment_data import PAYMENT_CARD
+from tests.fake_backend.routing import FakeRequest, FakeResponse, HttpError, Router
+from tests.models.movie_models import GenreId, Location
+from tests.models.payment_models import PaymentStatus
+
+FAKE_ADMIN_EMAIL = "admin@cinescope.local"
+FAKE_ADMIN_PASSWORD = "Admin-Passw0rd"  # nosec B105
+ACCESS_TOKEN_TTL_SECONDS = 30 * 60
+REFRESH_COOKIE = "refreshToken"
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 20
+ADMIN_ROLES = ("ADMIN", "SUPER_ADMIN")
+DEFAULT_GENRES = {
+    GenreId.ACTION: "Боевик",
+    GenreId.COMEDY: "Комедия",
+    GenreId.DRAMA: "Драма",
+    GenreId.FANTASY: "Фэнтези",
+    GenreId.THRILLER: "Триллер",
+}
+SERVICE_PREFIXES = {"api": "base_url", "auth": "base_auth_url", "payment": "base_payment_url"}
+
+type WSGIEnviron = dict[str, Any]
+type StartResponse = Callable[..., Any]
+
+
+def _timestamp() -> str:
+    return datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def split_service_path(path: str) -> tuple[str, str]:
+    service, _, rest = path.lstrip("/").partition("/")
+    return service, f"/{rest}"
+
+
+class ServiceBaseUrls(TypedDict):
+    base_url: str
+    base_auth_url: str
+    base_payment_url: str
+
+
+def service_base_urls(root_url: str) -> ServiceBaseUrls:
+    return ServiceBaseUrls(
+        base_url=f"{root_url}/api", base_auth_url=f"{root_url}/auth", base_payment_url=f"{root_url}/payment"
+    )
+
+
+class FakeCinescopeBackend:
+    def __init__(
+        self,
+        admin_email: str = FAKE_ADMIN_EMAIL,
+        admin_password: str = FAKE_ADMIN_PASSWORD,
+        seed_movies: int = 12,
+    ):
+        self.admin_email = admin_email
+        self.admin_password = admin_password
+        self._secret = secrets.token_bytes(32)
+        self._lock = threading.RLock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.users: dict[str, dict[str, Any]] = {}
+        self._passwords: dict[str, str] = {}
+        self._access_tokens: dict[str, tuple[str, float]] = {}
+        self._refresh_tokens: dict[str, str] = {}
+        self.genres: dict[int, str] = {int(genre_id): name for genre_id, name in DEFAULT_GENRES.items()}
+        self.movies: dict[int, dict[str, Any]] = {}
+        self.reviews: dict[int, dict[str, dict[str, Any]]] = {}
+        self.payments: list[dict[str, Any]] = []
+        self._movie_ids = itertools.count(1)
+        self._genre_ids = itertools.count(max(self.genres) + 1)
+        self._payment_ids = itertools.count(1)
+
+        self.routers = {"api": self._movies_router(), "auth": self._auth_router(), "payment": self._payment_router()}
+        self._add_user(admin_email, "Администратор", admin_password, ["USER", *ADMIN_ROLES], verified=True)
+        locations = list(Location)
+        for index in range(1, seed_movies + 1):
+            self._add_movie(
+                {
+                    "name": f"Фильм {index}",
+                    "description": f"Описание фильма {index}",
+                    "price": 100 * index,
+                    "location": locations[index % len(locations)].value,
+                    "genreId": list(DEFAULT_GENRES)[index % len(DEFAULT_GENRES)].value,
+                    "published": True,
+                    "imageUrl": None,
+                }
+            )
+
+    def __call__(self, environ: WSGIEnviron, start_response: StartResponse) -> Iterable[bytes]:
+        response = self.handle(environ)
+        body = response.encode()
+        headers = [
+            ("Content-Type", "application/json; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+            *response.headers,
+        ]
+        start_response(f"{response.status} {HTTPStatus(response.status).phrase}", headers)
+        return [body]
+
+    def handle(self, environ: WSGIEnviron) -> FakeResponse:
+        path = environ.get("PATH_INFO", "/").encode("latin-1").decode("utf-8", errors="replace")
+        service, service_path = split_service_path(path)
+        try:
+            request = FakeRequest.from_environ(environ, service_path)
+            router = self.routers.get(service)
+            if router is None:
+                raise HttpError(404, f"Cannot {request.method} {path}")
+            with self._lock:
+                return router.dispatch(request)
+        except HttpError as exc:
+            return FakeResponse(exc.status, exc.body())
+        except Exception:
+            self.logger.exception(f"Ошибка обработки запроса {path} в fake backend")
+            return FakeResponse(500, HttpError(500, "Internal server error").body())
+
+    def _movies_router(self) -> Router:
+        router = Router()
+        router.add("GET", MOVIES_ENDPOINT, self.get_movies)
+        router.add("POST", MOVIES_ENDPOINT, self.create_movie)
+        router.add("GET", MOVIE_BY_ID_ENDPOINT, self.get_movie)
+        router.add("PATCH", MOVIE_BY_ID_ENDPOINT, self.edit_movie)
+        router.add("DELETE", MOVIE_BY_ID_ENDPOINT, self.delete_movie)
+        router.add("GET", REVIEWS_ENDPOINT, self.get_reviews)
+        router.add("POST", REVIEWS_ENDPOINT, self.create_review)
+        router.add("PUT", REVIEWS_ENDPOINT, self.edit_review)
+        router.add("DELETE", REVIEWS_ENDPOINT, self.delete_review)
+        router.add("PATCH", REVIEW_HIDE_ENDPOINT, self.hide_review)
+        router.add("PATCH", REVIEW_SHOW_ENDPOINT, self.show_review)
+        router.add("GET", GENRES_ENDPOINT, self.get_genres)
+        router.add("POST", GENRES_ENDPOINT, self.create_genre)
+        router.add("GET", GENRE_BY_ID_ENDPOINT, self.get_genre)
+        router.add("DELETE", GENRE_BY_ID_ENDPOINT, self.delete_genre)
+        return router
+
+    def _auth_router(self) -> Router:
+        router = Router()
+        router.add("POST", LOGIN_ENDPOINT, self.login)
+        router.add("POST", REGISTER_ENDPOINT, self.register)
+        router.add("GET", LOGOUT_ENDPOINT, self.logout)
+        router.add("GET", REFRESH_ENDPOINT, self.refresh_tokens)
+        router.add("GET", f"{CONFIRM_ENDPOINT}/{{token}}", self.confirm_email)
+        router.add("GET", USERS_ENDPOINT, self.get_users)
+        router.add("POST", USERS_ENDPOINT, self.create_user)
+        router.add("GET", USER_BY_ID_OR_EMAIL_ENDPOINT, self.get_user)
+        router.add("PATCH", USER_BY_ID_ENDPOINT, self.edit_user)
+        router.add("DELETE", USER_BY_ID_ENDPOINT, self.delete_user)
+        return router
+
+    def _payment_router(self) -> Router:
+        router = Router()
+        router.add("POST", PAYMENT_CREATE_ENDPOINT, self.create_payment)
+        router.add("GET", PAYMENT_USER_ENDPOINT, self.get_current_user_payments)
+        router.add("GET", PAYMENT_USER_BY_ID_ENDPOINT, self.get_user_payments)
+        router.add("GET", PAYMENT_FIND_ALL_ENDPOINT, self.find_all_payments)
+        return router
+
+    def _issue_tokens(self, user_id: str) -> tuple[str, str]:
+        now = time.time()
+        user = self.users[user_id]
+        header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        claims = {"id": user_id, "email": user["email"], "roles": user["roles"], "iat": int(now)}
+        claims["exp"] = int(now + ACCESS_TOKEN_TTL_SECONDS)
+        payload = _b64url(json.dumps(claims).encode())
+        signature = _b64url(hmac.new(self._secret, f"{header}.{payload}".encode(), hashlib.sha256).digest())
+        access_token = f"{header}.{payload}.{signature}"
+        refresh_token = secrets.token_urlsafe(32)
+        self._access_tokens[access_token] = (user_id, now + ACCESS_TOKEN_TTL_SECONDS)
+        self._refresh_tokens[refresh_token] = user_id
+        return access_token, refresh_token
+
+    def _revoke_tokens(self, user_id: str) -> None:
+        self._access_tokens = {token: entry for token, entry in self._access_tokens.items() if entry[0] != user_id}
+        self._refresh_tokens = {token: owner for token, owner in self._refresh_tokens.items() if owner != user_id}
+
+    def _authorize(self, request: FakeRequest, *roles: str) -> dict[str, Any]:
+        entry = self._access_tokens.get(request.bearer_token or "")
+        if entry is None or entry[1] < time.time() or entry[0] not in self.users:
+            raise HttpError(401)
+        user = self.users[entry[0]]
+        if roles and not set(user["roles"]) & set(roles):
+            raise HttpError(403)
+        return user
+
+    def _is_admin(self, user: dict[str, Any]) -> bool:
+        return bool(set(user["roles"]) & set(ADMIN_ROLES))
+
+    def _token_response(self, user_id: str, body: dict[str, Any], status: int = 200) -> FakeResponse:
+        access_token, refresh_token = self._issue_tokens(user_id)
+        body = {**body, "accessToken": access_token, "refreshToken": refresh_token}
+        body["expiresIn"] = ACCESS_TOKEN_TTL_SECONDS
+        cookie = f"{REFRESH_COOKIE}={refresh_token}; Path=/; HttpOnly; SameSite=Lax"
+        return FakeResponse(status, body, [("Set-Cookie", cookie)])
+
+    def login(self, request: FakeRequest) -> FakeResponse:
+        payload = request.json()
+        user = self._find_user_by_email(str(payload.get("email", "")))
+        if user is None or self._passwords.get(user["id"]) != payload.get("password"):
+            raise HttpError(401, "Неверный логин или пароль")
+        if user["banned"]:
+            raise HttpError(403, "Пользователь заблокирован")
+        return self._token_response(user["id"], {"user": self._user_summary(user)})
+
+    def refresh_tokens(self, request: FakeRequest) -> FakeResponse:
+        user_id = self._refresh_tokens.pop(request.cookies.get(REFRESH_COOKIE, ""), None)
+        if user_id is None or user_id not in self.users:
+            raise HttpError(401)
+        return self._token_response(user_id, {})
+
+    def logout(self, request: FakeRequest) -> FakeResponse:
+        self._refresh_tokens.pop(request.cookies.get(REFRESH_COOKIE, ""), None)
+        cookie = f"{REFRESH_COOKIE}=; Path=/; Max-Age=0"
+        return FakeResponse(200, {"message": "Выход выполнен"}, [("Set-Cookie", cookie)])
+
+    def confirm_email(self, request: FakeRequest) -> FakeResponse:
+        raise HttpError(404, "Токен подтверждения не найден")
+
+    def _user_summary(self, user: dict[str, Any]) -> dict[str, Any]:
+        return {key: user[key] for key in ("id", "email", "fullName", "roles")}
+
+    def _find_user_by_email(self, email: str) -> dict[str, Any] | None:
+        return next((user for user in self.users.values() if user["email"] == email.lower()), None)
+
+    def _add_user(
+        self, email: str, full_name: str, password: str, roles: list[str], *, verified: bool, banned: bool = False
+    ) -> dict[str, Any]:
+        user: dict[str, Any] = {
+            "id": str(uuid.uuid4()),
+            "email": email.lower(),
+            "fullName": full_name,
+            "roles": roles,
+            "verified": verified,
+            "banned": banned,
+            "createdAt": _timestamp(),
+        }
+        self.users[user["id"]] = user
+        self._passwords[user["id"]] = password
+        return user
+
+    def _validate_new_user(self, payload: Any) -> list[str]:
+        if not isinstance(payload, dict):
+            return ["Тело запроса должно быть объектом"]
+        errors = []
+        email: Any = payload.get("email")
+        if not isinstance(email, str) or "@" not in email:
+            errors.append("email must be an email")
+        if not isinstance(payload.get("fullName"), str) or not payload["fullName"].strip():
+            errors.append("fullName should not be empty")
+        password = payload.get("password")
+        if not isinstance(password, str) or len(password) < 5:
+            errors.append("password must be longer than or equal to 5 characters")
+        if errors:
+            return errors
+        if self._find_user_by_email(email):
+            raise HttpError(409, "Пользователь с таким email уже зарегистрирован")
+        return []
+
+    def register(self, request: FakeRequest) -> FakeResponse:
+        payload = request.json()
+        errors = self._validate_new_user(payload)
+        if not errors and payload.get("passwordRepeat") != payload["password"]:
+            errors.append("Пароли не совпадают")
+        if errors:
+            raise HttpError(400, errors)
+        user = self._add_user(payload["email"], payload["fullName"], payload["password"], ["USER"], verified=False)
+        return FakeResponse(201, user)
+
+    def create_user(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        payload = request.json()
+        errors = self._validate_new_user(payload)
+        if errors:
+            raise HttpError(400, errors)
+        user = self._add_user(
+            payload["email"],
+            payload["fullName"],
+            payload["password"],
+            list(payload.get("roles") or ["USER"]),
+            verified=bool(payload.get("verified", False)),
+            banned=bool(payload.get("banned", False)),
+        )
+        return FakeResponse(201, user)
+
+    def get_users(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        users = sorted(self.users.values(), key=lambda user: user["createdAt"], reverse=True)
+        roles = request.query.get("roles")
+        if roles:
+            users = [user for user in users if set(user["roles"]) & set(roles)]
+        page_items, page, page_size, page_count = self._paginate(users, request)
+        return FakeResponse(
+            200,
+            {"users": page_items, "count": len(users), "page": page, "pageSize": page_size, "pageCount": page_count},
+        )
+
+    def _user_or_404(self, id_or_email: str) -> dict[str, Any]:
+        user = self.users.get(id_or_email) or self._find_user_by_email(id_or_email)
+        if user is None:
+            raise HttpError(404, "Пользователь не найден")
+        return user
+
+    def get_user(self, request: FakeRequest) -> FakeResponse:
+        current = self._authorize(request)
+        user = self._user_or_404(request.path_params["id_or_email"])
+        if user["id"] != current["id"] and not self._is_admin(current):
+            raise HttpError(403)
+        return FakeResponse(200, user)
+
+    def edit_user(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        user = self._user_or_404(request.path_params["user_id"])
+        payload = request.json()
+        if not isinstance(payload, dict):
+            raise HttpError(400, ["Тело запроса должно быть объектом"])
+        errors = [
+            f"{key} must be a boolean value"
+            for key in ("verified", "banned")
+            if key in payload and not isinstance(payload[key], bool)
+        ]
+        if "roles" in payload and not isinstance(payload["roles"], list):
+            errors.append("roles must be an array")
+        if errors:
+            raise HttpError(400, errors)
+        user.update({key: payload[key] for key in ("fullName", "roles", "verified", "banned") if key in payload})
+        return FakeResponse(200, user)
+
+    def delete_user(self, request: FakeRequest) -> FakeResponse:
+        current = self._authorize(request)
+        user = self._user_or_404(request.path_params["user_id"])
+        if user["id"] != current["id"] and not self._is_admin(current):
+            raise HttpError(403)
+        del self.users[user["id"]]
+        self._passwords.pop(user["id"], None)
+        self._revoke_tokens(user["id"])
+        return FakeResponse(200, user)
+
+    def _paginate(
+        self, items: list[dict[str, Any]], request: FakeRequest
+    ) -> tuple[list[dict[str, Any]], int, int, int]:
+        page = self._int_query(request, "page", 1, minimum=1)
+        page_size = self._int_query(request, "pageSize", DEFAULT_PAGE_SIZE, minimum=1, maximum=MAX_PAGE_SIZE)
+        start = (page - 1) * page_size
+        return items[start : start + page_size], page, page_size, math.ceil(len(items) / page_size)
+
+    def _int_query(
+        self, request: FakeRequest, name: str, default: int | None, minimum: int, maximum: int | None = None
+    ) -> int:
+        raw = request.query_value(name)
+        if raw is None:
+            if default is None:
+                raise HttpError(400, [f"{name} should not be empty"])
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            raise HttpError(400, [f"{name} must be an integer number"]) from None
+        if value < minimum:
+            raise HttpError(400, [f"{name} must not be less than {minimum}"])
+        if maximum is not None and value > maximum:
+            raise HttpError(400, [f"{name} must not be greater than {maximum}"])
+        return value
+
+    def _movie_view(self, movie: dict[str, Any]) -> dict[str, Any]:
+        return {**movie, "genre": {"name": self.genres.get(movie["genreId"], movie["genre"]["name"])}}
+
+    def _movie_or_404(self, raw_id: str, *, strict: bool = True) -> dict[str, Any]:
+        raw_id = raw_id.strip()
+        if not raw_id:
+            raise HttpError(404, "Not Found")
+        try:
+            movie_id = int(raw_id)
+        except ValueError:
+            if strict:
+                raise HttpError(500, "Internal server error") from None
+            raise HttpError(404, "Фильм не найден") from None
+        movie = self.movies.get(movie_id)
+        if movie is None:
+            raise HttpError(404, "Фильм не найден")
+        return movie
+
+    def _validate_movie(self, payload: Any, *, partial: bool) -> dict[str, Any]:
+        if not isinstance(payload, dict):
+            raise HttpError(400, ["Тело запроса должно быть объектом"])
+        rules: dict[str, tuple[Callable[[Any], bool], str]] = {
+            "name": (lambda value: isinstance(value, str) and 0 < len(value.strip()) <= 100, "must be a string"),
+            "description": (lambda value: isinstance(value, str) and 0 < len(value) <= 500, "must be a string"),
+            "price": (lambda value: _is_int(value) and value > 0, "must be a positive integer number"),
+            "location": (
+                lambda value: value in Location._value2member_map_,
+                f"must be one of the following values: {', '.join(Location._value2member_map_)}",
+            ),
+            "genreId": (lambda value: _is_int(value) and value >= 1, "must be an integer number"),
+            "published": (lambda value: isinstance(value, bool), "must be a boolean value"),
+            "imageUrl": (lambda value: value is None or isinstance(value, str), "must be a string"),
+        }
+        optional = {"published", "imageUrl"}
+        errors = []
+        for field, (is_valid, message) in rules.items():
+            if field not in payload:
+                if not partial and field not in optional:
+                    errors.append(f"{field} should not be empty")
+                continue
+            if not is_valid(payload[field]):
+                errors.append(f"{field} {message}")
+        if errors:
+            raise HttpError(400, errors)
+        if "genreId" in payload and payload["genreId"] not in self.genres:
+            raise HttpError(404, "Жанр не найден")
+        return {field: payload[field] for field in rules if field in payload}
+
+    def _ensure_unique_name(self, name: str, movie_id: int | None = None) -> None:
+        if any(movie["name"] == name and movie["id"] != movie_id for movie in self.movies.values()):
+            raise HttpError(409, "Фильм с таким названием уже существует")
+
+    def _add_movie(self, fields: dict[str, Any]) -> dict[str, Any]:
+        movie_id = next(self._movie_ids)
+        movie = {
+            "id": movie_id,
+            "published": True,
+            "imageUrl": None,
+            **fields,
+            "genre": {"name": self.genres[fields["genreId"]]},
+            "createdAt": _timestamp(),
+            "rating": 0,
+        }
+        self.movies[movie_id] = movie
+        self.reviews[movie_id] = {}
+        return movie
+
+    def get_movies(self, request: FakeRequest) -> FakeResponse:
+        movies = list(self.movies.values())
+        published = request.query_value("published")
+        if published is not None and published.lower() not in {"true", "false"}:
+            raise HttpError(400, "Некорректные данные")
+        published_flag = published is None or published.lower() == "true"
+        movies = [movie for movie in movies if movie["published"] is published_flag]
+
+        locations = request.query.get("locations")
+        if locations:
+            if any(location not in Location._value2member_map_ for location in locations):
+                raise HttpError(400, "Некорректные данные")
+            movies = [movie for movie in movies if movie["location"] in locations]
+        if request.query_value("genreId") is not None:
+            genre_id = self._int_query(request, "genreId", None, minimum=1)
+            movies = [movie for movie in movies if movie["genreId"] == genre_id]
+        min_price = self._int_query(request, "minPrice", 1, minimum=0)
+        max_price = self._int_query(request, "maxPrice", 1_000_000_000, minimum=0)
+        movies = [movie for movie in movies if min_price <= movie["price"] <= max_price]
+
+        order = request.query_value("createdAt") or "desc"
+        if order not in {"asc", "desc"}:
+            raise HttpError(400, "Некорректные данные")
+        movies.sort(key=lambda movie: (movie["createdAt"], movie["id"]), reverse=order == "desc")
+
+        page_items, page, page_size, page_count = self._paginate(movies, request)
+        return FakeResponse(
+            200,
+            {
+                "movies": [self._movie_view(movie) for movie in page_items],
+                "count": len(movies),
+                "page": page,
+                "pageSize": page_size,
+                "pageCount": page_count,
+            },
+        )
+
+    def create_movie(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        fields = self._validate_movie(request.json(), partial=False)
+        self._ensure_unique_name(fields["name"])
+        return FakeResponse(201, self._movie_view(self._add_movie(fields)))
+
+    def get_movie(self, request: FakeRequest) -> FakeResponse:
+        movie = self._movie_or_404(request.path_params["movie_id"])
+        reviews = [review for review in self.reviews[movie["id"]].values() if not review["hidden"]]
+        return FakeResponse(200, {**self._movie_view(movie), "reviews": reviews})
+
+    def edit_movie(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        movie = self._movie_or_404(request.path_params["movie_id"], strict=False)
+        fields = self._validate_movie(request.json(), partial=True)
+        if "name" in fields:
+            self._ensure_unique_name(fields["name"], movie["id"])
+        movie.update(fields)
+        return FakeResponse(200, self._movie_view(movie))
+
+    def delete_movie(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        movie = self._movie_or_404(request.path_params["movie_id"], strict=False)
+        del self.movies[movie["id"]]
+        self.reviews.pop(movie["id"], None)
+        return FakeResponse(200, self._movie_view(movie))
+
+    def _validate_review(self, payload: Any) -> dict[str, Any]:
+        if not isinstance(payload, dict):
+            raise HttpError(400, ["Тело запроса должно быть объектом"])
+        errors = []
+        if not _is_int(payload.get("rating")) or not 1 <= payload["rating"] <= 5:
+            errors.append("rating must be an integer between 1 and 5")
+        if not isinstance(payload.get("text"), str) or not payload["text"].strip():
+            errors.append("text should not be empty")
+        if errors:
+            raise HttpError(400, errors)
+        return {"rating": payload["rating"], "text": payload["text"]}
+
+    def _update_rating(self, movie: dict[str, Any]) -> None:
+        ratings = [review["rating"] for review in self.reviews[movie["id"]].values()]
+        movie["rating"] = round(sum(ratings) / len(ratings), 1) if ratings else 0
+
+    def _review_or_404(self, movie: dict[str, Any], user_id: str) -> dict[str, Any]:
+        review = self.reviews[movie["id"]].get(user_id)
+        if review is None:
+            raise HttpError(404, "Отзыв не найден")
+        return review
+
+    def get_reviews(self, request: FakeRequest) -> FakeResponse:
+        movie = self._movie_or_404(request.path_params["movie_id"])
+        return FakeResponse(200, [review for review in self.reviews[movie["id"]].values() if not review["hidden"]])
+
+    def create_review(self, request: FakeRequest) -> FakeResponse:
+        user = self._authorize(request)
+        movie = self._movie_or_404(request.path_params["movie_id"])
+        fields = self._validate_review(request.json())
+        if user["id"] in self.reviews[movie["id"]]:
+            raise HttpError(409, "Пользователь уже оставил отзыв к этому фильму")
+        review = {
+            "userId": user["id"],
+            **fields,
+            "hidden": False,
+            "createdAt": _timestamp(),
+            "user": {"fullName": user["fullName"]},
+        }
+        self.reviews[movie["id"]][user["id"]] = review
+        self._update_rating(movie)
+        return FakeResponse(201, review)
+
+    def edit_review(self, request: FakeRequest) -> FakeResponse:
+        user = self._authorize(request)
+        movie = self._movie_or_404(request.path_params["movie_id"])
+        review = self._review_or_404(movie, user["id"])
+        review.update(self._validate_review(request.json()))
+        self._update_rating(movie)
+        return FakeResponse(200, review)
+
+    def delete_review(self, request: FakeRequest) -> FakeResponse:
+        user = self._authorize(request)
+        movie = self._movie_or_404(request.path_params["movie_id"])
+        review = self._review_or_404(movie, user["id"])
+        del self.reviews[movie["id"]][user["id"]]
+        self._update_rating(movie)
+        return FakeResponse(200, review)
+
+    def _set_review_hidden(self, request: FakeRequest, hidden: bool) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        movie = self._movie_or_404(request.path_params["movie_id"])
+        review = self._review_or_404(movie, request.path_params["user_id"])
+        review["hidden"] = hidden
+        return FakeResponse(200, review)
+
+    def hide_review(self, request: FakeRequest) -> FakeResponse:
+        return self._set_review_hidden(request, hidden=True)
+
+    def show_review(self, request: FakeRequest) -> FakeResponse:
+        return self._set_review_hidden(request, hidden=False)
+
+    def _genre_or_404(self, raw_id: str) -> int:
+        try:
+            genre_id = int(raw_id)
+        except ValueError:
+            raise HttpError(400, ["genreId must be an integer number"]) from None
+        if genre_id not in self.genres:
+            raise HttpError(404, "Жанр не найден")
+        return genre_id
+
+    def get_genres(self, request: FakeRequest) -> FakeResponse:
+        return FakeResponse(200, [{"id": genre_id, "name": name} for genre_id, name in sorted(self.genres.items())])
+
+    def get_genre(self, request: FakeRequest) -> FakeResponse:
+        genre_id = self._genre_or_404(request.path_params["genre_id"])
+        return FakeResponse(200, {"id": genre_id, "name": self.genres[genre_id]})
+
+    def create_genre(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        name = request.json().get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise HttpError(400, ["name should not be empty"])
+        if name in self.genres.values():
+            raise HttpError(409, "Жанр с таким названием уже существует")
+        genre_id = next(self._genre_ids)
+        self.genres[genre_id] = name
+        return FakeResponse(201, {"id": genre_id, "name": name})
+
+    def delete_genre(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        genre_id = self._genre_or_404(request.path_params["genre_id"])
+        return FakeResponse(200, {"id": genre_id, "name": self.genres.pop(genre_id)})
+
+    def _card_is_valid(self, card: Any) -> bool:
+        if not isinstance(card, dict) or card.get("cardNumber") != PAYMENT_CARD["cardNumber"]:
+            return False
+        month, _, year = str(card.get("expirationDate", "")).partition("/")
+        if not (month.isdigit() and year.isdigit() and 1 <= int(month) <= 12):
+            return False
+        now = datetime.now(UTC)
+        expires = (2000 + int(year), int(month))
+        return expires >= (now.year, now.month) and len(str(card.get("securityCode", ""))) == 3
+
+    def create_payment(self, request: FakeRequest) -> FakeResponse:
+        user = self._authorize(request)
+        payload = request.json()
+        errors = []
+        if not _is_int(payload.get("movieId")):
+            errors.append("movieId must be an integer number")
+        if not _is_int(payload.get("amount")) or payload["amount"] < 1:
+            errors.append("amount must not be less than 1")
+        if not isinstance(payload.get("card"), dict):
+            errors.append("card must be an object")
+        if errors:
+            raise HttpError(400, errors)
+        movie = self._movie_or_404(str(payload["movieId"]))
+        status = PaymentStatus.SUCCESS if self._card_is_valid(payload["card"]) else PaymentStatus.INVALID_CARD
+        self.payments.append(
+            {
+                "id": next(self._payment_ids),
+                "userId": user["id"],
+                "movieId": movie["id"],
+                "total": movie["price"] * payload["amount"],
+                "amount": payload["amount"],
+                "createdAt": _timestamp(),
+                "status": status.value,
+            }
+        )
+        if status is PaymentStatus.SUCCESS:
+            return FakeResponse(201, {"status": status.value})
+        return FakeResponse(
+            400, {"statusCode": 400, "message": "Некорректные данные карты", "error": {"status": status.value}}
+        )
+
+    def _payments_of(self, user_id: str) -> list[dict[str, Any]]:
+        return [payment for payment in self.payments if payment["userId"] == user_id]
+
+    def get_current_user_payments(self, request: FakeRequest) -> FakeResponse:
+        user = self._authorize(request)
+        return FakeResponse(200, self._payments_of(user["id"]))
+
+    def get_user_payments(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        return FakeResponse(200, self._payments_of(request.path_params["user_id"]))
+
+    def find_all_payments(self, request: FakeRequest) -> FakeResponse:
+        self._authorize(request, *ADMIN_ROLES)
+        payments = list(reversed(self.payments))
+        status = request.query_value("status")
+        if status is not None:
+            if status not in PaymentStatus._value2member_map_:
+                raise HttpError(400, "Некорректные данные")
+            payments = [payment for payment in payments if payment["status"] == status]
+        page_items, page, page_size, page_count = self._paginate(payments, request)
+        return FakeResponse(
+            200,
+            {
+                "payments": page_items,
+                "count": len(payments),
+                "page": page,
+                "pageSize": page_size,
+                "pageCount": page_count,
+            },
+        )
@@ -0,0 +1,118 @@
+import random
+import re
+import threading
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from tests.fake_backend.routing import route_pattern
+
+
+class LatencyDistribution(StrEnum):
+    CONSTANT = "constant"
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+    EXPONENTIAL = "exponential"
+
+
+class Latency(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    distribution: LatencyDistribution = LatencyDistribution.CONSTANT
+    mean_ms: float = Field(default=0, ge=0)
+    spread_ms: float = Field(default=0, ge=0)
+
+    def sample_seconds(self, rng: random.Random) -> float:
+        if self.distribution is LatencyDistribution.UNIFORM:
+            value = rng.uniform(self.mean_ms - self.spread_ms, self.mean_ms + self.spread_ms)
+        elif self.distribution is LatencyDistribution.NORMAL:
+            value = rng.gauss(self.mean_ms, self.spread_ms)
+        elif self.distribution is LatencyDistribution.EXPONENTIAL:
+            value = rng.expovariate(1 / self.mean_ms) if self.mean_ms > 0 else 0
+        else:
+            value = self.mean_ms
+        return max(value, 0) / 1000
+
+
+class SlowBody(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    chunk_bytes: int = Field(default=64, ge=1)
+    chunk_delay_ms: float = Field(default=100, ge=0)
+
+
+class FaultRule(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    service: str = "*"
+    method: str = "*"
+    endpoint: str = "*"
+    latency: Latency | None = None
+    error_rate: float = Field(default=0, ge=0, le=1)
+    error_statuses: tuple[int, ...] = (500,)
+    retry_after: str | None = None
+    drop_rate: float = Field(default=0, ge=0, le=1)
+    slow_body: SlowBody | None = None
+    fail_first: int = Field(default=0, ge=0)
+    drop_first: int = Field(default=0, ge=0)
+
+    def matches(self, service: str, method: str, path: str, pattern: re.Pattern[str] | None) -> bool:
+        if self.service not in {"*", service} or self.method.upper() not in {"*", method.upper()}:
+            return False
+        return pattern is None or pattern.match(path) is not None
+
+
+class FaultScenario(BaseModel):
+    seed: int | None = 0
+    rules: list[FaultRule] = Field(default_factory=list)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "FaultScenario":
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+@dataclass(slots=True, frozen=True)
+class FaultDecision:
+    delay_seconds: float = 0.0
+    drop_connection: bool = False
+    status: int | None = None
+    retry_after: str | None = None
+    slow_body: SlowBody | None = None
+
+
+class FaultInjector:
+    def __init__(self, scenario: FaultScenario):
+        self.scenario = scenario
+        self._rng = random.Random(scenario.seed)
+        self._rules = [
+            (rule, None if rule.endpoint == "*" else route_pattern(rule.endpoint)) for rule in scenario.rules
+        ]
+        self._hits = [0] * len(self._rules)
+        self._lock = threading.Lock()
+
+    def decide(self, service: str, method: str, path: str) -> FaultDecision | None:
+        with self._lock:
+            for index, (rule, pattern) in enumerate(self._rules):
+                if rule.matches(service, method, path, pattern):
+                    self._hits[index] += 1
+                    return self._decide(rule, self._hits[index])
+        return None
+
+    def _decide(self, rule: FaultRule, hit: int) -> FaultDecision:
+        delay = rule.latency.sample_seconds(self._rng) if rule.latency is not None else 0.0
+        if hit <= rule.drop_first or self._rng.random() < rule.drop_rate:
+            return FaultDecision(delay_seconds=delay, drop_connection=True)
+
+        status = None
+        if hit <= rule.fail_first:
+            status = rule.error_statuses[(hit - 1) % len(rule.error_statuses)]
+        elif self._rng.random() < rule.error_rate:
+            status = self._rng.choice(rule.error_statuses)
+        retry_after = rule.retry_after if status in {429, 503} else None
+        return FaultDecision(delay_seconds=delay, status=status, retry_after=retry_after, slow_body=rule.slow_body)
+
+    def hits(self) -> list[int]:
+        with self._lock:
+            return list(self._hits)
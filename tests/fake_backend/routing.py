@@ -0,0 +1,113 @@
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import Any
+from urllib.parse import parse_qs
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str | list[str] | None = None):
+        self.status = status
+        self.message = message
+        super().__init__(str(message))
+
+    def body(self) -> dict[str, Any]:
+        phrase = HTTPStatus(self.status).phrase
+        if self.message is None:
+            return {"statusCode": self.status, "message": phrase}
+        return {"statusCode": self.status, "message": self.message, "error": phrase}
+
+
+@dataclass(slots=True)
+class FakeRequest:
+    method: str
+    path: str
+    query: dict[str, list[str]] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    cookies: dict[str, str] = field(default_factory=dict)
+    path_params: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_environ(cls, environ: dict[str, Any], path: str) -> "FakeRequest":
+        headers = {
+            key[5:].replace("_", "-").lower(): value for key, value in environ.items() if key.startswith("HTTP_")
+        }
+        if environ.get("CONTENT_TYPE"):
+            headers["content-type"] = environ["CONTENT_TYPE"]
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length > 0 else b""
+        cookie = SimpleCookie(headers.get("cookie", ""))
+        return cls(
+            method=environ["REQUEST_METHOD"].upper(),
+            path=path,
+            query=parse_qs(environ.get("QUERY_STRING", ""), keep_blank_values=True),
+            headers=headers,
+            body=body,
+            cookies={name: morsel.value for name, morsel in cookie.items()},
+        )
+
+    def json(self) -> Any:
+        if not self.body:
+            return {}
+        try:
+            return json.loads(self.body)
+        except ValueError as exc:
+            raise HttpError(400, "Некорректный JSON") from exc
+
+    def query_value(self, name: str) -> str | None:
+        values = self.query.get(name)
+        return values[-1] if values else None
+
+    @property
+    def bearer_token(self) -> str | None:
+        scheme, _, token = self.headers.get("authorization", "").partition(" ")
+        return token if scheme.lower() == "bearer" and token else None
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    status: int
+    body: Any = None
+    headers: list[tuple[str, str]] = field(default_factory=list)
+
+    def encode(self) -> bytes:
+        if self.body is None:
+            return b""
+        return json.dumps(self.body, ensure_ascii=False).encode("utf-8")
+
+
+type Handler = Callable[[FakeRequest], FakeResponse]
+
+
+def route_pattern(template: str) -> re.Pattern[str]:
+    parts = _PLACEHOLDER.split(template)
+    pattern = "".join(re.escape(part) if index % 2 == 0 else f"(?P<{part}>[^/]+)" for index, part in enumerate(parts))
+    return re.compile(f"^{pattern}$")
+
+
+class Router:
+    def __init__(self) -> None:
+        self._routes: list[tuple[str, str, re.Pattern[str], Handler]] = []
+
+    def add(self, method: str, template: str, handler: Handler) -> None:
+        self._routes.append((method.upper(), template, route_pattern(template), handler))
+
+    def resolve(self, method: str, path: str) -> tuple[str, Handler, dict[str, str]] | None:
+        for route_method, template, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if match is not None and route_method == method:
+                return template, handler, match.groupdict()
+        return None
+
+    def dispatch(self, request: FakeRequest) -> FakeResponse:
+        resolved = self.resolve(request.method, request.path)
+        if resolved is None:
+            raise HttpError(404, f"Cannot {request.method} {request.path}")
+        _, handler, request.path_params = resolved
+        return handler(request)
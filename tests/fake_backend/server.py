@@ -0,0 +1,145 @@
+import json
+import logging
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import unquote
+
+from tests.fake_backend.app import FakeCinescopeBackend, ServiceBaseUrls, service_base_urls, split_service_path
+from tests.fake_backend.faults import FaultDecision, FaultInjector
+
+
+class _WSGIRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_FakeHTTPServer"
+
+    def _handle(self) -> None:
+        path, _, query = self.path.partition("?")
+        decision = None
+        if self.server.faults is not None:
+            service, service_path = split_service_path(unquote(path))
+            decision = self.server.faults.decide(service, self.command, service_path)
+        if decision is not None and self._inject_fault(decision):
+            return
+
+        environ: dict[str, Any] = {
+            "REQUEST_METHOD": self.command,
+            "PATH_INFO": unquote(path, encoding="latin-1"),
+            "QUERY_STRING": query,
+            "CONTENT_TYPE": self.headers.get("Content-Type", ""),
+            "CONTENT_LENGTH": self.headers.get("Content-Length", ""),
+            "SERVER_NAME": self.server.server_address[0],
+            "SERVER_PORT": str(self.server.server_address[1]),
+            "wsgi.input": self.rfile,
+            "wsgi.url_scheme": "http",
+        }
+        for name, value in self.headers.items():
+            environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+
+        status_line: list[str] = []
+        response_headers: list[tuple[str, str]] = []
+
+        def start_response(status: str, headers: list[tuple[str, str]], exc_info: Any = None) -> None:
+            status_line.append(status)
+            response_headers.extend(headers)
+
+        body = b"".join(self.server.app(environ, start_response))
+        self._write_response(int(status_line[0].split(" ", 1)[0]), response_headers, body, decision)
+
+    def _inject_fault(self, decision: FaultDecision) -> bool:
+        if decision.delay_seconds:
+            time.sleep(decision.delay_seconds)
+        if decision.drop_connection:
+            self.close_connection = True
+            return True
+        if decision.status is None:
+            return False
+
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        body = json.dumps({"statusCode": decision.status, "message": HTTPStatus(decision.status).phrase}).encode()
+        headers = [("Content-Type", "application/json; charset=utf-8"), ("Content-Length", str(len(body)))]
+        if decision.retry_after is not None:
+            headers.append(("Retry-After", decision.retry_after))
+        self._write_response(decision.status, headers, body, decision)
+        return True
+
+    def _write_response(
+        self, status: int, headers: list[tuple[str, str]], body: bytes, decision: FaultDecision | None
+    ) -> None:
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        slow_body = decision.slow_body if decision is not None else None
+        if slow_body is None:
+            self.wfile.write(body)
+            return
+        for offset in range(0, len(body), slow_body.chunk_bytes):
+            if offset:
+                time.sleep(slow_body.chunk_delay_ms / 1000)
+            self.wfile.write(body[offset : offset + slow_body.chunk_bytes])
+            self.wfile.flush()
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], app: FakeCinescopeBackend, faults: FaultInjector | None):
+        self.app = app
+        self.faults = faults
+        super().__init__(address, _WSGIRequestHandler)
+
+
+class FakeBackendServer:
+    def __init__(
+        self,
+        app: FakeCinescopeBackend | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: FaultInjector | None = None,
+    ):
+        self.app = app or FakeCinescopeBackend()
+        self.host = host
+        self.port = port
+        self.faults = faults
+        self._server: _FakeHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def base_urls(self) -> ServiceBaseUrls:
+        return service_base_urls(self.url)
+
+    def start(self) -> "FakeBackendServer":
+        self._server = _FakeHTTPServer((self.host, self.port), self.app, self.faults)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-cinescope-backend", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Fake backend Cinescope запущен на {self.url}")
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = self._thread = None
+
+    def __enter__(self) -> "FakeBackendServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -0,0 +1,56 @@
+from collections.abc import Generator
+
+import pytest
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.fake_backend.server import FakeBackendServer
+from tests.models.movie_models import GenreId, Location, Movie, MovieWithReviews
+from tests.models.request_models import MovieCreate
+from tests.models.response_models import ErrorResponse, LoginResponse, MoviesList
+
+
+@pytest.fixture
+def server() -> Generator[FakeBackendServer]:
+    with FakeBackendServer() as server:
+        yield server
+
+
+@pytest.fixture
+def manager(server: FakeBackendServer) -> Generator[ApiManager]:
+    with requests.Session() as session:
+        yield ApiManager(session, **server.base_urls)
+
+
+def test_admin_can_create_and_fetch_movie(server: FakeBackendServer, manager: ApiManager) -> None:
+    login = manager.auth_api.login(server.app.admin_email, server.app.admin_password)
+    assert isinstance(login, LoginResponse)
+
+    payload = MovieCreate(
+        name="Локальный фильм", description="Описание", price=250, location=Location.SPB, genreId=GenreId.COMEDY
+    )
+    created = manager.movies_api.create_movie(payload)
+    assert isinstance(created, Movie)
+
+    fetched = manager.movies_api.get_movie_by_id(created.id)
+    assert isinstance(fetched, MovieWithReviews)
+    assert (fetched.name, fetched.genre_id, fetched.reviews) == ("Локальный фильм", 2, [])
+
+    duplicate = manager.movies_api.create_movie(payload, expected_status=409)
+    assert isinstance(duplicate, ErrorResponse)
+
+
+def test_movies_list_paginates_and_rejects_invalid_params(manager: ApiManager) -> None:
+    movies = manager.movies_api.get_movies({"page": 2, "pageSize": 5, "createdAt": "asc"})
+    assert isinstance(movies, MoviesList)
+    assert (movies.page, movies.page_size, len(movies.movies)) == (2, 5, 5)
+    assert [movie.id for movie in movies.movies] == sorted(movie.id for movie in movies.movies)
+
+    error = manager.movies_api.get_movies_with_invalid_params({"pageSize": 21})
+    assert "pageSize" in str(error.message)
+
+
+def test_user_endpoints_require_authorization(manager: ApiManager) -> None:
+    error = manager.users_api.get_users(expected_status=401)
+    assert isinstance(error, ErrorResponse)
+    assert error.message == "Unauthorized"
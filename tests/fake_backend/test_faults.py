@@ -0,0 +1,88 @@
+import time
+from collections.abc import Generator
+
+import pytest
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.constants.endpoints import MOVIES_ENDPOINT
+from tests.fake_backend.faults import FaultInjector, FaultRule, FaultScenario, Latency, SlowBody
+from tests.fake_backend.server import FakeBackendServer
+from tests.models.response_models import MoviesList
+from tests.request.circuit_breaker import CircuitState, circuit_breakers
+from tests.request.retry_policy import RetryPolicy
+
+_NO_BACKOFF = RetryPolicy(max_attempts=3, backoff_base_seconds=0)
+
+
+@pytest.fixture
+def start_backend() -> Generator:
+    servers: list[FakeBackendServer] = []
+    sessions: list[requests.Session] = []
+
+    def start(*rules: FaultRule) -> tuple[FakeBackendServer, ApiManager]:
+        server = FakeBackendServer(faults=FaultInjector(FaultScenario(seed=7, rules=list(rules)))).start()
+        servers.append(server)
+        sessions.append(requests.Session())
+        manager = ApiManager(sessions[-1], **server.base_urls)
+        manager.movies_api.retry_policy = _NO_BACKOFF
+        return server, manager
+
+    yield start
+    for session in sessions:
+        session.close()
+    for server in servers:
+        server.stop()
+
+
+def test_same_seed_gives_same_fault_sequence() -> None:
+    scenario = FaultScenario(seed=42, rules=[FaultRule(error_rate=0.5, error_statuses=(500, 503, 429))])
+    injectors = [FaultInjector(scenario), FaultInjector(scenario)]
+    sequences = [[injector.decide("api", "GET", "/movies") for _ in range(20)] for injector in injectors]
+    statuses = [decision.status for decision in sequences[0] if decision is not None]
+
+    assert sequences[0] == sequences[1]
+    assert {None, 500, 503, 429} >= set(statuses) and len(set(statuses)) > 1
+
+
+def test_get_is_retried_after_injected_503_and_dropped_connection(start_backend) -> None:
+    server, manager = start_backend(
+        FaultRule(method="GET", endpoint=MOVIES_ENDPOINT, fail_first=1, error_statuses=(503,), retry_after="0"),
+    )
+    assert isinstance(manager.movies_api.get_movies(), MoviesList)
+    assert server.faults is not None and server.faults.hits() == [2]
+
+    server, manager = start_backend(FaultRule(method="GET", endpoint=MOVIES_ENDPOINT, drop_first=2))
+    assert isinstance(manager.movies_api.get_movies(), MoviesList)
+    assert server.faults is not None and server.faults.hits() == [3]
+
+
+def test_post_is_not_retried_after_dropped_connection(start_backend) -> None:
+    server, manager = start_backend(FaultRule(method="POST", endpoint=MOVIES_ENDPOINT, drop_first=1))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        manager.movies_api.post(MOVIES_ENDPOINT, json={})
+    assert server.faults is not None and server.faults.hits() == [1]
+
+
+def test_slow_endpoint_times_out_without_opening_circuit(start_backend) -> None:
+    server, manager = start_backend(FaultRule(endpoint=MOVIES_ENDPOINT, latency=Latency(mean_ms=300)))
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        manager.movies_api.get(MOVIES_ENDPOINT, timeout=(1, 0.05))
+    breaker = circuit_breakers.get(manager.movies_api.base_url)
+    assert breaker is not None and breaker.state is CircuitState.CLOSED
+    assert server.faults is not None and server.faults.hits() == [3]
+
+
+def test_slow_body_is_delivered_in_delayed_chunks(start_backend) -> None:
+    _, manager = start_backend(
+        FaultRule(endpoint=MOVIES_ENDPOINT, slow_body=SlowBody(chunk_bytes=1024, chunk_delay_ms=20)),
+    )
+
+    started = time.perf_counter()
+    response = manager.movies_api.get(MOVIES_ENDPOINT)
+    elapsed = time.perf_counter() - started
+
+    assert response.parse(MoviesList).movies
+    assert elapsed >= (len(response.content) // 1024) * 0.02
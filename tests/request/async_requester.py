@@ -0,0 +1,59 @@
+import asyncio
+import contextvars
+import functools
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any
+
+from tests.config import settings
+from tests.request.custom_requester import ApiResponse, CustomRequester
+
+
+def create_http_executor(max_workers: int | None = None) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=max_workers or settings.async_http_max_workers, thread_name_prefix="async-http"
+    )
+
+
+async def run_in_executor[T](executor: Executor, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+async def gather_limited[T](coroutines: Iterable[Awaitable[T]], limit: int | None = None) -> list[T]:
+    semaphore = asyncio.Semaphore(limit or settings.async_http_concurrency)
+
+    async def run(coroutine: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+
+
+class AsyncCustomRequester[RequesterT: CustomRequester]:
+    def __init__(self, requester: RequesterT, executor: Executor):
+        self.sync = requester
+        self.executor = executor
+
+    @property
+    def base_url(self) -> str:
+        return self.sync.base_url
+
+    async def _call[T](self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await run_in_executor(self.executor, func, *args, **kwargs)
+
+    async def get(self, endpoint: str, params: dict | None = None, **kwargs) -> ApiResponse:
+        return await self._call(self.sync.get, endpoint, params=params, **kwargs)
+
+    async def post(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
+        return await self._call(self.sync.post, endpoint, data=data, json=json, **kwargs)
+
+    async def patch(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
+        return await self._call(self.sync.patch, endpoint, data=data, json=json, **kwargs)
+
+    async def put(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
+        return await self._call(self.sync.put, endpoint, data=data, json=json, **kwargs)
+
+    async def delete(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
+        return await self._call(self.sync.delete, endpoint, data=data, json=json, **kwargs)
@@ -0,0 +1,94 @@
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+
+import allure
+import requests
+
+from tests.config import settings
+from tests.request.background import is_background_traffic
+
+
+class AttachmentMode(StrEnum):
+    ALWAYS = "always"
+    ON_FAILURE = "on_failure"
+    OFF = "off"
+
+
+@dataclass(slots=True, frozen=True)
+class HttpExchange:
+    method: str
+    url: str
+    request_body: bytes | None
+    status_code: int
+    response_body: bytes
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "HttpExchange":
+        request = response.request
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return cls(
+            method=str(request.method),
+            url=str(request.url),
+            request_body=body,
+            status_code=response.status_code,
+            response_body=response.content or b"",
+        )
+
+
+def _format_body(raw: bytes) -> tuple[str, allure.attachment_type]:
+    try:
+        return json.dumps(json.loads(raw), indent=4, ensure_ascii=False), allure.attachment_type.JSON
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return raw.decode("utf-8", errors="replace"), allure.attachment_type.TEXT
+
+
+class HttpExchangeBuffer:
+    def __init__(self, mode: AttachmentMode, maxlen: int):
+        self.mode = mode
+        self._exchanges: deque[HttpExchange] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, response: requests.Response) -> None:
+        if self.mode is not AttachmentMode.ON_FAILURE or is_background_traffic():
+            return
+        exchange = HttpExchange.from_response(response)
+        with self._lock:
+            self._exchanges.append(exchange)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._exchanges.clear()
+
+    def drain(self) -> list[HttpExchange]:
+        with self._lock:
+            exchanges = list(self._exchanges)
+            self._exchanges.clear()
+        return exchanges
+
+    def flush_to_allure(self) -> None:
+        exchanges = self.drain()
+        if not exchanges:
+            return
+        with allure.step(f"HTTP обмены теста (последние {len(exchanges)})"):
+            for index, exchange in enumerate(exchanges, start=1):
+                prefix = f"#{index} {exchange.method} {exchange.url}"
+                if exchange.request_body:
+                    body, attachment_type = _format_body(exchange.request_body)
+                    allure.attach(body=body, name=f"{prefix} - Request Body", attachment_type=attachment_type)
+                body, attachment_type = _format_body(exchange.response_body)
+                allure.attach(
+                    body=body,
+                    name=f"{prefix} - Response {exchange.status_code}",
+                    attachment_type=attachment_type,
+                )
+
+
+http_exchange_buffer = HttpExchangeBuffer(
+    mode=AttachmentMode(settings.http_attachments_mode),
+    maxlen=settings.http_attachments_buffer_size,
+)
@@ -0,0 +1,18 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_background_traffic: ContextVar[bool] = ContextVar("background_traffic", default=False)
+
+
+@contextmanager
+def background_traffic() -> Generator[None]:
+    token = _background_traffic.set(True)
+    try:
+        yield
+    finally:
+        _background_traffic.reset(token)
+
+
+def is_background_traffic() -> bool:
+    return _background_traffic.get()
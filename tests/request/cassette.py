@@ -0,0 +1,211 @@
+import json
+import re
+import threading
+from collections import defaultdict, deque
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from tests.config import settings
+from tests.request.background import is_background_traffic
+
+RECORDED_HEADERS = ("Content-Type", "Set-Cookie", "Retry-After", "Location")
+SHARED_CASSETTE_DIR = "_shared"
+_MASK = "<ignored>"
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class CassetteMode(StrEnum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class CassetteMissError(LookupError):
+    pass
+
+
+class CassetteMatcher:
+    def __init__(self, ignore_fields: list[str], ignore_patterns: list[str]):
+        self.ignore_fields = frozenset(ignore_fields)
+        self.ignore_patterns = [re.compile(pattern) for pattern in ignore_patterns]
+
+    def _mask_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: _MASK if key in self.ignore_fields else self._mask_value(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._mask_value(item) for item in value]
+        if isinstance(value, str):
+            for pattern in self.ignore_patterns:
+                value = pattern.sub(_MASK, value)
+        return value
+
+    def _normalize_body(self, json_data: Any, data: Any) -> Any:
+        if json_data is not None:
+            return self._mask_value(json_data)
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="replace")
+        if isinstance(data, str):
+            try:
+                return self._mask_value(json.loads(data))
+            except ValueError:
+                return self._mask_value(data)
+        return self._mask_value(data)
+
+    def request_key(
+        self,
+        service: str,
+        method: str,
+        endpoint_template: str,
+        *,
+        params: dict | None = None,
+        json_data: Any = None,
+        data: Any = None,
+    ) -> str:
+        query = sorted((str(key), str(self._mask_value(str(value)))) for key, value in (params or {}).items())
+        body = self._normalize_body(json_data, data)
+        return json.dumps(
+            [service, method.upper(), endpoint_template, query, body],
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+
+
+def _service_alias(base_url: str) -> str:
+    aliases = {
+        settings.base_url: "api",
+        settings.base_auth_url: "auth",
+        settings.base_payment_url: "payment",
+    }
+    return aliases.get(base_url, base_url)
+
+
+def cassette_path(directory: Path, node_id: str) -> Path:
+    module, _, name = node_id.partition("::")
+    module_dir = _UNSAFE_PATH_CHARS.sub("_", module.removesuffix(".py"))
+    file_name = _UNSAFE_PATH_CHARS.sub("_", name or "module") or "module"
+    return directory / module_dir / f"{file_name}.json"
+
+
+def build_response(url: str, interaction: dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+    response._content = interaction.get("body", "").encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = url
+    return response
+
+
+class CassetteRecorder:
+    def __init__(self, mode: CassetteMode, directory: Path, matcher: CassetteMatcher):
+        self.mode = mode
+        self.directory = directory
+        self.matcher = matcher
+        self._node_id: str | None = None
+        self._recorded: list[dict[str, Any]] = []
+        self._test_index: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        self._shared_depth = 0
+        self._shared_recorded: list[dict[str, Any]] = []
+        self._shared_index: dict[str, deque[dict[str, Any]]] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not CassetteMode.OFF
+
+    def enter_shared(self) -> None:
+        with self._lock:
+            self._shared_depth += 1
+
+    def exit_shared(self) -> None:
+        with self._lock:
+            self._shared_depth -= 1
+
+    def start_test(self, node_id: str) -> None:
+        with self._lock:
+            self._node_id = node_id
+            self._recorded = []
+            self._test_index = defaultdict(deque)
+            if self.mode is CassetteMode.REPLAY:
+                for interaction in self._load(cassette_path(self.directory, node_id)):
+                    self._test_index[interaction["key"]].append(interaction)
+
+    def finish_test(self) -> None:
+        with self._lock:
+            node_id, recorded = self._node_id, self._recorded
+            self._node_id, self._recorded = None, []
+        if node_id is not None:
+            self._save(cassette_path(self.directory, node_id), node_id, recorded)
+
+    def finish_session(self, worker_id: str) -> None:
+        with self._lock:
+            recorded, self._shared_recorded = self._shared_recorded, []
+        self._save(self.directory / SHARED_CASSETTE_DIR / f"{worker_id}.json", SHARED_CASSETTE_DIR, recorded)
+
+    def _save(self, path: Path, node_id: str, recorded: list[dict[str, Any]]) -> None:
+        if self.mode is not CassetteMode.RECORD or not recorded:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"node_id": node_id, "interactions": recorded}, ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8",
+        )
+
+    def _load(self, path: Path) -> list[dict[str, Any]]:
+        try:
+            cassette = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        interactions: list[dict[str, Any]] = cassette.get("interactions", [])
+        return interactions
+
+    def _shared_queue(self, key: str) -> deque[dict[str, Any]] | None:
+        if self._shared_index is None:
+            self._shared_index = defaultdict(deque)
+            for path in sorted((self.directory / SHARED_CASSETTE_DIR).glob("*.json")):
+                for interaction in self._load(path):
+                    self._shared_index[interaction["key"]].append(interaction)
+        return self._shared_index.get(key)
+
+    def key_for(self, base_url: str, method: str, endpoint_template: str, request_kwargs: dict[str, Any]) -> str:
+        return self.matcher.request_key(
+            _service_alias(base_url),
+            method,
+            endpoint_template,
+            params=request_kwargs.get("params"),
+            json_data=request_kwargs.get("json"),
+            data=request_kwargs.get("data"),
+        )
+
+    def record(self, key: str, response: requests.Response) -> None:
+        interaction = {
+            "key": key,
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "body": response.text,
+        }
+        shared = is_background_traffic()
+        with self._lock:
+            (self._shared_recorded if shared or self._shared_depth else self._recorded).append(interaction)
+
+    def replay(self, key: str, url: str) -> requests.Response:
+        shared = is_background_traffic()
+        with self._lock:
+            queue = self._shared_queue(key) if shared or self._shared_depth else self._test_index.get(key)
+            interaction = queue.popleft() if queue else None
+        if interaction is None:
+            raise CassetteMissError(f"В кассетах нет записи для запроса {key} (тест {self._node_id})")
+        return build_response(url, interaction)
+
+
+cassette_recorder = CassetteRecorder(
+    mode=CassetteMode(settings.http_cassette_mode),
+    directory=Path(settings.http_cassette_dir),
+    matcher=CassetteMatcher(settings.http_cassette_ignore_fields, settings.http_cassette_ignore_patterns),
+)
@@ -0,0 +1,112 @@
+import logging
+import threading
+import time
+from enum import StrEnum
+
+import requests
+
+from tests.config import settings
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(
+        self, name: str, failure_threshold: int, reset_timeout_seconds: float, probe_wait_seconds: float = 10.0
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.probe_wait_seconds = probe_wait_seconds
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._probe_done = threading.Condition(self._lock)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return
+            if self._state is CircuitState.OPEN:
+                remaining = self._opened_at + self.reset_timeout_seconds - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"Сервис {self.name} недоступен: circuit breaker открыт "
+                        f"после {self._consecutive_failures} сбоев подряд, повторная проверка через {remaining:.0f}с"
+                    )
+                self._state = CircuitState.HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                self._probe_done.wait_for(lambda: not self._probe_in_flight, timeout=self.probe_wait_seconds)
+                if self._state is CircuitState.CLOSED:
+                    return
+                raise CircuitOpenError(f"Сервис {self.name} недоступен: пробный запрос не прошел")
+            self._probe_in_flight = True
+            self.logger.info(f"Circuit breaker {self.name}: пробный запрос (half-open)")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is not CircuitState.CLOSED:
+                self.logger.info(f"Circuit breaker {self.name}: сервис снова доступен, закрываем")
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            self._probe_done.notify_all()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if self._state is CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state is not CircuitState.OPEN:
+                    self.logger.warning(
+                        f"Circuit breaker {self.name}: открыт после {self._consecutive_failures} сбоев подряд"
+                    )
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_done.notify_all()
+
+
+class CircuitBreakerRegistry:
+    def __init__(self, failure_threshold: int, reset_timeout_seconds: float, enabled: bool = True):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.enabled = enabled
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str) -> CircuitBreaker | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(base_url)
+            if breaker is None:
+                breaker = CircuitBreaker(base_url, self.failure_threshold, self.reset_timeout_seconds)
+                self._breakers[base_url] = breaker
+            return breaker
+
+    def reset(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+
+
+circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=settings.circuit_breaker_failure_threshold,
+    reset_timeout_seconds=settings.circuit_breaker_reset_timeout_seconds,
+    enabled=settings.circuit_breaker_enabled,
+)
@@ -0,0 +1,95 @@
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tests.config import settings
+
+
+@dataclass(slots=True, frozen=True)
+class PoolStats:
+    requests: int
+    connections_opened: int
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+
+class SharedPoolSession(requests.Session):
+    def __init__(self, shared_adapters: dict[str, HTTPAdapter]):
+        super().__init__()
+        for prefix, adapter in shared_adapters.items():
+            self.mount(prefix, adapter)
+        self._shared_adapters = set(map(id, shared_adapters.values()))
+
+    def close(self) -> None:
+        for prefix in [prefix for prefix, adapter in self.adapters.items() if id(adapter) in self._shared_adapters]:
+            del self.adapters[prefix]
+        super().close()
+
+
+class ConnectionPoolRegistry:
+    def __init__(self, pool_sizes: Callable[[], dict[str, int]], pool_block: bool = True):
+        self._pool_sizes = pool_sizes
+        self._pool_block = pool_block
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def adapter_for(self, base_url: str) -> HTTPAdapter:
+        with self._lock:
+            adapter = self._adapters.get(base_url)
+            if adapter is None:
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self._pool_sizes().get(base_url, requests.adapters.DEFAULT_POOLSIZE),
+                    pool_block=self._pool_block,
+                )
+                self._adapters[base_url] = adapter
+            return adapter
+
+    def create_session(self, *base_urls: str) -> SharedPoolSession:
+        return SharedPoolSession({base_url: self.adapter_for(base_url) for base_url in base_urls})
+
+    def stats(self) -> dict[str, PoolStats]:
+        with self._lock:
+            adapters = dict(self._adapters)
+        result: dict[str, PoolStats] = {}
+        for base_url, adapter in adapters.items():
+            pools = adapter.poolmanager.pools
+            opened = sent = 0
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    opened += pool.num_connections
+                    sent += pool.num_requests
+            result[base_url] = PoolStats(requests=sent, connections_opened=opened)
+        return result
+
+    def log_stats(self) -> None:
+        for base_url, stats in self.stats().items():
+            self.logger.info(
+                f"HTTP пул {base_url}: запросов {stats.requests}, "
+                f"открыто соединений {stats.connections_opened}, переиспользовано {stats.connections_reused}"
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            adapters, self._adapters = list(self._adapters.values()), {}
+        for adapter in adapters:
+            adapter.close()
+
+
+def _configured_pool_sizes() -> dict[str, int]:
+    return {
+        settings.base_url: settings.api_pool_maxsize,
+        settings.base_auth_url: settings.auth_pool_maxsize,
+        settings.base_payment_url: settings.payment_pool_maxsize,
+    }
+
+
+connection_pools = ConnectionPoolRegistry(pool_sizes=_configured_pool_sizes, pool_block=settings.http_pool_block)
@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import json
 import logging
 import os
@@ -7,18 +8,94 @@
 
 import allure
 import requests
+from pydantic import BaseModel, TypeAdapter
+
+from tests.constants.endpoints import Service
+from tests.request.attachments import AttachmentMode, HttpExchangeBuffer, http_exchange_buffer
+from tests.request.background import is_background_traffic
+from tests.request.circuit_breaker import CircuitBreaker, circuit_breakers
+from tests.request.endpoint_templates import resolve_endpoint_template, resolve_request_timeout
+from tests.request.metrics import RequestSample, request_metrics
+from tests.request.reauthentication import session_reauthenticators
+from tests.request.retry_policy import RetryPolicy, default_retry_policy, retry_budget_for, retry_stats
+from tests.request.session_headers import session_headers
+from tests.request.transport import Transport, TransportRequest, default_transport
+
+_UNDECODED = object()
+
+
+@functools.cache
+def _list_adapter[ModelT: BaseModel](model: type[ModelT]) -> TypeAdapter[list[ModelT]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+class ApiResponse:
+    def __init__(self, response: requests.Response):
+        self.raw = response
+        self._json: Any = _UNDECODED
+
+    @property
+    def status_code(self) -> int:
+        return self.raw.status_code
+
+    @property
+    def ok(self) -> bool:
+        return self.raw.ok
+
+    @property
+    def content(self) -> bytes:
+        return self.raw.content
+
+    @property
+    def text(self) -> str:
+        return self.raw.text
+
+    @property
+    def headers(self):
+        return self.raw.headers
+
+    @property
+    def request(self) -> requests.PreparedRequest:
+        return self.raw.request
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+
+    def json(self) -> Any:
+        if self._json is _UNDECODED:
+            self._json = self.raw.json()
+        return self._json
+
+    def parse[ModelT: BaseModel](self, model: type[ModelT]) -> ModelT:
+        if self._json is _UNDECODED:
+            return model.model_validate_json(self.raw.content)
+        return model.model_validate(self._json)
+
+    def parse_list[ModelT: BaseModel](self, model: type[ModelT]) -> list[ModelT]:
+        adapter = _list_adapter(model)
+        if self._json is _UNDECODED:
+            return adapter.validate_json(self.raw.content)
+        return adapter.validate_python(self._json)
 
 
 class CustomRequester:
     base_headers = {"Content-Type": "application/json", "Accept": "application/json"}
     RETRYABLE_EXCEPTIONS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
-    MAX_REQUEST_ATTEMPTS = 2
-    RETRY_DELAY_SECONDS = 1.0
+    retry_policy: RetryPolicy = default_retry_policy
+    service: Service | None = None
 
-    def __init__(self, session: requests.Session, base_url: str):
+    def __init__(
+        self,
+        session: requests.Session,
+        base_url: str,
+        exchange_buffer: HttpExchangeBuffer | None = None,
+        transport: Transport | None = None,
+    ):
         self.session = session
         self.base_url = base_url
-        self.session.headers.update(self.base_headers)
+        self.transport = transport or default_transport()
+        self.exchange_buffer = exchange_buffer or http_exchange_buffer
+        session_headers.update(self.session, self.base_headers)
         self.logger = logging.getLogger(__name__)
 
     def _send_request(
@@ -29,13 +106,13 @@ def _send_request(
         data: Any = None,
         json_data: Any = None,
         **kwargs,
-    ) -> requests.Response:
+    ) -> ApiResponse:
         url = f"{self.base_url}{endpoint}"
 
         expected_status = kwargs.pop("expected_status", None)
 
         request_kwargs = kwargs
-        request_kwargs.setdefault("timeout", 30)
+        request_kwargs.setdefault("timeout", resolve_request_timeout(self.service, method, endpoint))
         if params is not None:
             request_kwargs["params"] = params
         if data is not None:
@@ -44,50 +121,160 @@ def _send_request(
             request_kwargs["json"] = json_data
 
         step_name = f"Выполнение {method.upper()} запроса на {url}"
-        with allure.step(step_name):
-            self._attach_request_details(method, url, params, data, json_data)
-
-            response = None
-            for attempt in range(1, self.MAX_REQUEST_ATTEMPTS + 1):
-                try:
-                    response = self.session.request(method, url, **request_kwargs)
-                    break
-                except self.RETRYABLE_EXCEPTIONS as exc:
-                    if attempt == self.MAX_REQUEST_ATTEMPTS:
-                        raise
-                    self.logger.warning(
-                        f"Сетевой сбой при запросе {method.upper()} {url}: {type(exc).__name__}. "
-                        f"Повтор {attempt + 1}/{self.MAX_REQUEST_ATTEMPTS} через {self.RETRY_DELAY_SECONDS:.1f}с"
-                    )
-                    time.sleep(self.RETRY_DELAY_SECONDS)
-
-            if response is None:
-                raise RuntimeError(f"Не удалось выполнить запрос {method.upper()} {url}")
-            self._attach_response_details(response)
+        background = is_background_traffic()
+        attach_immediately = self.exchange_buffer.mode is AttachmentMode.ALWAYS and not background
+        with contextlib.nullcontext() if background else allure.step(step_name):
+            if attach_immediately:
+                self._attach_request_details(method, url, params, data, json_data)
+
+            raw_response = self._request_with_retries(method, url, endpoint, expected_status, request_kwargs)
+            if (
+                raw_response.status_code == 401
+                and expected_status != 401
+                and session_reauthenticators.reauthenticate(
+                    self.session, str(raw_response.request.headers.get("Authorization", ""))
+                )
+            ):
+                raw_response = self._request_with_retries(method, url, endpoint, expected_status, request_kwargs)
+            response = ApiResponse(raw_response)
+            if attach_immediately:
+                self._attach_response_details(response)
+            else:
+                self.exchange_buffer.record(raw_response)
             self.log_request_and_response(response)
             self._validate_status_code(response, expected_status)
 
             return response
 
-    def get(self, endpoint: str, params: dict | None = None, **kwargs) -> requests.Response:
+    def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        expected_status: int | None,
+        request_kwargs: dict[str, Any],
+    ) -> requests.Response:
+        policy = self.retry_policy
+        budget = retry_budget_for(self.session)
+        breaker = circuit_breakers.get(self.base_url)
+        endpoint_template = resolve_endpoint_template(endpoint)
+        endpoint_key = f"{method.upper()} {endpoint_template}"
+        budget.record_request()
+
+        attempt = 1
+        while True:
+            failure: Exception | None = None
+            try:
+                response = self._perform_guarded_request(breaker, method, url, endpoint_template, request_kwargs)
+            except self.RETRYABLE_EXCEPTIONS as exc:
+                if not policy.should_retry_exception(method, exc, attempt):
+                    raise
+                failure = exc
+                reason = type(exc).__name__
+                delay = policy.delay_for(attempt)
+            else:
+                status_code = response.status_code
+                if status_code == expected_status or not policy.should_retry_status(method, status_code, attempt):
+                    return response
+                reason = f"HTTP {status_code}"
+                delay = policy.delay_for(attempt, status_code, response.headers.get("Retry-After"))
+
+            if not budget.try_spend():
+                retry_stats.record_budget_exhausted(endpoint_key)
+                self.logger.warning(f"Бюджет повторов сессии исчерпан, {endpoint_key} не повторяется ({reason})")
+                if failure is not None:
+                    raise failure
+                return response
+
+            self.logger.warning(
+                f"Сбой при запросе {method.upper()} {url}: {reason}. "
+                f"Повтор {attempt + 1}/{policy.max_attempts} через {delay:.2f}с"
+            )
+            retry_stats.record_retry(endpoint_key, reason, delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def _perform_guarded_request(
+        self,
+        breaker: CircuitBreaker | None,
+        method: str,
+        url: str,
+        endpoint_template: str,
+        request_kwargs: dict[str, Any],
+    ) -> requests.Response:
+        if breaker is None:
+            return self._perform_request(method, url, endpoint_template, request_kwargs)
+        breaker.before_request()
+        try:
+            response = self._perform_request(method, url, endpoint_template, request_kwargs)
+        except requests.exceptions.ConnectionError:
+            breaker.record_failure()
+            raise
+        except requests.exceptions.Timeout:
+            breaker.record_success()
+            raise
+        except BaseException:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return response
+
+    def _perform_request(
+        self, method: str, url: str, endpoint_template: str, request_kwargs: dict[str, Any]
+    ) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            response = self.transport.send(
+                self.session, TransportRequest(method, url, self.base_url, endpoint_template, request_kwargs)
+            )
+        except Exception:
+            self._record_sample(method, endpoint_template, started, None)
+            raise
+        self._record_sample(method, endpoint_template, started, response)
+        return response
+
+    def _record_sample(
+        self, method: str, endpoint_template: str, started: float, response: requests.Response | None
+    ) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        bytes_sent = bytes_received = 0
+        if response is not None:
+            body = response.request.body
+            if isinstance(body, str):
+                body = body.encode()
+            bytes_sent = len(body) if isinstance(body, bytes) else 0
+            bytes_received = len(response.content)
+        request_metrics.record(
+            RequestSample(
+                service=self.base_url,
+                method=method.upper(),
+                endpoint=endpoint_template,
+                status=response.status_code if response is not None else None,
+                elapsed_ms=elapsed_ms,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+            )
+        )
+
+    def get(self, endpoint: str, params: dict | None = None, **kwargs) -> ApiResponse:
         return self._send_request("GET", endpoint, params=params, **kwargs)
 
-    def post(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> requests.Response:
+    def post(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
         return self._send_request("POST", endpoint, data=data, json_data=json, **kwargs)
 
-    def patch(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> requests.Response:
+    def patch(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
         return self._send_request("PATCH", endpoint, data=data, json_data=json, **kwargs)
 
-    def put(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> requests.Response:
+    def put(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
         return self._send_request("PUT", endpoint, data=data, json_data=json, **kwargs)
 
-    def delete(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> requests.Response:
+    def delete(self, endpoint: str, data: Any = None, json: Any = None, **kwargs) -> ApiResponse:
         return self._send_request("DELETE", endpoint, data=data, json_data=json, **kwargs)
 
     def _update_session_headers(self, **kwargs):
-        self.session.headers.update(kwargs)
+        session_headers.update(self.session, kwargs)
 
-    def _validate_status_code(self, response: requests.Response, expected_status: int | None):
+    def _validate_status_code(self, response: ApiResponse, expected_status: int | None):
         if expected_status:
             assert response.status_code == expected_status, (
                 f"Ожидался статус-код {expected_status}, но получен {response.status_code}. "
@@ -119,7 +306,7 @@ def _attach_request_details(self, method, url, params, data, json_data):
                 attachment_type=allure.attachment_type.TEXT,
             )
 
-    def _attach_response_details(self, response):
+    def _attach_response_details(self, response: ApiResponse):
         status_code = response.status_code
         allure.attach(
             body=str(status_code),
@@ -129,13 +316,15 @@ def _attach_response_details(self, response):
         try:
             response_body = json.dumps(response.json(), indent=4, ensure_ascii=False)
             attachment_type = allure.attachment_type.JSON
-        except (json.JSONDecodeError, AttributeError):
+        except (ValueError, AttributeError):
             response_body = response.text
             attachment_type = allure.attachment_type.TEXT
 
         allure.attach(body=response_body, name="Response Body", attachment_type=attachment_type)
 
-    def log_request_and_response(self, response):
+    def log_request_and_response(self, response: ApiResponse):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         try:
             request = response.request
             GREEN = "\033[32m"
@@ -161,8 +350,8 @@ def log_request_and_response(self, response):
             )
 
             response_data = response.text
-            with contextlib.suppress(json.JSONDecodeError):
-                response_data = json.dumps(json.loads(response.text), indent=4, ensure_ascii=False)
+            with contextlib.suppress(ValueError):
+                response_data = json.dumps(response.json(), indent=4, ensure_ascii=False)
 
             self.logger.info(f"\n{'=' * 40} RESPONSE {'=' * 40}")
             if not response.ok:
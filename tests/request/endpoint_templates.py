@@ -0,0 +1,58 @@
+import functools
+import re
+
+from tests.config import settings
+from tests.constants import endpoints
+from tests.constants.endpoints import ENDPOINT_TIMEOUTS, Service
+from tests.constants.timeouts import RequestTimeout, TimeoutProfile
+
+_PLACEHOLDER = re.compile(r"\{[^/{}]+\}")
+
+
+@functools.cache
+def _template_pattern(template: str) -> re.Pattern[str]:
+    literal_parts = _PLACEHOLDER.split(template)
+    return re.compile("^" + "[^/]+".join(re.escape(part) for part in literal_parts) + "$")
+
+
+@functools.cache
+def _known_templates() -> tuple[tuple[re.Pattern[str], str], ...]:
+    templates = {
+        value for name, value in vars(endpoints).items() if name.endswith("_ENDPOINT") and isinstance(value, str)
+    }
+    ordered = sorted(templates, key=lambda template: (template.count("{"), -len(template)))
+    return tuple((_template_pattern(template), template) for template in ordered)
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_endpoint_template(endpoint: str) -> str:
+    path = endpoint.split("?", 1)[0]
+    for pattern, template in _known_templates():
+        if pattern.match(path):
+            return template
+    for _, template in _known_templates():
+        if "{" not in template and path.startswith(f"{template}/"):
+            return f"{template}/*"
+    return path
+
+
+def _override(key: str) -> RequestTimeout | None:
+    override = settings.endpoint_timeouts.get(key)
+    return RequestTimeout(*override) if override is not None else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _timeout_profile(service: Service | None, method: str, path: str) -> tuple[str, TimeoutProfile] | None:
+    for (profile_service, profile_method, template), profile in ENDPOINT_TIMEOUTS.items():
+        if (profile_service, profile_method) == (service, method) and _template_pattern(template).match(path):
+            return template, profile
+    return None
+
+
+def resolve_request_timeout(service: Service | None, method: str, endpoint: str) -> RequestTimeout:
+    method = method.upper()
+    match = _timeout_profile(service, method, endpoint.split("?", 1)[0])
+    if match is None:
+        return _override(TimeoutProfile.DEFAULT.name) or TimeoutProfile.DEFAULT.value
+    template, profile = match
+    return _override(f"{service} {method} {template}") or _override(profile.name) or profile.value
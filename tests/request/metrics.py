@@ -0,0 +1,137 @@
+import json
+import math
+import threading
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+LATENCY_BUCKET_GROWTH = 1.02
+MIN_LATENCY_MS = 0.001
+
+
+@dataclass(slots=True, frozen=True)
+class RequestSample:
+    service: str
+    method: str
+    endpoint: str
+    status: int | None
+    elapsed_ms: float
+    bytes_sent: int
+    bytes_received: int
+
+
+def latency_bucket(elapsed_ms: float) -> int:
+    return math.ceil(math.log(max(elapsed_ms, MIN_LATENCY_MS)) / math.log(LATENCY_BUCKET_GROWTH))
+
+
+def bucket_latency(bucket: int) -> float:
+    return LATENCY_BUCKET_GROWTH**bucket * 2 / (1 + LATENCY_BUCKET_GROWTH)
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    service: str
+    method: str
+    endpoint: str
+    count: int = 0
+    errors: int = 0
+    max_ms: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency_buckets: dict[int, int] = field(default_factory=dict)
+
+    def add(self, sample: RequestSample) -> None:
+        self.count += 1
+        if sample.status is None or sample.status >= 500:
+            self.errors += 1
+        self.max_ms = max(self.max_ms, sample.elapsed_ms)
+        self.bytes_sent += sample.bytes_sent
+        self.bytes_received += sample.bytes_received
+        bucket = latency_bucket(sample.elapsed_ms)
+        self.latency_buckets[bucket] = self.latency_buckets.get(bucket, 0) + 1
+
+    def merge(self, other: "EndpointStats") -> None:
+        self.count += other.count
+        self.errors += other.errors
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+        for bucket, count in other.latency_buckets.items():
+            self.latency_buckets[bucket] = self.latency_buckets.get(bucket, 0) + count
+
+    def percentile(self, percent: float) -> float:
+        return min(percentile(self.latency_buckets, percent), self.max_ms)
+
+
+def percentile(latency_buckets: dict[int, int], percent: float) -> float:
+    total = sum(latency_buckets.values())
+    if not total:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * total), 1)
+    seen = 0
+    for bucket in sorted(latency_buckets):
+        seen += latency_buckets[bucket]
+        if seen >= rank:
+            return bucket_latency(bucket)
+    return 0.0
+
+
+def build_latency_report(endpoints: list[EndpointStats]) -> list[dict[str, Any]]:
+    report = [
+        {
+            "service": stats.service,
+            "method": stats.method,
+            "endpoint": stats.endpoint,
+            "count": stats.count,
+            "errors": stats.errors,
+            "p50_ms": round(stats.percentile(50), 2),
+            "p95_ms": round(stats.percentile(95), 2),
+            "p99_ms": round(stats.percentile(99), 2),
+            "max_ms": round(stats.max_ms, 2),
+            "bytes_sent": stats.bytes_sent,
+            "bytes_received": stats.bytes_received,
+        }
+        for stats in endpoints
+    ]
+    return sorted(report, key=lambda row: row["p95_ms"], reverse=True)
+
+
+class RequestMetrics:
+    def __init__(self) -> None:
+        self._endpoints: dict[tuple[str, str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, service: str, method: str, endpoint: str) -> EndpointStats:
+        stats = self._endpoints.get((service, method, endpoint))
+        if stats is None:
+            stats = self._endpoints[(service, method, endpoint)] = EndpointStats(service, method, endpoint)
+        return stats
+
+    def record(self, sample: RequestSample) -> None:
+        with self._lock:
+            self._endpoint(sample.service, sample.method, sample.endpoint).add(sample)
+
+    def merge(self, endpoints: list[EndpointStats]) -> None:
+        with self._lock:
+            for other in endpoints:
+                self._endpoint(other.service, other.method, other.endpoint).merge(other)
+
+    def endpoints(self) -> list[EndpointStats]:
+        with self._lock:
+            return [replace(stats, latency_buckets=dict(stats.latency_buckets)) for stats in self._endpoints.values()]
+
+    def dump(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([asdict(stats) for stats in self.endpoints()]), encoding="utf-8")
+
+    @staticmethod
+    def load(paths: list[Path]) -> list[EndpointStats]:
+        endpoints: list[EndpointStats] = []
+        for path in paths:
+            for item in json.loads(path.read_text(encoding="utf-8")):
+                buckets = {int(bucket): count for bucket, count in item["latency_buckets"].items()}
+                endpoints.append(EndpointStats(**{**item, "latency_buckets": buckets}))
+        return endpoints
+
+
+request_metrics = RequestMetrics()
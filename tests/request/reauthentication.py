@@ -0,0 +1,35 @@
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from weakref import WeakKeyDictionary
+
+import requests
+
+_reauthenticating: ContextVar[bool] = ContextVar("reauthenticating", default=False)
+
+
+class SessionReauthenticators:
+    def __init__(self) -> None:
+        self._reauthenticators: WeakKeyDictionary[requests.Session, Callable[[str], object]] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def bind(self, session: requests.Session, reauthenticate: Callable[[str], object]) -> None:
+        with self._lock:
+            self._reauthenticators[session] = reauthenticate
+
+    def reauthenticate(self, session: requests.Session, rejected_authorization: str) -> bool:
+        if _reauthenticating.get():
+            return False
+        with self._lock:
+            reauthenticate = self._reauthenticators.get(session)
+        if reauthenticate is None:
+            return False
+        token = _reauthenticating.set(True)
+        try:
+            reauthenticate(rejected_authorization)
+        finally:
+            _reauthenticating.reset(token)
+        return True
+
+
+session_reauthenticators = SessionReauthenticators()
@@ -0,0 +1,141 @@
+import email.utils
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+import requests
+
+from tests.config import settings
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 8.0
+    max_retry_after_seconds: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    retry_after_statuses: frozenset[int] = frozenset({429, 503})
+    idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def should_retry_exception(self, method: str, exc: Exception, attempt: int) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            return True
+        return isinstance(exc, requests.exceptions.Timeout | requests.exceptions.ConnectionError) and (
+            self.is_idempotent(method)
+        )
+
+    def should_retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        if attempt >= self.max_attempts or status_code not in self.retry_statuses:
+            return False
+        return status_code == 429 or self.is_idempotent(method)
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def delay_for(self, attempt: int, status_code: int | None = None, retry_after: str | None = None) -> float:
+        if status_code in self.retry_after_statuses and retry_after:
+            parsed = parse_retry_after(retry_after)
+            if parsed is not None:
+                return min(parsed, self.max_retry_after_seconds)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: str) -> float | None:
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryBudget:
+    def __init__(self, ratio: float, capacity: float):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.capacity)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+@dataclass(slots=True)
+class EndpointRetryStats:
+    retries: int = 0
+    wait_seconds: float = 0.0
+    budget_exhausted: int = 0
+    reasons: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class RetryStats:
+    def __init__(self) -> None:
+        self._stats: dict[str, EndpointRetryStats] = defaultdict(EndpointRetryStats)
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record_retry(self, endpoint: str, reason: str, delay: float) -> None:
+        with self._lock:
+            stats = self._stats[endpoint]
+            stats.retries += 1
+            stats.wait_seconds += delay
+            stats.reasons[reason] += 1
+
+    def record_budget_exhausted(self, endpoint: str) -> None:
+        with self._lock:
+            self._stats[endpoint].budget_exhausted += 1
+
+    def snapshot(self) -> dict[str, EndpointRetryStats]:
+        with self._lock:
+            return dict(self._stats)
+
+    def log_summary(self) -> None:
+        for endpoint, stats in sorted(self.snapshot().items()):
+            self.logger.info(
+                f"Повторы {endpoint}: {stats.retries} (ожидание {stats.wait_seconds:.1f}с, "
+                f"бюджет исчерпан {stats.budget_exhausted} раз), причины: {dict(stats.reasons)}"
+            )
+
+
+_budgets: weakref.WeakKeyDictionary[object, RetryBudget] = weakref.WeakKeyDictionary()
+_budgets_lock = threading.Lock()
+
+
+def retry_budget_for(session: object) -> RetryBudget:
+    with _budgets_lock:
+        budget = _budgets.get(session)
+        if budget is None:
+            budget = RetryBudget(ratio=settings.retry_budget_ratio, capacity=settings.retry_budget_capacity)
+            _budgets[session] = budget
+        return budget
+
+
+default_retry_policy = RetryPolicy(
+    max_attempts=settings.retry_max_attempts,
+    backoff_base_seconds=settings.retry_backoff_base_seconds,
+    backoff_max_seconds=settings.retry_backoff_max_seconds,
+)
+retry_stats = RetryStats()
@@ -0,0 +1,25 @@
+import threading
+from collections.abc import Mapping
+from weakref import WeakKeyDictionary
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class SessionHeaders:
+    def __init__(self) -> None:
+        self._locks: WeakKeyDictionary[requests.Session, threading.Lock] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _lock_for(self, session: requests.Session) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(session, threading.Lock())
+
+    def update(self, session: requests.Session, headers: Mapping[str, str | bytes], replace: bool = False) -> None:
+        with self._lock_for(session):
+            updated: CaseInsensitiveDict[str | bytes] = CaseInsensitiveDict({} if replace else session.headers)
+            updated.update(headers)
+            session.headers = updated
+
+
+session_headers = SessionHeaders()
@@ -0,0 +1,108 @@
+import pytest
+import requests
+
+from tests.request.background import background_traffic
+from tests.request.cassette import CassetteMatcher, CassetteMissError, CassetteMode, CassetteRecorder
+from tests.utils.concurrency import run_batch
+
+_MATCHER = CassetteMatcher(
+    ignore_fields=["password"],
+    ignore_patterns=[r"autotest-[0-9a-f]+@[\w.-]+"],
+)
+_NODE_ID = "tests/api/test_users.py::TestUsers::test_create_user[admin]"
+
+
+def _response(status: int, body: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers["Content-Type"] = "application/json"
+    response._content = body.encode("utf-8")
+    return response
+
+
+def test_request_key_ignores_generated_values_and_query_order() -> None:
+    first = _MATCHER.request_key(
+        "auth",
+        "post",
+        "/user",
+        params={"b": 2, "a": 1},
+        json_data={"email": "autotest-1a2b@gmail.com", "password": "x"},
+    )
+    second = _MATCHER.request_key(
+        "auth",
+        "POST",
+        "/user",
+        params={"a": 1, "b": 2},
+        json_data={"email": "autotest-ffff@gmail.com", "password": "y"},
+    )
+    other_service = _MATCHER.request_key("payment", "POST", "/user", params={"a": 1, "b": 2})
+
+    assert first == second
+    assert first != other_service
+
+
+def test_recorded_cassette_is_replayed_in_order(tmp_path) -> None:
+    key = _MATCHER.request_key("api", "GET", "/movies/{movie_id}")
+    recorder = CassetteRecorder(CassetteMode.RECORD, tmp_path, _MATCHER)
+    recorder.start_test(_NODE_ID)
+    recorder.record(key, _response(200, '{"id": 1}'))
+    recorder.record(key, _response(404, '{"message": "not found"}'))
+    recorder.finish_test()
+
+    replayer = CassetteRecorder(CassetteMode.REPLAY, tmp_path, _MATCHER)
+    replayer.start_test(_NODE_ID)
+
+    first = replayer.replay(key, "https://api.test/movies/1")
+    second = replayer.replay(key, "https://api.test/movies/1")
+    assert (first.status_code, first.json()) == (200, {"id": 1})
+    assert second.status_code == 404
+    assert first.headers["content-type"] == "application/json"
+
+
+def test_shared_fixture_traffic_is_replayed_only_from_shared_cassette(tmp_path) -> None:
+    login_key = _MATCHER.request_key("auth", "POST", "/login", json_data={"email": "admin", "password": "secret"})
+    recorder = CassetteRecorder(CassetteMode.RECORD, tmp_path, _MATCHER)
+    recorder.start_test("tests/api/test_auth.py::test_login")
+    recorder.enter_shared()
+    recorder.record(login_key, _response(200, '{"accessToken": "shared"}'))
+    recorder.exit_shared()
+    recorder.record(login_key, _response(200, '{"accessToken": "own"}'))
+    recorder.finish_test()
+    recorder.finish_session("gw0")
+
+    replayer = CassetteRecorder(CassetteMode.REPLAY, tmp_path, _MATCHER)
+    replayer.start_test(_NODE_ID)
+    with pytest.raises(CassetteMissError):
+        replayer.replay(login_key, "https://auth.test/login")
+
+    replayer.enter_shared()
+    assert replayer.replay(login_key, "https://auth.test/login").json() == {"accessToken": "shared"}
+
+
+def test_background_traffic_is_recorded_to_shared_cassette_from_batch_threads(tmp_path) -> None:
+    movie_key = _MATCHER.request_key("api", "GET", "/movies/{movie_id}")
+    recorder = CassetteRecorder(CassetteMode.RECORD, tmp_path, _MATCHER)
+    recorder.start_test(_NODE_ID)
+    with background_traffic():
+        run_batch(lambda body: recorder.record(movie_key, _response(200, body)), ['{"id": 1}'], 1)
+    recorder.finish_test()
+    recorder.finish_session("gw0")
+
+    replayer = CassetteRecorder(CassetteMode.REPLAY, tmp_path, _MATCHER)
+    replayer.start_test(_NODE_ID)
+    with pytest.raises(CassetteMissError):
+        replayer.replay(movie_key, "https://api.test/movies/1")
+    with background_traffic():
+        assert replayer.replay(movie_key, "https://api.test/movies/1").json() == {"id": 1}
+
+
+def test_request_key_keeps_business_fields_and_masks_timestamps() -> None:
+    matcher = CassetteMatcher(ignore_fields=[], ignore_patterns=[r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?"])
+
+    cheap = matcher.request_key("api", "POST", "/movies", json_data={"name": "Фильм", "price": 100})
+    expensive = matcher.request_key("api", "POST", "/movies", json_data={"name": "Фильм", "price": 500})
+    first_day = matcher.request_key("api", "GET", "/movies", params={"createdAt": "2026-01-01T00:00:00.000Z"})
+    second_day = matcher.request_key("api", "GET", "/movies", params={"createdAt": "2026-02-01T10:00:00.000Z"})
+
+    assert cheap != expensive
+    assert first_day == second_day
@@ -0,0 +1,137 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from tests.request.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, CircuitState
+from tests.request.custom_requester import CustomRequester
+
+
+def _state(breaker: CircuitBreaker) -> CircuitState:
+    return breaker.state
+
+
+def test_breaker_opens_fails_fast_and_half_opens_after_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("tests.request.circuit_breaker.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(
+        "https://payment.test", failure_threshold=2, reset_timeout_seconds=30, probe_wait_seconds=0
+    )
+
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    assert _state(breaker) is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    now[0] += 31
+    breaker.before_request()
+    assert _state(breaker) is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert _state(breaker) is CircuitState.CLOSED
+
+
+def test_half_open_callers_wait_for_probe_instead_of_failing() -> None:
+    breaker = CircuitBreaker("https://api.test", failure_threshold=1, reset_timeout_seconds=0)
+    breaker.record_failure()
+    breaker.before_request()
+    waiter_errors: list[Exception] = []
+
+    def wait_for_probe() -> None:
+        try:
+            breaker.before_request()
+        except CircuitOpenError as exc:
+            waiter_errors.append(exc)
+
+    waiters = [threading.Thread(target=wait_for_probe) for _ in range(3)]
+    for waiter in waiters:
+        waiter.start()
+    breaker.record_success()
+    for waiter in waiters:
+        waiter.join(timeout=5)
+
+    assert waiter_errors == []
+    assert _state(breaker) is CircuitState.CLOSED
+
+
+def test_half_open_caller_fails_fast_when_probe_fails_without_extra_failure() -> None:
+    breaker = CircuitBreaker("https://api.test", failure_threshold=1, reset_timeout_seconds=0, probe_wait_seconds=0)
+    breaker.record_failure()
+    breaker.before_request()
+
+    with pytest.raises(CircuitOpenError, match="пробный запрос"):
+        breaker.before_request()
+    assert _state(breaker) is CircuitState.HALF_OPEN
+
+
+def _requester_with_failing_session(monkeypatch: pytest.MonkeyPatch, error: Exception) -> tuple[CustomRequester, Mock]:
+    monkeypatch.setattr(
+        "tests.request.custom_requester.circuit_breakers",
+        CircuitBreakerRegistry(failure_threshold=2, reset_timeout_seconds=60),
+    )
+    monkeypatch.setattr("tests.request.custom_requester.time.sleep", lambda _: None)
+    session = Mock()
+    session.headers = {}
+    session.request.side_effect = error
+    return CustomRequester(session=session, base_url="https://down.test"), session
+
+
+def test_requester_raises_circuit_open_error_when_service_is_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    requester, session = _requester_with_failing_session(
+        monkeypatch, requests.exceptions.ConnectionError("connection refused")
+    )
+
+    with pytest.raises(CircuitOpenError, match="circuit breaker"):
+        requester.get("/genres")
+    with pytest.raises(CircuitOpenError):
+        requester.get("/genres")
+
+    assert session.request.call_count == 2
+
+
+def test_read_timeouts_do_not_open_circuit(monkeypatch: pytest.MonkeyPatch) -> None:
+    requester, session = _requester_with_failing_session(monkeypatch, requests.exceptions.ReadTimeout("slow"))
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            requester.get("/genres")
+
+    assert session.request.call_count == 6
+
+
+def test_unexpected_probe_error_reopens_circuit_instead_of_sticking_half_open(monkeypatch: pytest.MonkeyPatch) -> None:
+    breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout_seconds=0)
+    monkeypatch.setattr("tests.request.custom_requester.circuit_breakers", breakers)
+    monkeypatch.setattr("tests.request.custom_requester.time.sleep", lambda _: None)
+    monkeypatch.setattr(CustomRequester, "log_request_and_response", lambda *args, **kwargs: None)
+    healthy = Mock()
+    healthy.ok = True
+    healthy.status_code = 200
+    healthy.content = b"{}"
+    healthy.headers = {}
+    healthy.request.body = None
+    session = Mock()
+    session.headers = {}
+    session.request.side_effect = [
+        requests.exceptions.ConnectionError("connection refused"),
+        requests.exceptions.ConnectionError("connection refused"),
+        requests.exceptions.ChunkedEncodingError("broken chunk"),
+        healthy,
+        healthy,
+    ]
+    requester = CustomRequester(session=session, base_url="https://flaky.test")
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        requester.get("/genres")
+    breaker = breakers.get("https://flaky.test")
+    assert breaker is not None
+    assert _state(breaker) is CircuitState.OPEN
+
+    assert requester.get("/genres").status_code == 200
+    assert requester.get("/genres").status_code == 200
+    assert _state(breaker) is CircuitState.CLOSED
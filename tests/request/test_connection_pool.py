@@ -0,0 +1,87 @@
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from tests.request.connection_pool import ConnectionPoolRegistry
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_base_url() -> Generator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sessions_share_keep_alive_connections(local_base_url: str) -> None:
+    registry = ConnectionPoolRegistry(pool_sizes=lambda: {local_base_url: 2})
+
+    first = registry.create_session(local_base_url)
+    first.get(f"{local_base_url}/ping", timeout=5)
+    first.close()
+
+    second = registry.create_session(local_base_url)
+    second.get(f"{local_base_url}/ping", timeout=5)
+    second.get(f"{local_base_url}/ping", timeout=5)
+    second.close()
+
+    stats = registry.stats()[local_base_url]
+    registry.close()
+
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.connections_reused == 2
+
+
+def test_pool_size_is_resolved_when_session_is_created() -> None:
+    pool_sizes = {"http://api.test": 2}
+    registry = ConnectionPoolRegistry(pool_sizes=lambda: pool_sizes)
+    pool_sizes = {"http://api.test": 7}
+
+    session = registry.create_session("http://api.test")
+
+    assert session.adapters["http://api.test"]._pool_maxsize == 7  # type: ignore[attr-defined]
+    session.close()
+    registry.close()
+
+
+def test_session_close_keeps_shared_adapter_and_closes_own_adapters(
+    monkeypatch: pytest.MonkeyPatch, local_base_url: str
+) -> None:
+    registry = ConnectionPoolRegistry(pool_sizes=lambda: {local_base_url: 2})
+    session = registry.create_session(local_base_url)
+    shared = session.adapters[local_base_url]
+    own = [adapter for prefix, adapter in session.adapters.items() if prefix != local_base_url]
+    closed: list[HTTPAdapter] = []
+    for adapter in own:
+        monkeypatch.setattr(adapter, "close", lambda adapter=adapter: closed.append(adapter))
+
+    session.get(f"{local_base_url}/ping", timeout=5)
+    session.close()
+
+    assert closed == own
+    assert registry.adapter_for(local_base_url) is shared
+    assert registry.stats()[local_base_url].connections_opened == 1
+    registry.close()
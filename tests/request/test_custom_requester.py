@@ -3,7 +3,11 @@
 import pytest
 import requests
 
-from tests.request.custom_requester import CustomRequester
+from tests.models.response_models import DeletedObject
+from tests.request.attachments import AttachmentMode, HttpExchangeBuffer
+from tests.request.custom_requester import ApiResponse, CustomRequester
+from tests.request.metrics import RequestMetrics
+from tests.request.retry_policy import RetryBudget, retry_stats
 
 
 def test_send_request_retries_once_on_read_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -14,6 +18,7 @@ def test_send_request_retries_once_on_read_timeout(monkeypatch: pytest.MonkeyPat
     successful_response.ok = True
     successful_response.status_code = 200
     successful_response.text = "{}"
+    successful_response.content = b"{}"
     successful_response.json.return_value = {}
 
     session.request.side_effect = [
@@ -28,5 +33,124 @@ def test_send_request_retries_once_on_read_timeout(monkeypatch: pytest.MonkeyPat
     requester = CustomRequester(session=session, base_url="https://example.test")
     response = requester.get("/ping")
 
-    assert response is successful_response
+    assert response.raw is successful_response
     assert session.request.call_count == 2
+
+
+def test_send_request_buffers_exchange_instead_of_attaching(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = Mock()
+    session.headers = {}
+
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.content = b'{"id": 1}'
+    response.request.method = "GET"
+    response.request.url = "https://example.test/ping"
+    response.request.body = None
+    session.request.return_value = response
+
+    attach_calls: list[object] = []
+    monkeypatch.setattr(CustomRequester, "_attach_request_details", lambda *args, **kwargs: attach_calls.append(args))
+    monkeypatch.setattr(CustomRequester, "_attach_response_details", lambda *args, **kwargs: attach_calls.append(args))
+    monkeypatch.setattr(CustomRequester, "log_request_and_response", lambda *args, **kwargs: None)
+
+    buffer = HttpExchangeBuffer(mode=AttachmentMode.ON_FAILURE, maxlen=1)
+    requester = CustomRequester(session=session, base_url="https://example.test", exchange_buffer=buffer)
+    requester.get("/ping")
+    requester.get("/ping")
+
+    exchanges = buffer.drain()
+    assert attach_calls == []
+    assert len(exchanges) == 1
+    assert exchanges[0].response_body == b'{"id": 1}'
+
+
+def test_send_request_counts_sent_bytes_of_encoded_text_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = Mock()
+    session.headers = {}
+    response = Mock()
+    response.ok = True
+    response.status_code = 201
+    response.content = b"{}"
+    response.request.body = '{"name": "Фильм"}'
+    session.request.return_value = response
+
+    metrics = RequestMetrics()
+    monkeypatch.setattr("tests.request.custom_requester.request_metrics", metrics)
+    monkeypatch.setattr(CustomRequester, "_attach_request_details", lambda *args, **kwargs: None)
+    monkeypatch.setattr(CustomRequester, "_attach_response_details", lambda *args, **kwargs: None)
+    monkeypatch.setattr(CustomRequester, "log_request_and_response", lambda *args, **kwargs: None)
+
+    CustomRequester(session=session, base_url="https://example.test").post("/movies", data='{"name": "Фильм"}')
+
+    [stats] = metrics.endpoints()
+    assert stats.bytes_sent == len('{"name": "Фильм"}'.encode())
+
+
+def test_api_response_decodes_body_once() -> None:
+    raw_response = Mock()
+    raw_response.content = b'{"id": 7}'
+    raw_response.json.return_value = {"id": 7}
+
+    response = ApiResponse(raw_response)
+
+    assert response.parse(DeletedObject).id == 7
+    raw_response.json.assert_not_called()
+
+    assert response.json() == {"id": 7}
+    assert response.json() == {"id": 7}
+    assert response.parse(DeletedObject).id == 7
+    raw_response.json.assert_called_once()
+
+
+def _mock_session(*side_effect: object) -> Mock:
+    session = Mock()
+    session.headers = {}
+    session.request.side_effect = list(side_effect)
+    return session
+
+
+def _mock_response(status_code: int, headers: dict[str, str] | None = None) -> Mock:
+    response = Mock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = b"{}"
+    return response
+
+
+def test_send_request_does_not_retry_post_on_read_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(CustomRequester, "log_request_and_response", lambda *args, **kwargs: None)
+    session = _mock_session(requests.exceptions.ReadTimeout("timeout"), _mock_response(201))
+
+    requester = CustomRequester(session=session, base_url="https://example.test")
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        requester.post("/movies", json={})
+
+    assert session.request.call_count == 1
+
+
+def test_send_request_honors_retry_after_on_503(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr(CustomRequester, "log_request_and_response", lambda *args, **kwargs: None)
+    monkeypatch.setattr("tests.request.custom_requester.time.sleep", delays.append)
+    session = _mock_session(_mock_response(503, {"Retry-After": "2"}), _mock_response(200))
+
+    requester = CustomRequester(session=session, base_url="https://example.test")
+    response = requester.get("/movies/42", expected_status=200)
+
+    assert response.status_code == 200
+    assert delays == [2.0]
+    endpoint_stats = retry_stats.snapshot()["GET /movies/{movie_id}"]
+    assert endpoint_stats.reasons["HTTP 503"] >= 1
+
+
+def test_retry_budget_stops_retries_once_spent() -> None:
+    budget = RetryBudget(ratio=0.5, capacity=1)
+
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend()
@@ -0,0 +1,44 @@
+import pytest
+
+from tests.config import settings
+from tests.constants.endpoints import MOVIE_BY_ID_ENDPOINT, REVIEW_HIDE_ENDPOINT, REVIEWS_ENDPOINT, Service
+from tests.constants.timeouts import RequestTimeout, TimeoutProfile
+from tests.request.endpoint_templates import resolve_endpoint_template, resolve_request_timeout
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "expected"),
+    [
+        ("/movies/42", MOVIE_BY_ID_ENDPOINT),
+        ("/movies/42/reviews", REVIEWS_ENDPOINT),
+        ("/movies/42/reviews/hide/user-1", REVIEW_HIDE_ENDPOINT),
+        ("/genres", "/genres"),
+        ("/confirm/some-token", "/confirm/*"),
+    ],
+)
+def test_resolve_endpoint_template(endpoint: str, expected: str) -> None:
+    assert resolve_endpoint_template(endpoint) == expected
+
+
+def test_resolve_request_timeout_uses_endpoint_profiles(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "endpoint_timeouts", {"api GET /genres": (1.0, 2.0), "SLOW_WRITE": (5.0, 90.0)})
+
+    assert resolve_request_timeout(Service.API, "get", "/genres") == RequestTimeout(connect=1.0, read=2.0)
+    assert resolve_request_timeout(Service.API, "GET", "/movies/42") == TimeoutProfile.FAST_READ.value
+    assert resolve_request_timeout(Service.PAYMENT, "POST", "/create") == RequestTimeout(connect=5.0, read=90.0)
+    assert resolve_request_timeout(Service.PAYMENT, "POST", "/unknown") == TimeoutProfile.DEFAULT.value
+    assert resolve_request_timeout(Service.AUTH, "POST", "/login") == TimeoutProfile.AUTH.value
+
+
+def test_resolve_request_timeout_separates_services_with_same_paths() -> None:
+    assert resolve_request_timeout(Service.AUTH, "GET", "/user/42") == TimeoutProfile.FAST_READ.value
+    assert resolve_request_timeout(Service.PAYMENT, "GET", "/user/42") == TimeoutProfile.LIST_READ.value
+    assert resolve_request_timeout(Service.AUTH, "POST", "/create") == TimeoutProfile.DEFAULT.value
+
+
+def test_resolve_request_timeout_reads_overrides_on_every_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert resolve_request_timeout(Service.API, "GET", "/genres") == TimeoutProfile.FAST_READ.value
+
+    monkeypatch.setattr(settings, "endpoint_timeouts", {"FAST_READ": (1.0, 1.0)})
+
+    assert resolve_request_timeout(Service.API, "GET", "/genres") == RequestTimeout(connect=1.0, read=1.0)
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+
+from tests.request.metrics import (
+    RequestMetrics,
+    RequestSample,
+    bucket_latency,
+    build_latency_report,
+    latency_bucket,
+    percentile,
+)
+
+
+def _sample(endpoint: str, elapsed_ms: float, status: int | None = 200) -> RequestSample:
+    return RequestSample(
+        service="https://api.test",
+        method="GET",
+        endpoint=endpoint,
+        status=status,
+        elapsed_ms=elapsed_ms,
+        bytes_sent=0,
+        bytes_received=10,
+    )
+
+
+@pytest.mark.parametrize("elapsed_ms", [0.05, 1.0, 37.5, 480.0, 12_000.0])
+def test_latency_bucket_keeps_value_within_one_percent(elapsed_ms: float) -> None:
+    assert bucket_latency(latency_bucket(elapsed_ms)) == pytest.approx(elapsed_ms, rel=0.01)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    buckets: dict[int, int] = {}
+    for value in range(1, 101):
+        bucket = latency_bucket(float(value))
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+
+    assert percentile(buckets, 50) == pytest.approx(50, rel=0.01)
+    assert percentile(buckets, 95) == pytest.approx(95, rel=0.01)
+    assert percentile(buckets, 99) == pytest.approx(99, rel=0.01)
+    assert percentile({}, 50) == 0
+
+
+def test_build_latency_report_groups_by_endpoint_template() -> None:
+    metrics = RequestMetrics()
+    for ms in (10, 20, 30, 40):
+        metrics.record(_sample("/movies/{movie_id}", float(ms)))
+    metrics.record(_sample("/genres", 5, status=None))
+
+    report = {row["endpoint"]: row for row in build_latency_report(metrics.endpoints())}
+
+    movie_row = report["/movies/{movie_id}"]
+    assert movie_row["count"] == 4
+    assert movie_row["p50_ms"] == pytest.approx(20, rel=0.01)
+    assert movie_row["p99_ms"] <= movie_row["max_ms"] == 40
+    assert movie_row["bytes_received"] == 40
+    assert report["/genres"]["errors"] == 1
+
+
+def test_request_metrics_merges_worker_histograms_without_losing_samples(tmp_path: Path) -> None:
+    for index, ms in enumerate((10.0, 1000.0)):
+        worker = RequestMetrics()
+        for _ in range(3000):
+            worker.record(_sample("/genres", ms, status=503 if index else 200))
+        worker.dump(tmp_path / f"gw{index}.json")
+
+    main = RequestMetrics()
+    main.record(_sample("/genres", 5))
+    main.merge(RequestMetrics.load(sorted(tmp_path.glob("*.json"))))
+
+    [row] = build_latency_report(main.endpoints())
+    assert row["count"] == 6001
+    assert row["errors"] == 3000
+    assert row["p50_ms"] == pytest.approx(10, rel=0.01)
+    assert row["p95_ms"] == pytest.approx(1000, rel=0.01)
+    assert row["max_ms"] == 1000
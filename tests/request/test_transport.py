@@ -0,0 +1,65 @@
+import socket
+from collections.abc import Generator
+
+import pytest
+import requests
+
+from tests.clients.api_manager import ApiManager
+from tests.constants.endpoints import MOVIES_ENDPOINT
+from tests.fake_backend.app import FakeCinescopeBackend, service_base_urls
+from tests.models.movie_models import MovieWithReviews
+from tests.models.response_models import LoginResponse, MoviesList
+from tests.request.cassette import CassetteMatcher, CassetteMode, CassetteRecorder
+from tests.request.transport import RecordingTransport, ReplayTransport, WSGITransport
+
+_BASE_URLS = service_base_urls("http://cinescope.test")
+_NODE_ID = "tests/request/test_transport.py::test_replay"
+
+
+@pytest.fixture
+def backend() -> FakeCinescopeBackend:
+    return FakeCinescopeBackend()
+
+
+@pytest.fixture
+def session() -> Generator[requests.Session]:
+    with requests.Session() as session:
+        yield session
+
+
+def test_wsgi_transport_calls_app_without_sockets(backend, session, monkeypatch) -> None:
+    monkeypatch.setattr(socket, "create_connection", lambda *args, **kwargs: pytest.fail("Открыт сокет"))
+    manager = ApiManager(session, **_BASE_URLS, transport=WSGITransport(backend))
+
+    login = manager.auth_api.login(backend.admin_email, backend.admin_password)
+    assert isinstance(login, LoginResponse)
+    assert session.cookies.get("refreshToken")
+
+    refreshed = manager.auth_api.refresh_token()
+    assert isinstance(refreshed, dict) and refreshed["accessToken"]
+
+    movies = manager.movies_api.get_movies({"pageSize": 3})
+    assert isinstance(movies, MoviesList) and len(movies.movies) == 3
+    movie = manager.movies_api.get_movie_by_id(movies.movies[0].id)
+    assert isinstance(movie, MovieWithReviews)
+
+    manager.auth_api.logout()
+    assert session.cookies.get("refreshToken") is None
+
+
+def test_recorded_exchange_is_replayed_by_transport(backend, session, tmp_path) -> None:
+    matcher = CassetteMatcher(ignore_fields=[], ignore_patterns=[])
+    recorder = CassetteRecorder(CassetteMode.RECORD, tmp_path, matcher)
+    recorder.start_test(_NODE_ID)
+    live = ApiManager(session, **_BASE_URLS, transport=RecordingTransport(WSGITransport(backend), recorder))
+    recorded = live.movies_api.get(MOVIES_ENDPOINT, params={"pageSize": 2})
+    recorder.finish_test()
+
+    replayer = CassetteRecorder(CassetteMode.REPLAY, tmp_path, matcher)
+    replayer.start_test(_NODE_ID)
+    with requests.Session() as replay_session:
+        offline = ApiManager(replay_session, **_BASE_URLS, transport=ReplayTransport(replayer))
+        replayed = offline.movies_api.get(MOVIES_ENDPOINT, params={"pageSize": 2})
+
+    assert replayed.json() == recorded.json()
+    assert replayed.request.url == recorded.request.url
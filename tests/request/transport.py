@@ -0,0 +1,156 @@
+import io
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from typing import Any, Protocol
+from urllib.parse import unquote, urlsplit
+
+import requests
+from requests.cookies import remove_cookie_by_name
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from tests.request.cassette import CassetteMode, CassetteRecorder, cassette_recorder
+
+type WSGIApp = Callable[[dict[str, Any], Callable[..., Any]], Iterable[bytes]]
+
+
+@dataclass(slots=True, frozen=True)
+class TransportRequest:
+    method: str
+    url: str
+    base_url: str
+    endpoint_template: str
+    kwargs: dict[str, Any]
+
+
+class Transport(Protocol):
+    def send(self, session: requests.Session, request: TransportRequest) -> requests.Response: ...
+
+
+def prepare_request(session: requests.Session, request: TransportRequest) -> requests.PreparedRequest:
+    return session.prepare_request(
+        requests.Request(
+            request.method,
+            request.url,
+            headers=request.kwargs.get("headers"),
+            params=request.kwargs.get("params"),
+            data=request.kwargs.get("data"),
+            json=request.kwargs.get("json"),
+        )
+    )
+
+
+class RequestsTransport:
+    def send(self, session: requests.Session, request: TransportRequest) -> requests.Response:
+        return session.request(request.method, request.url, **request.kwargs)
+
+
+class WSGITransport:
+    def __init__(self, app: WSGIApp):
+        self.app = app
+
+    def _environ(self, prepared: requests.PreparedRequest) -> dict[str, Any]:
+        url = urlsplit(prepared.url or "")
+        body = prepared.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        environ: dict[str, Any] = {
+            "REQUEST_METHOD": prepared.method,
+            "PATH_INFO": unquote(url.path, encoding="latin-1"),
+            "QUERY_STRING": url.query,
+            "SERVER_NAME": url.hostname or "localhost",
+            "SERVER_PORT": str(url.port or (443 if url.scheme == "https" else 80)),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "CONTENT_TYPE": prepared.headers.get("Content-Type", ""),
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": url.scheme,
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in prepared.headers.items():
+            if name.lower() not in {"content-type", "content-length"}:
+                environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+        return environ
+
+    def _store_cookies(self, session: requests.Session, host: str, set_cookie_headers: list[str]) -> None:
+        for header in set_cookie_headers:
+            for name, morsel in SimpleCookie(header).items():
+                path = morsel["path"] or "/"
+                if morsel["max-age"] == "0":
+                    remove_cookie_by_name(session.cookies, name, domain=host, path=path)
+                else:
+                    session.cookies.set(name, morsel.value, domain=host, path=path)
+
+    def send(self, session: requests.Session, request: TransportRequest) -> requests.Response:
+        prepared = prepare_request(session, request)
+        status_line: list[str] = []
+        raw_headers: list[tuple[str, str]] = []
+
+        def start_response(status: str, headers: list[tuple[str, str]], exc_info: Any = None) -> None:
+            status_line.append(status)
+            raw_headers.extend(headers)
+
+        chunks = self.app(self._environ(prepared), start_response)
+        try:
+            content = b"".join(chunks)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+        headers: CaseInsensitiveDict[str] = CaseInsensitiveDict()
+        for name, value in raw_headers:
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        self._store_cookies(
+            session,
+            urlsplit(prepared.url or "").hostname or "",
+            [value for name, value in raw_headers if name.lower() == "set-cookie"],
+        )
+
+        code, _, reason = status_line[0].partition(" ")
+        response = requests.Response()
+        response.status_code = int(code)
+        response.reason = reason
+        response.headers = headers
+        response._content = content
+        response.encoding = get_encoding_from_headers(headers)
+        response.url = prepared.url or request.url
+        response.request = prepared
+        return response
+
+
+class RecordingTransport:
+    def __init__(self, inner: Transport, recorder: CassetteRecorder):
+        self.inner = inner
+        self.recorder = recorder
+
+    def send(self, session: requests.Session, request: TransportRequest) -> requests.Response:
+        response = self.inner.send(session, request)
+        key = self.recorder.key_for(request.base_url, request.method, request.endpoint_template, request.kwargs)
+        self.recorder.record(key, response)
+        return response
+
+
+class ReplayTransport:
+    def __init__(self, recorder: CassetteRecorder):
+        self.recorder = recorder
+
+    def send(self, session: requests.Session, request: TransportRequest) -> requests.Response:
+        key = self.recorder.key_for(request.base_url, request.method, request.endpoint_template, request.kwargs)
+        response = self.recorder.replay(key, request.url)
+        response.request = prepare_request(session, request)
+        return response
+
+
+def default_transport() -> Transport:
+    if cassette_recorder.mode is CassetteMode.REPLAY:
+        return ReplayTransport(cassette_recorder)
+    if cassette_recorder.mode is CassetteMode.RECORD:
+        return RecordingTransport(RequestsTransport(), cassette_recorder)
+    return RequestsTransport()
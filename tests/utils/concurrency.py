@@ -0,0 +1,53 @@
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+class RateLimiter:
+    def __init__(self, per_second: float):
+        self.interval = 1 / per_second if per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass(slots=True, frozen=True)
+class BatchResult[ItemT, ResultT]:
+    item: ItemT
+    result: ResultT | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_batch[ItemT, ResultT](
+    func: Callable[[ItemT], ResultT],
+    items: Iterable[ItemT],
+    concurrency: int,
+    rate_limiter: RateLimiter | None = None,
+) -> list[BatchResult[ItemT, ResultT]]:
+    def run(item: ItemT) -> BatchResult[ItemT, ResultT]:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return BatchResult(item, result=func(item))
+        except Exception as exc:
+            return BatchResult(item, error=exc)
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="batch") as executor:
+        futures = [executor.submit(contextvars.copy_context().run, run, item) for item in items]
+        return [future.result() for future in futures]
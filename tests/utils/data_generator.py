@@ -1,8 +1,6 @@
 import logging
 import re
-import secrets
 from typing import Any
-from uuid import uuid4
 
 from faker import Faker
 
@@ -11,6 +9,10 @@
 
 logger = logging.getLogger(__name__)
 
+AUTOTEST_EMAIL_PREFIX = "autotest-"
+AUTOTEST_EMAIL_DOMAIN = "@gmail.com"
+AUTOTEST_MOVIE_TAG = "[autotest]"
+
 
 class MovieDataGenerator:
     LOCATION = [Location.MSK, Location.SPB]
@@ -21,33 +23,33 @@ def generate_random_title(faker: Faker):
 
     @staticmethod
     def generate_random_description(faker: Faker, max_nb_chars=50):
-        return faker.text(max_nb_chars=max_nb_chars)
+        return f"{faker.text(max_nb_chars=max_nb_chars)} {AUTOTEST_MOVIE_TAG}"
 
     @staticmethod
-    def generate_random_price(min_price=100, max_price=1000):
-        return min_price + secrets.randbelow(max_price - min_price + 1)
+    def generate_random_price(faker: Faker, min_price=100, max_price=1000):
+        return faker.random_int(min_price, max_price)
 
     @staticmethod
-    def generate_random_location():
-        return secrets.choice(MovieDataGenerator.LOCATION)
+    def generate_random_location(faker: Faker):
+        return faker.random_element(MovieDataGenerator.LOCATION)
 
     @staticmethod
-    def generate_random_genre() -> GenreId:
-        return secrets.choice(list(GenreId))
+    def generate_random_genre(faker: Faker) -> GenreId:
+        return faker.random_element(list(GenreId))
 
     @staticmethod
-    def generate_random_published():
-        return secrets.choice([True, False])
+    def generate_random_published(faker: Faker):
+        return faker.pybool()
 
     @staticmethod
     def generate_valid_movie_payload(faker: Faker) -> MovieCreate:
         payload = MovieCreate(
             name=MovieDataGenerator.generate_random_title(faker),
             description=MovieDataGenerator.generate_random_description(faker),
-            price=MovieDataGenerator.generate_random_price(),
-            location=MovieDataGenerator.generate_random_location(),
-            genreId=MovieDataGenerator.generate_random_genre(),
-            published=MovieDataGenerator.generate_random_published(),
+            price=MovieDataGenerator.generate_random_price(faker),
+            location=MovieDataGenerator.generate_random_location(faker),
+            genreId=MovieDataGenerator.generate_random_genre(faker),
+            published=MovieDataGenerator.generate_random_published(faker),
         )
         logger.debug(f"Сгенерированы данные для создания фильма: {payload.model_dump_json(indent=2)}")
         return payload
@@ -81,7 +83,7 @@ def generate_user_payload(faker: Faker) -> tuple[UserCreate, str]:
 
     @staticmethod
     def generate_random_email(faker: Faker):
-        return f"autotest-{uuid4().hex[:12]}@gmail.com"
+        return f"{AUTOTEST_EMAIL_PREFIX}{faker.hexify('^' * 12)}{AUTOTEST_EMAIL_DOMAIN}"
 
     @staticmethod
     def generate_random_name(faker: Faker):
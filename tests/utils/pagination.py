@@ -0,0 +1,44 @@
+from collections import deque
+from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Protocol
+
+
+class Page(Protocol):
+    page_count: int
+
+
+def iter_pages_prefetched[PageT: Page](
+    fetch: Callable[[int], PageT],
+    start_page: int = 1,
+    max_pages: int | None = None,
+    prefetch: int = 1,
+    workers: int = 1,
+) -> Generator[PageT]:
+    first = fetch(start_page)
+    last_page = first.page_count if max_pages is None else min(first.page_count, start_page + max_pages - 1)
+    if last_page <= start_page or prefetch < 1:
+        yield first
+        for page in range(start_page + 1, last_page + 1):
+            yield fetch(page)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(workers, prefetch)), thread_name_prefix="page-prefetch")
+    pending: deque[Future[PageT]] = deque()
+    next_page = start_page + 1
+
+    def schedule() -> None:
+        nonlocal next_page
+        while next_page <= last_page and len(pending) < prefetch:
+            pending.append(executor.submit(fetch, next_page))
+            next_page += 1
+
+    try:
+        schedule()
+        yield first
+        while pending:
+            current = pending.popleft().result()
+            schedule()
+            yield current
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
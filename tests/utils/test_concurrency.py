@@ -0,0 +1,17 @@
+import time
+
+from tests.utils.concurrency import RateLimiter, run_batch
+
+
+def test_run_batch_keeps_order_collects_errors_and_respects_rate_limit() -> None:
+    def invert(value: int) -> float:
+        return 1 / value
+
+    started = time.monotonic()
+    results = run_batch(invert, [1, 0, 2, 4], concurrency=4, rate_limiter=RateLimiter(per_second=50))
+    elapsed = time.monotonic() - started
+
+    assert [result.item for result in results] == [1, 0, 2, 4]
+    assert [result.result for result in results] == [1.0, None, 0.5, 0.25]
+    assert isinstance(results[1].error, ZeroDivisionError)
+    assert elapsed >= 3 / 50
@@ -0,0 +1,51 @@
+import time
+from dataclasses import dataclass
+
+from tests.utils.pagination import iter_pages_prefetched
+
+
+@dataclass
+class _Page:
+    page: int
+    page_count: int
+
+
+def _wait_for(condition, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_next_page_is_prefetched_while_current_is_consumed() -> None:
+    fetched: list[int] = []
+    consumed: list[int] = []
+
+    def fetch(page: int) -> _Page:
+        fetched.append(page)
+        return _Page(page=page, page_count=6)
+
+    for page in iter_pages_prefetched(fetch, max_pages=5, prefetch=2):
+        consumed.append(page.page)
+        if page.page < 5:
+            assert _wait_for(lambda page=page: page.page + 1 in fetched)
+        assert len(fetched) - len(consumed) <= 2
+
+    assert consumed == fetched == [1, 2, 3, 4, 5]
+
+
+def test_closing_iterator_stops_fetching() -> None:
+    fetched: list[int] = []
+
+    def fetch(page: int) -> _Page:
+        fetched.append(page)
+        return _Page(page=page, page_count=100)
+
+    pages = iter_pages_prefetched(fetch)
+    assert next(pages).page == 1
+    assert next(pages).page == 2
+    pages.close()
+
+    assert fetched in ([1, 2], [1, 2, 3])